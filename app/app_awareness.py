@@ -5,15 +5,23 @@ Monitors running processes to detect video conferencing applications
 (Zoom, Teams, Google Meet, Skype, Discord) and auto-pauses presence detection
 to prevent false locks during calls.
 
+poll() runs one check and fires the events; the monitor thread just calls
+it every check_interval_seconds, and a simulation can call it on its own
+clock with a scripted process_names() instead of a real process scan.
+
 Cost: Negligible (~1% CPU, only process list scan)
 Benefit: No false locks during presentations or video calls
 """
 
-import psutil
 from typing import Set, Callable, Optional
 import threading
 import time
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 
 class AppAwarenessService:
     """
@@ -40,8 +48,15 @@ class AppAwarenessService:
         "bluestacks.exe",
     }
     
-    def __init__(self):
-        """Initialize the App Awareness service."""
+    def __init__(self, process_names: Optional[Callable[[], Set[str]]] = None):
+        """
+        Initialize the App Awareness service.
+
+        Args:
+            process_names: Returns the lower-case names of running processes
+                (default: a psutil scan)
+        """
+        self._process_names = process_names or self._scan_process_names
         self.is_running = False
         self.is_enabled = True
         self.check_interval_seconds = 5  # Check every 5 seconds
@@ -87,22 +102,37 @@ class AppAwarenessService:
         """Background thread that monitors for meeting apps."""
         while self.is_running:
             try:
-                is_meeting = self._check_for_meeting_apps()
-                
-                # Fire events on state change
-                if is_meeting and not self._currently_meeting:
-                    self._currently_meeting = True
-                    self._trigger_meeting_started()
-                
-                elif not is_meeting and self._currently_meeting:
-                    self._currently_meeting = False
-                    self._trigger_meeting_stopped()
-                
+                self.poll()
                 time.sleep(self.check_interval_seconds)
             
             except Exception as e:
                 print(f"[AppAwareness] Error in monitor loop: {e}")
                 time.sleep(self.check_interval_seconds)
+
+    def poll(self) -> bool:
+        """
+        Check once and fire meeting started/stopped on a change.
+
+        Returns:
+            bool: True if a meeting app is running
+        """
+        is_meeting = self._check_for_meeting_apps()
+        
+        # Fire events on state change
+        if is_meeting and not self._currently_meeting:
+            self._currently_meeting = True
+            self._trigger_meeting_started()
+        
+        elif not is_meeting and self._currently_meeting:
+            self._currently_meeting = False
+            self._trigger_meeting_stopped()
+        return is_meeting
+
+    @staticmethod
+    def _scan_process_names() -> Set[str]:
+        if psutil is None:
+            return set()
+        return {p.name().lower() for p in psutil.process_iter(['name'])}
     
     def _check_for_meeting_apps(self) -> bool:
         """
@@ -112,7 +142,7 @@ class AppAwarenessService:
             bool: True if meeting app detected
         """
         try:
-            running_processes = {p.name().lower() for p in psutil.process_iter(['name'])}
+            running_processes = self._process_names()
             
             for app in self.MEETING_APPS:
                 if app.lower() in running_processes:
@@ -0,0 +1,253 @@
+"""
+Camera Array - Multi-camera presence fusion with a shared analysis pool
+
+Runs one GlazedSensor per camera (e.g. laptop + external monitor). Each
+sensor keeps its own capture thread and adaptive FPS, so a camera facing an
+empty corridor idles at 1 FPS while the one facing the user runs at full
+rate. Frame analysis for all cameras goes through one shared worker pool,
+which bounds total CPU regardless of how many cameras are attached.
+
+The array exposes the same surface as a single GlazedSensor (motion_confidence,
+calibration_mode, pz_reach, pause/resume/stop), so PresenceEngine and the UI
+consume the fused value without knowing how many cameras there are.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+from frame_sources import FrameSource
+from glazed_sensor import GlazedSensor, STOP_JOIN_SECONDS
+
+
+class CameraArray:
+    """
+    Several GlazedSensors fused into one presence signal.
+
+    The first camera is the primary: its preview frames and depth score go to
+    the UI. Secondary cameras contribute motion only.
+
+    Attributes:
+        camera_indices (list): Device indices, primary first
+        sensors (list): One GlazedSensor per camera
+    """
+
+    def __init__(self, callback: Callable, camera_indices: Sequence[int],
+                 pool_workers: Optional[int] = None, sensor_factory: Callable = GlazedSensor,
+                 source_factory: Optional[Callable[[int], FrameSource]] = None):
+        """
+        Initialize the camera array.
+
+        Args:
+            callback: Same signature as the GlazedSensor callback
+                (frame, motion, proximity, error=None)
+            camera_indices: Device indices to open, primary first
+            pool_workers: Shared analysis threads (default: one per camera, capped at CPU count)
+            sensor_factory: Sensor constructor taking (callback, camera_index=...,
+                frame_source=..., analysis_pool=...)
+            source_factory: Builds the FrameSource for a camera index (default:
+                the sensor's own CameraFrameSource)
+        """
+        if not camera_indices:
+            raise ValueError("CameraArray needs at least one camera index")
+        self.callback = callback
+        self.camera_indices = list(camera_indices)
+        workers = pool_workers or min(len(self.camera_indices), os.cpu_count() or 1)
+        # OpenCV releases the GIL inside its kernels, so threads scale across cores
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="GlazedAnalysis")
+        self._failed: Dict[int, bool] = {}
+        self._primary_proximity = 0
+
+        self.sensors: List[GlazedSensor] = []
+        for position, index in enumerate(self.camera_indices):
+            sensor = sensor_factory(
+                self._make_camera_callback(position, index),
+                camera_index=index,
+                frame_source=source_factory(index) if source_factory else None,
+                analysis_pool=self._pool
+            )
+            self.sensors.append(sensor)
+
+    def _make_camera_callback(self, position: int, index: int) -> Callable:
+        """Build the per-camera callback that forwards into the shared UI callback."""
+        is_primary = position == 0
+
+        def on_camera_data(frame, motion, proximity, error=None):
+            if error:
+                self._failed[index] = True
+                print(f"[CameraArray] Camera {index}: {error}")
+                if all(self._failed.get(i) for i in self.camera_indices):
+                    self.callback(None, False, 0, error)
+                return
+            if is_primary:
+                self._primary_proximity = proximity
+                self.callback(frame, motion, proximity)
+            elif motion:
+                # Secondary cameras only report that someone is there; the depth
+                # score shown in the UI stays the primary camera's
+                self.callback(None, True, self._primary_proximity)
+
+        return on_camera_data
+
+    @property
+    def motion_confidence(self) -> float:
+        """
+        Fused motion confidence (0.0-1.0) across all cameras.
+
+        Uses the maximum: presence seen by any camera is presence. Unlike a
+        noisy-OR this keeps the single-camera scale, so idle cameras (0.1 each)
+        never add up past the engine's presence threshold.
+        """
+        return max(getattr(sensor, "motion_confidence", 0.0) for sensor in self.sensors)
+
+    @property
+    def motion_histories(self) -> list:
+        """Each camera's MotionHistory, for windowed queries across the array."""
+        return [sensor.motion_history for sensor in self.sensors]
+
+    @property
+    def zones(self):
+        return self.sensors[0].zones
+
+    @zones.setter
+    def zones(self, value):
+        # Zones are drawn over one camera's view, so they apply to the primary only
+        self.sensors[0].zones = value
+
+    @property
+    def fps_controller(self):
+        return self.sensors[0].fps_controller
+
+    @fps_controller.setter
+    def fps_controller(self, value):
+        # Each camera keeps its own rate and duty-cycle totals
+        for sensor in self.sensors:
+            sensor.fps_controller = value.clone()
+
+    @property
+    def calibration_mode(self) -> bool:
+        return self.sensors[0].calibration_mode
+
+    @calibration_mode.setter
+    def calibration_mode(self, value: bool):
+        for sensor in self.sensors:
+            sensor.calibration_mode = value
+
+    def _broadcast(self, name: str, value) -> None:
+        for sensor in self.sensors:
+            setattr(sensor, name, value)
+
+    @property
+    def illumination_compensation(self) -> bool:
+        return self.sensors[0].illumination_compensation
+
+    @illumination_compensation.setter
+    def illumination_compensation(self, value: bool):
+        self._broadcast("illumination_compensation", value)
+
+    @property
+    def release_on_pause_seconds(self) -> float:
+        return self.sensors[0].release_on_pause_seconds
+
+    @release_on_pause_seconds.setter
+    def release_on_pause_seconds(self, value: float):
+        self._broadcast("release_on_pause_seconds", value)
+
+    @property
+    def pz_reach(self) -> float:
+        return self.sensors[0].pz_reach
+
+    @pz_reach.setter
+    def pz_reach(self, value: float):
+        self._broadcast("pz_reach", value)
+
+    @property
+    def proximity_min(self) -> int:
+        return self.sensors[0].proximity_min
+
+    @proximity_min.setter
+    def proximity_min(self, value: int):
+        self._broadcast("proximity_min", value)
+
+    @property
+    def sensitivity(self) -> int:
+        return self.sensors[0].sensitivity
+
+    @sensitivity.setter
+    def sensitivity(self, value: int):
+        self._broadcast("sensitivity", value)
+
+    @property
+    def background_model(self) -> str:
+        return self.sensors[0].background_model
+
+    @background_model.setter
+    def background_model(self, value: str):
+        self._broadcast("background_model", value)
+
+    @property
+    def learning_rate(self) -> float:
+        return self.sensors[0].learning_rate
+
+    @learning_rate.setter
+    def learning_rate(self, value: float):
+        self._broadcast("learning_rate", value)
+
+    def start(self):
+        """Start every camera's capture thread."""
+        for sensor in self.sensors:
+            sensor.start()
+
+    def stop(self):
+        """Stop all cameras and shut down the shared pool."""
+        # Signal every camera first so they wind down in parallel, then wait
+        for sensor in self.sensors:
+            sensor.stop(timeout=0)
+        for sensor in self.sensors:
+            if sensor.is_alive():
+                sensor.join(STOP_JOIN_SECONDS)
+        self._pool.shutdown(wait=False)
+
+    def pause(self):
+        """Pause all cameras."""
+        for sensor in self.sensors:
+            sensor.pause()
+
+    def resume(self):
+        """Resume all cameras."""
+        for sensor in self.sensors:
+            sensor.resume()
+
+    def power_down(self):
+        """Close every camera (PresenceEngine's on-demand capture)."""
+        for sensor in self.sensors:
+            sensor.power_down()
+
+    def power_up(self):
+        """Reopen every camera."""
+        for sensor in self.sensors:
+            sensor.power_up()
+
+    @property
+    def powered(self) -> bool:
+        return self.sensors[0].powered
+
+    @property
+    def wake_latency_seconds(self) -> Optional[float]:
+        """Slowest camera's power-up-to-first-frame time (all must be ready)."""
+        latencies = [s.wake_latency_seconds for s in self.sensors if s.wake_latency_seconds is not None]
+        return max(latencies) if latencies else None
+
+    def get_stats(self) -> List[dict]:
+        """
+        Per-camera throughput stats, each with its current adaptive FPS.
+
+        Returns:
+            list: GlazedSensor.get_stats() per camera plus "target_fps"
+        """
+        stats = []
+        for sensor in self.sensors:
+            entry = sensor.get_stats()
+            entry["target_fps"] = sensor.target_fps
+            stats.append(entry)
+        return stats
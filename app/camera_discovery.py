@@ -0,0 +1,411 @@
+"""
+Camera Discovery - Device enumeration and cached open parameters
+
+Opening a webcam used to mean probing backends in order (DSHOW then MSMF on
+Windows), setting the size and reading a test frame until one combination
+worked, on every start and every camera switch. This module removes both
+costs:
+
+- discover_cameras() lists real capture devices, and CameraDiscovery runs it
+  on a background thread so the UI selector fills in without blocking
+  startup. Linux reads /sys/class/video4linux, Windows enumerates DirectShow
+  video inputs (the order OpenCV's CAP_DSHOW indices follow), macOS lists
+  AVFoundation cameras through system_profiler. Where none of that works,
+  each index is opened with a short timeout and only the ones that respond
+  are listed.
+- CameraParamCache persists the backend, index, resolution and pixel format
+  that last worked for each device, so the next open tries that combination
+  first and usually succeeds on the first attempt.
+
+Cost: One small JSON file next to the license file
+Benefit: Camera switches and restarts skip the backend probe
+"""
+
+import ctypes
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import cv2
+
+
+SYSFS_VIDEO4LINUX = "/sys/class/video4linux"
+FALLBACK_CAMERA_COUNT = 4       # Placeholders when even probing fails
+PROBE_INDEX_COUNT = 8           # Indices tried by the open probe
+PROBE_TIMEOUT_SECONDS = 3.0     # Budget for all probes (they run in parallel)
+SYSTEM_PROFILER_TIMEOUT_SECONDS = 10.0
+
+# DirectShow (COM) identifiers
+CLSID_SYSTEM_DEVICE_ENUM = "{62BE5D10-60EB-11D0-BD3B-00A0C911CE86}"
+IID_ICREATE_DEV_ENUM = "{29840822-5B84-11D0-BD3B-00A0C911CE86}"
+CLSID_VIDEO_INPUT_DEVICE_CATEGORY = "{860BB310-5D01-11D0-BD3B-00A0C911CE86}"
+IID_IPROPERTY_BAG = "{55272A00-42CB-11CE-8135-00AA004BB851}"
+CLSCTX_INPROC_SERVER = 1
+COINIT_MULTITHREADED = 0
+VT_BSTR = 8
+
+
+@dataclass
+class CameraDevice:
+    """A capture device as shown in the selector."""
+    index: int
+    name: str
+    device_key: str
+
+    @property
+    def label(self) -> str:
+        return f"{self.index}: {self.name}"
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _discover_video4linux(root: str) -> List[CameraDevice]:
+    """
+    List V4L2 capture nodes from sysfs without opening them.
+
+    UVC cameras expose several nodes per device (capture plus metadata); only
+    the node with index 0 delivers frames. The device key is the resolved
+    sysfs device path, which stays the same across reboots for a given port.
+    """
+    devices = []
+    try:
+        entries = os.listdir(root)
+    except OSError:
+        return devices
+
+    for entry in entries:
+        if not entry.startswith("video") or not entry[5:].isdigit():
+            continue
+        node = os.path.join(root, entry)
+        if _read_sysfs(os.path.join(node, "index")) not in (None, "0"):
+            continue  # Metadata node of a device already listed
+        name = _read_sysfs(os.path.join(node, "name")) or entry
+        device_path = os.path.realpath(os.path.join(node, "device"))
+        devices.append(CameraDevice(index=int(entry[5:]), name=name, device_key=f"v4l:{device_path}"))
+
+    devices.sort(key=lambda device: device.index)
+    return devices
+
+
+class _GUID(ctypes.Structure):
+    _fields_ = [("Data1", ctypes.c_uint32), ("Data2", ctypes.c_uint16),
+                ("Data3", ctypes.c_uint16), ("Data4", ctypes.c_ubyte * 8)]
+
+
+class _VARIANT(ctypes.Structure):
+    # vt + reserved words, then the 8/16-byte value union (BSTR is its first pointer)
+    _fields_ = [("vt", ctypes.c_ushort), ("reserved", ctypes.c_ushort * 3),
+                ("value", ctypes.c_void_p), ("extra", ctypes.c_void_p)]
+
+
+def _guid(text: str) -> _GUID:
+    guid = _GUID()
+    ctypes.windll.ole32.CLSIDFromString(ctypes.c_wchar_p(text), ctypes.byref(guid))
+    return guid
+
+
+def _com_method(obj: ctypes.c_void_p, index: int, *argtypes):
+    """Bind vtable slot index of a COM interface pointer (returns the raw HRESULT)."""
+    vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    prototype = ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p, *argtypes)
+    method = prototype(vtable[index])
+    return lambda *args: method(obj, *args)
+
+
+def _com_release(obj: ctypes.c_void_p) -> None:
+    if obj:
+        _com_method(obj, 2)()  # IUnknown::Release
+
+
+def _read_property(bag: ctypes.c_void_p, name: str) -> Optional[str]:
+    """IPropertyBag::Read of a string property, None if missing."""
+    value = _VARIANT()
+    read = _com_method(bag, 3, ctypes.c_wchar_p, ctypes.POINTER(_VARIANT), ctypes.c_void_p)
+    if read(name, ctypes.byref(value), None) < 0:
+        return None
+    try:
+        return ctypes.wstring_at(value.value) if value.vt == VT_BSTR and value.value else None
+    finally:
+        ctypes.windll.oleaut32.VariantClear(ctypes.byref(value))
+
+
+def _directshow_cameras() -> List[Tuple[str, str]]:
+    """
+    (friendly name, device path) of each DirectShow video input.
+
+    The system device enumerator yields them in the order OpenCV's CAP_DSHOW
+    backend numbers them, so list position == camera index (CameraFrameSource
+    opens "dshow:" devices with that backend only). The device path
+    (USB VID/PID and port) is empty for some virtual cameras.
+    """
+    ole32 = ctypes.windll.ole32
+    initialized = ole32.CoInitializeEx(None, COINIT_MULTITHREADED) >= 0
+    cameras = []
+    dev_enum, monikers = ctypes.c_void_p(), ctypes.c_void_p()
+    try:
+        if ole32.CoCreateInstance(ctypes.byref(_guid(CLSID_SYSTEM_DEVICE_ENUM)), None, CLSCTX_INPROC_SERVER,
+                                  ctypes.byref(_guid(IID_ICREATE_DEV_ENUM)), ctypes.byref(dev_enum)) < 0:
+            return cameras
+        create_enumerator = _com_method(dev_enum, 3, ctypes.POINTER(_GUID), ctypes.POINTER(ctypes.c_void_p),
+                                        ctypes.c_uint32)
+        if create_enumerator(ctypes.byref(_guid(CLSID_VIDEO_INPUT_DEVICE_CATEGORY)),
+                             ctypes.byref(monikers), 0) != 0:
+            return cameras  # S_FALSE: the category is empty
+        next_moniker = _com_method(monikers, 3, ctypes.c_uint32, ctypes.POINTER(ctypes.c_void_p),
+                                   ctypes.POINTER(ctypes.c_uint32))
+        iid_property_bag = _guid(IID_IPROPERTY_BAG)
+        while True:
+            moniker, fetched = ctypes.c_void_p(), ctypes.c_uint32()
+            if next_moniker(1, ctypes.byref(moniker), ctypes.byref(fetched)) != 0 or fetched.value != 1:
+                break
+            bag = ctypes.c_void_p()
+            # IMoniker::BindToStorage (IUnknown 0-2, IPersist 3, IPersistStream 4-7, BindToObject 8)
+            bind_to_storage = _com_method(moniker, 9, ctypes.c_void_p, ctypes.c_void_p, ctypes.POINTER(_GUID),
+                                          ctypes.POINTER(ctypes.c_void_p))
+            name, path = None, None
+            if bind_to_storage(None, None, ctypes.byref(iid_property_bag), ctypes.byref(bag)) >= 0:
+                name = _read_property(bag, "FriendlyName")
+                path = _read_property(bag, "DevicePath")
+                _com_release(bag)
+            _com_release(moniker)
+            cameras.append((name or f"Camera {len(cameras)}", path or ""))
+    finally:
+        _com_release(monikers)
+        _com_release(dev_enum)
+        if initialized:
+            ole32.CoUninitialize()
+    return cameras
+
+
+def _discover_directshow() -> List[CameraDevice]:
+    devices = []
+    for index, (name, path) in enumerate(_directshow_cameras()):
+        key = f"dshow:{path}" if path else f"dshow:{name}#{index}"
+        devices.append(CameraDevice(index=index, name=name, device_key=key))
+    return devices
+
+
+def _discover_avfoundation() -> List[CameraDevice]:
+    """
+    AVFoundation cameras from system_profiler, without opening them.
+
+    OpenCV's CAP_AVFOUNDATION backend numbers devices sorted by unique ID,
+    so the same sort gives each camera its index.
+    """
+    try:
+        output = subprocess.run(["system_profiler", "SPCameraDataType", "-json"], capture_output=True,
+                                text=True, timeout=SYSTEM_PROFILER_TIMEOUT_SECONDS, check=False).stdout
+        cameras = json.loads(output).get("SPCameraDataType", [])
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return []
+    cameras = [c for c in cameras if c.get("spcamera_unique-id")]
+    cameras.sort(key=lambda camera: camera["spcamera_unique-id"])
+    return [CameraDevice(index=i, name=c.get("_name") or f"Camera {i}", device_key=f"avf:{c['spcamera_unique-id']}")
+            for i, c in enumerate(cameras)]
+
+
+def _probe_backend() -> int:
+    if sys.platform.startswith("win"):
+        return cv2.CAP_DSHOW
+    if sys.platform == "darwin":
+        return cv2.CAP_AVFOUNDATION
+    return cv2.CAP_ANY
+
+
+def _probe_cameras(in_use: Iterable[int] = ()) -> List[CameraDevice]:
+    """
+    List the indices that open within PROBE_TIMEOUT_SECONDS.
+
+    Every index is opened on its own daemon thread, so a driver that hangs
+    in open() costs the timeout once and is simply left out. Indices in
+    in_use (the app's own open camera, which may refuse a second open) are
+    listed without probing.
+    """
+    found = set(in_use)
+    lock = threading.Lock()
+    backend = _probe_backend()
+
+    def probe(index: int) -> None:
+        cap = cv2.VideoCapture(index, backend)
+        try:
+            if cap.isOpened():
+                with lock:
+                    found.add(index)
+        finally:
+            cap.release()
+
+    threads = [threading.Thread(target=probe, args=(index,), daemon=True, name=f"CameraProbe{index}")
+               for index in range(PROBE_INDEX_COUNT) if index not in found]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + PROBE_TIMEOUT_SECONDS
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    with lock:
+        indices = sorted(found)
+    return [CameraDevice(index=i, name=f"Camera {i}", device_key=f"index:{i}") for i in indices]
+
+
+def _placeholder_cameras() -> List[CameraDevice]:
+    return [CameraDevice(index=i, name=f"Camera {i}", device_key=f"index:{i}")
+            for i in range(FALLBACK_CAMERA_COUNT)]
+
+
+def discover_cameras(sysfs_root: str = SYSFS_VIDEO4LINUX, in_use: Iterable[int] = ()) -> List[CameraDevice]:
+    """
+    Enumerate capture devices.
+
+    Uses the platform's device list (sysfs, DirectShow, AVFoundation); if it
+    is unavailable or empty, probes indices with a short-timeout open. Only
+    if nothing responds does the selector get the old fixed index list.
+    Blocks for up to PROBE_TIMEOUT_SECONDS; run it off the UI thread.
+
+    Args:
+        sysfs_root: video4linux class directory (overridable for tests)
+        in_use: Camera indices the app has open (never probed)
+
+    Returns:
+        list: CameraDevice entries ordered by index
+    """
+    devices = []
+    try:
+        if sys.platform.startswith("linux"):
+            devices = _discover_video4linux(sysfs_root)
+        elif sys.platform.startswith("win"):
+            devices = _discover_directshow()
+        elif sys.platform == "darwin":
+            devices = _discover_avfoundation()
+    except Exception as e:
+        print(f"[CameraDiscovery] Device list unavailable, probing instead: {e}")
+    if not devices:
+        devices = _probe_cameras(in_use)
+    return devices or _placeholder_cameras()
+
+
+class CameraDiscovery:
+    """
+    Runs discover_cameras() on a background thread.
+
+    Attributes:
+        devices (list): Last discovered devices (empty until the first scan finishes)
+    """
+
+    def __init__(self, sysfs_root: str = SYSFS_VIDEO4LINUX):
+        self.sysfs_root = sysfs_root
+        self.devices: List[CameraDevice] = []
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, on_done: Callable[[List[CameraDevice]], None], in_use: Iterable[int] = ()) -> None:
+        """
+        Scan in the background and hand the result to on_done.
+
+        on_done runs on the discovery thread; UI callers should marshal it
+        onto their own thread (App queues it for update_loop).
+
+        Args:
+            on_done: Receives the device list
+            in_use: Camera indices the app has open (see discover_cameras)
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        in_use = tuple(in_use)
+
+        def scan():
+            try:
+                self.devices = discover_cameras(self.sysfs_root, in_use)
+            except Exception as e:
+                print(f"[CameraDiscovery] Scan failed: {e}")
+                self.devices = _placeholder_cameras()
+            print(f"[CameraDiscovery] Found {len(self.devices)} camera(s)")
+            on_done(self.devices)
+
+        self._thread = threading.Thread(target=scan, daemon=True, name="CameraDiscovery")
+        self._thread.start()
+
+
+def fourcc_to_str(value: float) -> str:
+    """Decode CAP_PROP_FOURCC into its four-character code ('' if unset)."""
+    code = int(value)
+    text = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+    return text if code and text.isprintable() else ""
+
+
+class CameraParamCache:
+    """
+    Persisted open parameters per camera device.
+
+    Each entry records what last opened successfully: backend (cv2 CAP_*
+    constant), index, width, height and fourcc. The file lives next to the
+    license data in the user's application data directory.
+
+    Attributes:
+        path (Path): JSON file backing the cache
+        last_device (str): Device key of the camera used most recently
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else self._default_cache_path()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+        self.last_device: Optional[str] = None
+        self._load()
+
+    def _default_cache_path(self) -> Path:
+        appdata = os.getenv("APPDATA") or os.path.expanduser("~")
+        return Path(appdata) / "PZDetector" / "camera_cache.json"
+
+    def _load(self) -> None:
+        try:
+            if self.path.exists():
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                self._entries = dict(data.get("devices", {}))
+                self.last_device = data.get("lastDevice")
+        except Exception as e:
+            print(f"[CameraCache] Failed to load {self.path}: {e}")
+            self._entries = {}
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump({"lastDevice": self.last_device, "devices": self._entries}, f, indent=2)
+        except Exception as e:
+            print(f"[CameraCache] Failed to save {self.path}: {e}")
+
+    def get(self, device_key: str) -> Optional[dict]:
+        """Return the cached parameters for a device, or None."""
+        with self._lock:
+            entry = self._entries.get(device_key)
+            return dict(entry) if entry else None
+
+    def record(self, device_key: str, backend: int, index: int,
+               width: int, height: int, fourcc: str = "", make_last: bool = True) -> None:
+        """Store the parameters that just opened a device (and optionally mark it most recent)."""
+        entry = {"backend": int(backend), "index": int(index),
+                 "width": int(width), "height": int(height), "fourcc": fourcc}
+        with self._lock:
+            last_device = device_key if make_last else self.last_device
+            if self._entries.get(device_key) == entry and self.last_device == last_device:
+                return
+            self._entries[device_key] = entry
+            self.last_device = last_device
+            self._save()
+
+
+def apply_fourcc(cap, fourcc: str) -> None:
+    """Request a pixel format on an open capture (no-op for an empty code)."""
+    if len(fourcc) == 4:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
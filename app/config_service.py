@@ -29,6 +29,17 @@ class ConfigService:
         "cameraSensitivity": 350,
         "pz_reach": 0.7,
         "proximityMin": 50,
+        "motionBackgroundModel": "last_frame",
+        "motionLearningRate": 0.05,
+        "illuminationCompensation": True,
+        "motionZones": [],
+        "adaptiveFpsTiers": [],
+        "fpsEnergyBudgetFramesPerHour": 0,
+        "cameraIndices": [],
+        "visionWorkerProcess": False,
+        "cameraReleaseOnPauseSeconds": 0,
+        "cameraOnDemand": True,
+        "cameraPrewarmSeconds": 3,
         "enableGuardianMode": False,
         "guardianAutoEnable": False,
         "enableGlobalHotkey": True,
@@ -45,6 +56,8 @@ class ConfigService:
         "purchaseUrl": "https://pzdetector.com/pricing",
         "licenseApiUrl": "https://api.pzdetector.com",
         "identityPromptMessage": "Confirm you're still here",
+        "identityTimeoutSeconds": 30,
+        "eventQueueSize": 256,
         "warningThresholdSeconds": 10,
         "idleThresholdSeconds": 50,
         "updateCheckInterval": 86400,
@@ -166,6 +179,11 @@ class ConfigService:
         val = self.get(key)
         return str(val) if val is not None else default
     
+    def get_list(self, key: str, default: Optional[list] = None) -> list:
+        """Get a list configuration value."""
+        val = self.get(key)
+        return list(val) if isinstance(val, (list, tuple)) else list(default or [])
+    
     def as_dict(self) -> Dict[str, Any]:
         """
         Get entire configuration as dictionary.
@@ -0,0 +1,177 @@
+"""
+Event Dispatcher - Bounded, ordered, isolated delivery of engine events
+
+PresenceEngine used to call every handler inline inside tick(). App's state
+handler writes the whole audit JSON to disk, so a slow disk stalled the
+engine (and, since the engine runs on the Tk thread, the UI). Handlers are
+now posted to a bounded queue and run in order on one worker thread; the
+engine only pays for a put_nowait(). Lock handlers keep a synchronous fast
+path (call()) so the workstation locks inside the tick that decided it.
+
+A full queue drops the new event rather than blocking the caller, and
+counts it. Each handler's calls, failures and run time are counted.
+
+synchronous=True runs posted handlers inline on the caller's thread, with
+the same isolation and counters; simulations on a fake clock use it so
+handlers see the clock at the moment of the event.
+
+Cost: One queue put per event, one worker thread
+Benefit: Slow handlers (disk, network) no longer delay tick()
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+DEFAULT_MAX_QUEUE = 256
+
+
+class EventDispatcher:
+    """
+    Runs event handlers on a worker thread, in the order they were posted.
+
+    Args:
+        max_queue: Events that may wait for the worker before new ones are dropped
+        synchronous: Run posted handlers inline instead (no thread)
+        tag: Log prefix, e.g. "PresenceEngine"
+
+    Attributes:
+        dropped (int): Events lost to a full queue
+        max_depth (int): Deepest the queue has been
+    """
+
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE, synchronous: bool = False,
+                 tag: str = "Events"):
+        self.max_queue = max_queue
+        self.synchronous = synchronous
+        self.tag = tag
+        # Synchronous dispatchers (one per headless engine) never queue: skip the Queue's locks
+        self._queue = None if synchronous else queue.Queue(maxsize=max_queue)
+        self._worker: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+        self._handlers: Dict[str, dict] = {}
+        self.dropped = 0
+        self.max_depth = 0
+
+    def call(self, event: str, handler: Callable, *args) -> None:
+        """Run handler now on the calling thread (fast path), isolated and counted."""
+        self._run(event, handler, args)
+
+    def post(self, event: str, handler: Callable, *args) -> bool:
+        """
+        Queue handler(*args) for the worker.
+
+        Args:
+            event: Event name for logs and counters, e.g. "state_changed"
+            handler: Callable to run
+            *args: Handler arguments
+
+        Returns:
+            bool: False if the queue was full and the event was dropped
+        """
+        if self.synchronous:
+            self._run(event, handler, args)
+            return True
+        self._start_worker()
+        try:
+            self._queue.put_nowait((event, handler, args))
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            print(f"[{self.tag}] Event queue full, dropped {event} for {self._handler_name(handler)}")
+            return False
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every posted event has been handled.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        if self._queue is None:
+            return True
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = 1.0) -> bool:
+        """Deliver what is queued (up to timeout), then end the worker."""
+        flushed = self.flush(timeout)
+        worker = self._worker
+        if worker is not None and worker.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                return False  # Daemon worker; it dies with the process
+            worker.join(timeout)
+        self._worker = None
+        return flushed
+
+    def _start_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._work, name=f"{self.tag}Events", daemon=True)
+            self._worker.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._run(*item)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _handler_name(handler: Callable) -> str:
+        return getattr(handler, "__qualname__", None) or repr(handler)
+
+    def _run(self, event: str, handler: Callable, args: tuple) -> None:
+        started = time.perf_counter()
+        failed = False
+        try:
+            handler(*args)
+        except Exception as e:
+            failed = True
+            print(f"[{self.tag}] Error in {event} handler {self._handler_name(handler)}: {e}")
+        elapsed = time.perf_counter() - started
+        key = f"{event}/{self._handler_name(handler)}"
+        with self._stats_lock:
+            stats = self._handlers.get(key)
+            if stats is None:
+                stats = self._handlers[key] = {"calls": 0, "failures": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            stats["calls"] += 1
+            stats["failures"] += failed
+            stats["total_seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+
+    def get_stats(self) -> dict:
+        """
+        Delivery counters.
+
+        Returns:
+            dict: queued (waiting now), max_depth, dropped, and handlers:
+                "event/handler" -> calls, failures, mean_ms, max_ms
+        """
+        with self._stats_lock:
+            handlers = {
+                key: {
+                    "calls": s["calls"],
+                    "failures": s["failures"],
+                    "mean_ms": round(s["total_seconds"] * 1000.0 / s["calls"], 3) if s["calls"] else None,
+                    "max_ms": round(s["max_seconds"] * 1000.0, 3),
+                }
+                for key, s in self._handlers.items()
+            }
+            dropped = self.dropped
+        queued = self._queue.qsize() if self._queue is not None else 0
+        return {"queued": queued, "max_depth": self.max_depth, "dropped": dropped, "handlers": handlers}
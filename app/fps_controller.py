@@ -0,0 +1,200 @@
+"""
+Adaptive FPS Controller - Time-based frame-rate tiers with hysteresis
+
+GlazedSensor used to pick its rate from frame counters (more than 5 motion
+frames -> 16.7 FPS, fewer than 5 motion-free frames -> 5 FPS, else 1 FPS).
+Counting frames makes every decay depend on the rate it is decaying from:
+30 quiet frames is 1.8 s at 16.7 FPS but 30 s at 1 FPS. This controller
+works in seconds instead:
+
+- Promotion (hysteresis up): any motion lifts the sensor to the first
+  active tier at once; higher tiers need motion sustained for their
+  enter_seconds (gaps shorter than episode_gap_seconds do not break it).
+- Ramp-down (hysteresis down): a tier is held for its hold_seconds after the
+  last motion, then the controller steps down one tier at a time.
+- Energy budget (optional): a token bucket of analyzed frames per hour.
+  When it runs dry the rate is capped at what the budget sustains.
+
+It also keeps running totals of seconds and frames spent at each tier, so
+the battery claims in POWER_OPTIMIZATION_STRATEGY.md can be checked against
+measured duty cycles rather than estimates.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+
+@dataclass
+class FpsTier:
+    """One capture rate and how the controller enters and leaves it."""
+    name: str
+    fps: float
+    confidence: float          # motion_confidence reported while in this tier
+    enter_seconds: float = 0.0  # Sustained motion needed to promote into this tier
+    hold_seconds: float = 0.0   # Quiet time before stepping down from this tier
+
+
+# Same rates and confidences as the original frame-counter tiers. Enter and hold
+# times match the old counters at each tier's own rate: 6 motion frames at 5 FPS
+# to reach 16.7 FPS, 30 quiet frames at 16.7 FPS and 5 at 5 FPS to leave.
+DEFAULT_TIERS = (
+    FpsTier("idle", 1.0, 0.1),
+    FpsTier("low", 5.0, 0.6, enter_seconds=0.0, hold_seconds=1.0),
+    FpsTier("high", 16.7, 1.0, enter_seconds=1.0, hold_seconds=1.8),
+)
+EPISODE_GAP_SECONDS = 2.0
+
+
+class AdaptiveFpsController:
+    """
+    Chooses the capture tier from motion events and elapsed time.
+
+    Call update() once per analyzed frame with the frame's timestamp; the time
+    since the previous call is booked to the tier that was active.
+
+    Attributes:
+        tiers (list): FpsTier entries, slowest first
+        tier (FpsTier): Current tier
+        tier_seconds (dict): Seconds spent per tier name
+        tier_frames (dict): Frames analyzed per tier name
+        frames (int): Total frames analyzed
+        energy_budget (int): Analyzed frames allowed per hour (0 = unlimited)
+        budget_limited_seconds (float): Time the budget held the rate down
+    """
+
+    def __init__(self, tiers: Sequence[FpsTier] = DEFAULT_TIERS, energy_budget: int = 0,
+                 episode_gap_seconds: float = EPISODE_GAP_SECONDS):
+        if not tiers:
+            raise ValueError("AdaptiveFpsController needs at least one tier")
+        self.tiers: List[FpsTier] = sorted(tiers, key=lambda t: t.fps)
+        self.energy_budget = energy_budget
+        self.episode_gap_seconds = episode_gap_seconds
+        self.tier_seconds: Dict[str, float] = {t.name: 0.0 for t in self.tiers}
+        self.tier_frames: Dict[str, int] = {t.name: 0 for t in self.tiers}
+        self.frames = 0
+        self.budget_limited_seconds = 0.0
+        self._tokens = self._bucket_capacity()
+        self._limited = False
+        self.reset()
+
+    @classmethod
+    def from_config(cls, tiers: Sequence[dict], energy_budget: int = 0) -> "AdaptiveFpsController":
+        """
+        Build a controller from the "adaptiveFpsTiers" config list.
+
+        Each entry: {"name": "low", "fps": 5, "confidence": 0.6,
+        "enterSeconds": 0, "holdSeconds": 1.0}. An empty list uses DEFAULT_TIERS.
+        """
+        parsed = []
+        for i, entry in enumerate(tiers or []):
+            try:
+                parsed.append(FpsTier(
+                    name=str(entry.get("name", f"tier{i}")),
+                    fps=float(entry["fps"]),
+                    confidence=float(entry.get("confidence", 0.0)),
+                    enter_seconds=float(entry.get("enterSeconds", 0.0)),
+                    hold_seconds=float(entry.get("holdSeconds", 0.0)),
+                ))
+            except (KeyError, TypeError, ValueError, AttributeError) as e:
+                print(f"[FpsController] Skipping tier {i}: {e}")
+        return cls(parsed or DEFAULT_TIERS, energy_budget=energy_budget)
+
+    def clone(self) -> "AdaptiveFpsController":
+        """Fresh controller with the same tiers and budget (per-camera use)."""
+        return AdaptiveFpsController(copy.deepcopy(self.tiers), self.energy_budget, self.episode_gap_seconds)
+
+    def reset(self) -> None:
+        """Drop to the idle tier and forget the current motion episode (e.g. on resume)."""
+        self._level = 0
+        self.tier = self.tiers[0]
+        self._episode_start: Optional[float] = None
+        self._last_motion: Optional[float] = None
+        self._hold_from: Optional[float] = None  # Start of the current tier's quiet period
+        self._last_update: Optional[float] = None  # Paused time is not booked to any tier
+
+    def _bucket_capacity(self) -> float:
+        # A quarter of the hourly budget may be spent in one burst
+        return self.energy_budget / 4.0 if self.energy_budget else 0.0
+
+    def update(self, is_motion: bool, now: float) -> FpsTier:
+        """
+        Account for one analyzed frame and pick the tier for the next one.
+
+        Args:
+            is_motion: Whether this frame passed the motion test
+            now: Frame time in seconds (monotonic or simulated)
+
+        Returns:
+            FpsTier: Tier to run at until the next frame
+        """
+        if self._last_update is not None:
+            elapsed = max(0.0, now - self._last_update)
+            self.tier_seconds[self.tier.name] += elapsed
+            if self._limited:
+                self.budget_limited_seconds += elapsed
+            if self.energy_budget:
+                capacity = self._bucket_capacity()
+                self._tokens = min(capacity, self._tokens + elapsed * self.energy_budget / 3600.0)
+        self._last_update = now
+        self.frames += 1
+        self.tier_frames[self.tier.name] += 1
+        if self.energy_budget:
+            self._tokens -= 1.0
+
+        if is_motion:
+            if self._episode_start is None or now - self._last_motion > self.episode_gap_seconds:
+                self._episode_start = now
+            self._last_motion = now
+            self._hold_from = now
+            # Promote to the highest tier whose sustained-motion requirement is met
+            sustained = now - self._episode_start
+            level = max(self._level, 1 if len(self.tiers) > 1 else 0)
+            while level + 1 < len(self.tiers) and sustained >= self.tiers[level + 1].enter_seconds:
+                level += 1
+            self._level = level
+        elif self._hold_from is not None and self._level > 0:
+            # Step down one tier per hold period of quiet
+            if now - self._hold_from >= self.tiers[self._level].hold_seconds:
+                self._level -= 1
+                self._hold_from = now  # The lower tier's hold starts now
+                if self._level == 0:
+                    self._episode_start = None
+
+        level = self._level
+        if self.energy_budget and self._tokens <= 0:
+            sustainable = self.energy_budget / 3600.0
+            while level > 0 and self.tiers[level].fps > sustainable:
+                level -= 1
+        self._limited = level != self._level
+        self.tier = self.tiers[level]
+        return self.tier
+
+    def duty_cycle(self) -> Dict[str, float]:
+        """Fraction of accounted time spent in each tier."""
+        total = sum(self.tier_seconds.values())
+        return {name: (seconds / total if total else 0.0) for name, seconds in self.tier_seconds.items()}
+
+    def get_stats(self) -> dict:
+        """
+        Running totals for power reporting.
+
+        Returns:
+            dict: seconds and frames per tier, duty cycle, total frames,
+                average analyzed FPS, and the frame load relative to running
+                at the top tier the whole time (the always-on baseline)
+        """
+        total_seconds = sum(self.tier_seconds.values())
+        top_fps = self.tiers[-1].fps
+        average_fps = self.frames / total_seconds if total_seconds else 0.0
+        return {
+            "tier": self.tier.name,
+            "tier_seconds": dict(self.tier_seconds),
+            "tier_frames": dict(self.tier_frames),
+            "duty_cycle": self.duty_cycle(),
+            "frames": self.frames,
+            "seconds": total_seconds,
+            "average_fps": average_fps,
+            "load_vs_top_tier": average_fps / top_fps if top_fps else 0.0,
+            "budget_limited_seconds": self.budget_limited_seconds,
+        }
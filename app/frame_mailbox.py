@@ -0,0 +1,97 @@
+"""
+Frame Mailbox - Latest-frame-wins handoff from GlazedSensor to the Tk UI
+
+The sensor thread used to call App.on_sensor_data directly, converting every
+frame to a PhotoImage and touching Tk widgets off the Tk thread. The sensor
+now posts into this single-slot mailbox instead and the UI takes at most one
+frame per refresh on its own thread. Frames the UI never got to are simply
+overwritten, so preview cost is bounded by the UI refresh rate, not the
+capture rate.
+
+Posting copies the frame into a mailbox-owned buffer: the sensor reuses its
+display buffers on the next frame, so holding a reference would race.
+Motion and errors are sticky until taken, so a motion frame is never lost
+because a quieter frame overwrote it.
+
+Cost: One 320x240 memcpy per posted preview frame
+Benefit: No Tk calls on the sensor thread; preview work capped at the UI rate
+"""
+
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class FrameMailbox:
+    """
+    Single-slot mailbox, safe for any number of posting threads and one taker.
+
+    Attributes:
+        posted (int): Frames posted so far
+        taken (int): Frames handed to the UI
+        dropped (int): Frames overwritten before the UI took them
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Double buffer: writers fill _pending, take() swaps it with _front
+        self._pending: Optional[np.ndarray] = None
+        self._front: Optional[np.ndarray] = None
+        self._has_frame = False
+        self._motion = False
+        self._proximity = 0
+        self._error: Optional[str] = None
+        self._dirty = False
+        self.posted = 0
+        self.taken = 0
+        self.dropped = 0
+
+    def post(self, frame, motion, proximity, error=None) -> None:
+        """
+        Publish sensor output; same signature as the GlazedSensor callback.
+
+        Args:
+            frame (np.ndarray): Preview frame or None (idle, secondary camera)
+            motion (bool): Stable motion trigger
+            proximity (float): Depth score
+            error (str, optional): e.g. "CAMERA_FAILED"
+        """
+        with self._lock:
+            if frame is not None:
+                if self._pending is None or self._pending.shape != frame.shape:
+                    self._pending = np.empty_like(frame)
+                np.copyto(self._pending, frame)
+                if self._has_frame:
+                    self.dropped += 1
+                self._has_frame = True
+                self.posted += 1
+            self._motion = self._motion or bool(motion)
+            self._proximity = proximity
+            if error:
+                self._error = error
+            self._dirty = True
+
+    def take(self) -> Optional[Tuple[Optional[np.ndarray], bool, float, Optional[str]]]:
+        """
+        Collect everything posted since the last take (UI thread).
+
+        Returns:
+            tuple: (frame, motion, proximity, error) or None if nothing new.
+                frame is None if only motion/proximity changed, and stays
+                valid until the next take().
+        """
+        if not self._dirty:
+            return None
+        with self._lock:
+            frame = None
+            if self._has_frame:
+                self._front, self._pending = self._pending, self._front
+                frame = self._front
+                self._has_frame = False
+                self.taken += 1
+            result = (frame, self._motion, self._proximity, self._error)
+            self._motion = False
+            self._error = None
+            self._dirty = False
+            return result
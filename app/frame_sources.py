@@ -0,0 +1,495 @@
+"""
+Frame Sources - Pluggable frame providers for GlazedSensor
+
+Decouples the Glazed Vision motion pipeline from cv2.VideoCapture so the exact
+production pipeline can run against a live camera, a recorded video file, a
+directory of images, or a synthetic scene generator (moving blobs, sensor noise
+and lighting ramps). Offline sources are not paced, so headless build agents can
+benchmark and regression-test the pipeline at full speed with no webcam.
+
+Privacy: sources only ever hand frames to the in-memory pipeline. Nothing here
+writes frames to disk or sends them anywhere.
+"""
+
+import os
+import sys
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from camera_discovery import CameraParamCache, apply_fourcc, fourcc_to_str
+
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".pgm", ".ppm", ".tif", ".tiff")
+
+
+class FrameSource(ABC):
+    """
+    Base class for anything that can feed BGR frames to GlazedSensor.
+
+    Subclasses implement open() and read(); the rest has working defaults.
+
+    Attributes:
+        name (str): Human-readable source label used in stats and logs
+        is_live (bool): True for real devices that produce frames in real time.
+            Live sources are paced by the adaptive FPS logic; offline sources
+            run as fast as the pipeline allows.
+    """
+
+    name = "source"
+    is_live = False
+
+    @abstractmethod
+    def open(self) -> bool:
+        """
+        Open the source.
+
+        Returns:
+            bool: True if frames can be read
+        """
+
+    @abstractmethod
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Read the next frame.
+
+        Returns:
+            tuple: (ok, frame) where frame is a BGR uint8 array or None
+        """
+
+    def grab(self) -> bool:
+        """
+        Advance to the next frame without decoding it (where supported).
+
+        The default implementation reads a full frame and holds it for
+        retrieve(). Device-backed sources override this with a real grab.
+
+        Returns:
+            bool: True if a frame was grabbed
+        """
+        ok, self._grabbed = self.read()
+        return ok
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        Decode the most recently grabbed frame.
+
+        Returns:
+            tuple: (ok, frame) as for read()
+        """
+        frame = getattr(self, "_grabbed", None)
+        self._grabbed = None
+        return frame is not None, frame
+
+    def set_resolution(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        Request a capture resolution.
+
+        Returns:
+            tuple: (width, height) actually in effect, or None if the source
+                has a fixed resolution
+        """
+        return None
+
+    def release(self) -> None:
+        """Release any underlying device or file handle."""
+
+    def is_opened(self) -> bool:
+        """Check whether the source is currently open."""
+        return False
+
+
+class CameraFrameSource(FrameSource):
+    """
+    Live webcam source backed by cv2.VideoCapture.
+
+    Brio/Windows devices often require cycling through backends, so open()
+    tries DSHOW then MSMF on Windows and the default backend elsewhere. A
+    device discovered through DirectShow ("dshow:" key) is opened with DSHOW
+    only: its index is its DirectShow position, and MSMF numbers cameras in
+    its own order (and skips DirectShow-only virtual cameras). With a
+    CameraParamCache the backend, resolution and pixel format that last worked
+    for this device are tried first, and the winning combination is recorded.
+    """
+
+    is_live = True
+
+    def __init__(self, camera_index: int = 0, width: Optional[int] = None, height: Optional[int] = None,
+                 cache: Optional[CameraParamCache] = None, device_key: Optional[str] = None,
+                 make_last: bool = True):
+        self.camera_index = camera_index
+        self.cache = cache
+        self.make_last = make_last
+        self.device_key = device_key or f"index:{camera_index}"
+        self._cached = cache.get(self.device_key) if cache else None
+        default_size = (self._cached["width"], self._cached["height"]) if self._cached else (640, 480)
+        self.width = width or default_size[0]
+        self.height = height or default_size[1]
+        self.name = f"camera:{camera_index}"
+        self.cap = None
+        self.backend = None
+        self.fourcc = ""
+
+    def _backend_order(self) -> List[Tuple[int, str]]:
+        """(backend, fourcc) attempts, cached combination first."""
+        if self.device_key.startswith("dshow:"):
+            backends = [cv2.CAP_DSHOW]  # Same index under MSMF can be another camera
+        else:
+            backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF] if sys.platform.startswith('win') else [cv2.CAP_ANY]
+        attempts = [(backend, "") for backend in backends]
+        if self._cached and self._cached["backend"] in backends:
+            cached = (self._cached["backend"], self._cached.get("fourcc", ""))
+            attempts = [cached] + [a for a in attempts if a[0] != cached[0]]
+        if self.backend is not None:
+            # Reopening (e.g. after a long pause): go straight to what worked
+            attempts = [(self.backend, self.fourcc)] + [a for a in attempts if a[0] != self.backend]
+        return attempts
+
+    def open(self) -> bool:
+        for backend, fourcc in self._backend_order():
+            self.cap = cv2.VideoCapture(self.camera_index, backend)
+            if self.cap.isOpened():
+                apply_fourcc(self.cap, fourcc)
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+                ret, _ = self.cap.read()
+                if ret:
+                    self.backend = backend
+                    self.fourcc = fourcc_to_str(self.cap.get(cv2.CAP_PROP_FOURCC))
+                    self._remember()
+                    return True
+            self.cap.release()
+            self.cap = None
+        # A busy or unplugged camera keeps its cache entry; a different
+        # working combination simply overwrites it on the next success
+        return False
+
+    def _remember(self) -> None:
+        """Record the parameters currently in effect for the next open."""
+        if self.cache and self.backend is not None:
+            self.cache.record(self.device_key, self.backend, self.camera_index,
+                              self.width, self.height, self.fourcc, make_last=self.make_last)
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.cap is None:
+            return False, None
+        return self.cap.read()
+
+    def grab(self) -> bool:
+        if self.cap is None:
+            return False
+        return self.cap.grab()
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.cap is None:
+            return False, None
+        return self.cap.retrieve()
+
+    def set_resolution(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """
+        Ask the driver for a resolution and report what it negotiated.
+
+        Drivers snap unsupported sizes to the nearest mode they expose, so
+        requesting a tiny size yields the smallest mode the device supports.
+        """
+        self.width, self.height = width, height
+        if self.cap is None:
+            return None
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        actual = (int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+        if actual[0] > 0 and actual[1] > 0:
+            self.width, self.height = actual
+        self._remember()
+        return self.width, self.height
+
+    def release(self) -> None:
+        # Absolutely ensure camera is released with maximum force
+        if self.cap is not None:
+            try:
+                # Set properties to blank first to force release
+                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 0)
+                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 0)
+                self.cap.release()
+            except Exception:
+                pass
+            finally:
+                self.cap = None
+
+    def is_opened(self) -> bool:
+        return self.cap is not None
+
+
+class VideoFileFrameSource(FrameSource):
+    """Replays a recorded video file through the pipeline."""
+
+    def __init__(self, path: str, loop: bool = False):
+        self.path = path
+        self.loop = loop
+        self.name = f"video:{os.path.basename(path)}"
+        self.cap = None
+
+    def open(self) -> bool:
+        self.cap = cv2.VideoCapture(self.path)
+        if not self.cap.isOpened():
+            self.cap = None
+            return False
+        return True
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.cap is None:
+            return False, None
+        ret, frame = self.cap.read()
+        if not ret and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        return ret, frame
+
+    def grab(self) -> bool:
+        if self.cap is None:
+            return False
+        ok = self.cap.grab()
+        if not ok and self.loop:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok = self.cap.grab()
+        return ok
+
+    def retrieve(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.cap is None:
+            return False, None
+        return self.cap.retrieve()
+
+    def release(self) -> None:
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
+
+    def is_opened(self) -> bool:
+        return self.cap is not None
+
+
+class ImageDirectoryFrameSource(FrameSource):
+    """Replays a directory of still images (sorted by filename) as a frame stream."""
+
+    def __init__(self, path: str, loop: bool = False):
+        self.path = path
+        self.loop = loop
+        self.name = f"images:{os.path.basename(os.path.normpath(path))}"
+        self._files: List[str] = []
+        self._position = 0
+
+    def open(self) -> bool:
+        try:
+            self._files = sorted(
+                os.path.join(self.path, f) for f in os.listdir(self.path)
+                if f.lower().endswith(IMAGE_EXTENSIONS)
+            )
+        except OSError as e:
+            print(f"[FrameSource] Cannot list {self.path}: {e}")
+            self._files = []
+        self._position = 0
+        return bool(self._files)
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        while self._files:
+            if self._position >= len(self._files):
+                if not self.loop:
+                    return False, None
+                self._position = 0
+            frame = cv2.imread(self._files[self._position], cv2.IMREAD_COLOR)
+            self._position += 1
+            if frame is not None:
+                return True, frame
+        return False, None
+
+    def release(self) -> None:
+        self._files = []
+        self._position = 0
+
+    def is_opened(self) -> bool:
+        return bool(self._files)
+
+
+class SyntheticFrameSource(FrameSource):
+    """
+    Deterministic synthetic scene generator.
+
+    Renders a textured static background with moving blobs, sensor noise
+    (per-pixel or coarse-grained) and a slow global lighting ramp. Noise is drawn from a small
+    precomputed bank so that generating a frame stays cheap relative to the
+    pipeline being measured.
+
+    Attributes:
+        scenario (str): Preset name (see SCENARIOS) used for the source label
+        num_frames (int): Frames to produce before end-of-stream (None = endless)
+    """
+
+    # name -> (blobs, blob_speed px/frame, noise_sigma, noise_grain px,
+    #          lighting_amplitude, lighting_period frames)
+    SCENARIOS = {
+        "idle": (0, 0.0, 3.0, 1, 0.0, 0),
+        "desk": (1, 12.0, 3.0, 1, 0.0, 0),
+        "busy": (3, 18.0, 3.0, 1, 0.0, 0),
+        "lighting": (0, 0.0, 3.0, 1, 0.25, 120),
+        "exposure": (0, 0.0, 3.0, 1, 0.3, 6),  # Auto-exposure hunting / passing clouds
+        "slow": (1, 1.0, 3.0, 1, 0.0, 0),
+        "lowlight": (0, 0.0, 16.0, 24, 0.0, 0),
+    }
+
+    NOISE_BANK_SIZE = 8
+
+    def __init__(
+        self,
+        scenario: str = "desk",
+        num_frames: Optional[int] = None,
+        width: int = 640,
+        height: int = 480,
+        seed: int = 0,
+        blobs: Optional[int] = None,
+        blob_speed: Optional[float] = None,
+        noise_sigma: Optional[float] = None,
+        noise_grain: Optional[int] = None,
+        lighting_amplitude: Optional[float] = None,
+        lighting_period: Optional[int] = None
+    ):
+        if scenario not in self.SCENARIOS:
+            raise ValueError(f"Unknown synthetic scenario: {scenario}")
+        preset = self.SCENARIOS[scenario]
+        self.scenario = scenario
+        self.name = f"synthetic:{scenario}"
+        self.num_frames = num_frames
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.blobs = preset[0] if blobs is None else blobs
+        self.blob_speed = preset[1] if blob_speed is None else blob_speed
+        self.noise_sigma = preset[2] if noise_sigma is None else noise_sigma
+        self.noise_grain = preset[3] if noise_grain is None else noise_grain
+        self.lighting_amplitude = preset[4] if lighting_amplitude is None else lighting_amplitude
+        self.lighting_period = preset[5] if lighting_period is None else lighting_period
+
+        self._background = None
+        self._noise_pos: List[np.ndarray] = []
+        self._noise_neg: List[np.ndarray] = []
+        self._blob_state = None
+        self._frame_index = 0
+        self._opened = False
+
+    def open(self) -> bool:
+        self._build_scene()
+        self._frame_index = 0
+        self._opened = True
+        return True
+
+    def _build_scene(self) -> None:
+        """Render the background, noise bank and blob layout for the current size."""
+        rng = np.random.default_rng(self.seed)
+        h, w = self.height, self.width
+
+        # Smooth low-frequency texture so the scene is not a flat field
+        coarse = rng.integers(40, 200, size=(h // 40 + 2, w // 40 + 2, 3), dtype=np.uint8)
+        self._background = cv2.resize(coarse, (w, h), interpolation=cv2.INTER_CUBIC)
+
+        self._noise_pos = []
+        self._noise_neg = []
+        # Coarse grain mimics the blotchy, spatially correlated noise of a webcam in low light
+        grain = max(1, self.noise_grain)
+        for _ in range(self.NOISE_BANK_SIZE):
+            noise = rng.normal(0.0, self.noise_sigma, size=(-(-h // grain), -(-w // grain), 3))
+            if grain > 1:
+                noise = cv2.resize(noise, (w, h), interpolation=cv2.INTER_LINEAR)
+            self._noise_pos.append(np.clip(noise, 0, 255).astype(np.uint8))
+            self._noise_neg.append(np.clip(-noise, 0, 255).astype(np.uint8))
+
+        # Per-blob position, velocity, radius and colour
+        self._blob_state = []
+        for _ in range(self.blobs):
+            angle = rng.uniform(0, 2 * np.pi)
+            self._blob_state.append([
+                rng.uniform(0.3 * w, 0.7 * w),
+                rng.uniform(0.3 * h, 0.7 * h),
+                np.cos(angle) * self.blob_speed,
+                np.sin(angle) * self.blob_speed,
+                int(rng.uniform(0.08, 0.15) * h),
+                tuple(int(c) for c in rng.integers(0, 60, size=3)),
+            ])
+
+    def read(self) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self._opened:
+            return False, None
+        if self.num_frames is not None and self._frame_index >= self.num_frames:
+            return False, None
+
+        frame = self._background.copy()
+        for blob in self._blob_state:
+            x, y, vx, vy, radius, color = blob
+            cv2.circle(frame, (int(x), int(y)), radius, color, -1)
+            # Bounce off the frame edges
+            x += vx
+            y += vy
+            if x < radius or x > self.width - radius:
+                blob[2] = -vx
+            if y < radius or y > self.height - radius:
+                blob[3] = -vy
+            blob[0], blob[1] = x, y
+
+        if self.noise_sigma > 0:
+            slot = self._frame_index % self.NOISE_BANK_SIZE
+            cv2.add(frame, self._noise_pos[slot], dst=frame)
+            cv2.subtract(frame, self._noise_neg[slot], dst=frame)
+
+        if self.lighting_amplitude > 0 and self.lighting_period > 0:
+            phase = 2 * np.pi * self._frame_index / self.lighting_period
+            gain = 1.0 + self.lighting_amplitude * np.sin(phase)
+            cv2.convertScaleAbs(frame, dst=frame, alpha=gain)
+
+        self._frame_index += 1
+        return True, frame
+
+    def set_resolution(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """Re-render the scene at a new size, keeping blob positions proportional."""
+        if (width, height) == (self.width, self.height):
+            return width, height
+        old_blobs = self._blob_state
+        sx, sy = width / self.width, height / self.height
+        self.width, self.height = width, height
+        if self._opened:
+            self._build_scene()
+            for blob, old in zip(self._blob_state, old_blobs or []):
+                blob[0], blob[1] = old[0] * sx, old[1] * sy
+                blob[2], blob[3] = old[2] * sx, old[3] * sy
+        return width, height
+
+    def release(self) -> None:
+        self._opened = False
+
+    def is_opened(self) -> bool:
+        return self._opened
+
+
+def create_frame_source(spec, num_frames: Optional[int] = None, loop: bool = False) -> FrameSource:
+    """
+    Build a frame source from a short spec string.
+
+    Args:
+        spec: Camera index (int or digit string), "synthetic[:scenario]",
+            a directory of images, or a video file path
+        num_frames: Frame limit for synthetic sources
+        loop: Loop file-backed sources instead of ending the stream
+
+    Returns:
+        FrameSource: Unopened source
+    """
+    if isinstance(spec, int):
+        return CameraFrameSource(spec)
+    spec = str(spec)
+    if spec.isdigit():
+        return CameraFrameSource(int(spec))
+    if spec.startswith("synthetic"):
+        _, _, scenario = spec.partition(":")
+        return SyntheticFrameSource(scenario or "desk", num_frames=num_frames)
+    if os.path.isdir(spec):
+        return ImageDirectoryFrameSource(spec, loop=loop)
+    return VideoFileFrameSource(spec, loop=loop)
@@ -0,0 +1,116 @@
+"""
+Glaze Renderer - Cheap Fog Mode preview from the 20x15 zone thumbnail
+
+The Active-mode preview has always been built by upsampling the 20x15 crop to
+320x240 with nearest neighbour and then running a 99x99 Gaussian blur over
+the result. Both steps are linear and separable, so together they collapse
+into one small matrix per axis: out = Ky @ small @ Kx.T per channel, where
+Ky is 240x15 and Kx is 320x20. The matrices are precomputed once from the
+same Gaussian kernel and border rule OpenCV uses, so the fog is the same
+image (to within rounding) at a small fraction of the cost.
+
+Privacy: the output carries no more detail than the 20x15 input, exactly as
+with the original blur.
+"""
+
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+GLAZE_INPUT_SIZE = (20, 15)
+GLAZE_OUTPUT_SIZE = (320, 240)
+GLAZE_KERNEL_SIZE = 99
+
+
+def _reflect_101(index: int, length: int) -> int:
+    """Map an out-of-range index the way cv2.BORDER_REFLECT_101 does."""
+    if length == 1:
+        return 0
+    period = 2 * length - 2
+    index = abs(index) % period
+    return period - index if index >= length else index
+
+
+def _axis_operator(src_len: int, dst_len: int, ksize: int) -> np.ndarray:
+    """
+    Build the dst_len x src_len matrix for nearest upsample followed by a 1D Gaussian.
+
+    Args:
+        src_len: Input length along this axis
+        dst_len: Output length along this axis
+        ksize: Gaussian kernel size (sigma derived as cv2.GaussianBlur does for sigma=0)
+
+    Returns:
+        np.ndarray: float32 operator whose rows sum to 1
+    """
+    # INTER_NEAREST picks floor(dst * src / dst_len)
+    upsample = np.zeros((dst_len, src_len), np.float64)
+    upsample[np.arange(dst_len), (np.arange(dst_len) * src_len) // dst_len] = 1.0
+
+    kernel = cv2.getGaussianKernel(ksize, 0).ravel()
+    radius = ksize // 2
+    blur = np.zeros((dst_len, dst_len), np.float64)
+    for i in range(dst_len):
+        for j, weight in enumerate(kernel):
+            blur[i, _reflect_101(i + j - radius, dst_len)] += weight
+
+    return (blur @ upsample).astype(np.float32)
+
+
+class GlazeRenderer:
+    """
+    Renders the Glazed Vision fog directly from the small zone thumbnail.
+
+    Equivalent to cv2.resize(INTER_NEAREST) to the output size followed by
+    cv2.GaussianBlur(ksize x ksize), but evaluated at low resolution with
+    precomputed per-axis operators and preallocated buffers.
+
+    Attributes:
+        input_size (tuple): (width, height) of the BGR thumbnail (default 20x15)
+        output_size (tuple): (width, height) of the rendered fog (default 320x240)
+    """
+
+    def __init__(self, input_size: Tuple[int, int] = GLAZE_INPUT_SIZE,
+                 output_size: Tuple[int, int] = GLAZE_OUTPUT_SIZE,
+                 kernel_size: int = GLAZE_KERNEL_SIZE):
+        self.input_size = input_size
+        self.output_size = output_size
+        in_w, in_h = input_size
+        out_w, out_h = output_size
+
+        # Vertical operator acts on interleaved BGR rows directly. The horizontal
+        # operator is expanded with an identity over channels (Kx kron I3) so the
+        # product lands in interleaved BGR order with no transpose pass.
+        self._ky = _axis_operator(in_h, out_h, kernel_size)                       # out_h x in_h
+        kx = _axis_operator(in_w, out_w, kernel_size)                             # out_w x in_w
+        self._kx_bgr_t = np.kron(kx, np.eye(3, dtype=np.float32)).T.copy()        # 3in_w x 3out_w
+
+        self._small_f = np.empty((in_h, 3 * in_w), np.float32)
+        self._rows = np.empty((out_h, 3 * in_w), np.float32)
+        self._full = np.empty((out_h, 3 * out_w), np.float32)
+        self._out = np.empty((out_h, out_w, 3), np.uint8)
+
+    def render(self, small: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Render the fog for one thumbnail.
+
+        Args:
+            small (np.ndarray): BGR uint8 thumbnail of input_size
+            dst (np.ndarray, optional): Contiguous uint8 output buffer of
+                output_size. Defaults to an internal buffer valid until the next call.
+
+        Returns:
+            np.ndarray: BGR uint8 fog image of output_size
+        """
+        in_w, in_h = self.input_size
+        out_w, out_h = self.output_size
+        out = self._out if dst is None else dst
+
+        np.copyto(self._small_f, small.reshape(in_h, 3 * in_w))
+        np.matmul(self._ky, self._small_f, out=self._rows)
+        np.matmul(self._rows, self._kx_bgr_t, out=self._full)
+        # Rounds and saturates to uint8, same as the blur's own output conversion
+        cv2.convertScaleAbs(self._full, dst=out.reshape(out_h, 3 * out_w))
+        return out
@@ -0,0 +1,631 @@
+"""
+Glazed Sensor - Privacy-first camera motion detection (Stage 2 of the waterfall)
+
+Pulls frames from a pluggable FrameSource, applies Glazed Vision
+(blur + downsample) and detects motion using frame differencing.
+
+Cost: 1-16.7 FPS adaptive, early-exit delta check before contour analysis
+Benefit: Confirms presence when HID input alone suggests the user has left
+"""
+
+import time
+import threading
+from concurrent.futures import Executor
+from typing import Callable, Optional
+
+import cv2
+import numpy as np
+
+from frame_sources import FrameSource, CameraFrameSource
+from zone_geometry import ZoneGeometry
+from glaze import GlazeRenderer
+from calibration_preview import CalibrationPreviewRenderer
+from motion_history import MotionHistory
+from motion_zones import MotionZones
+from fps_controller import AdaptiveFpsController
+
+
+# Capture resolutions: full size only while the calibration preview is visible
+CALIBRATION_RESOLUTION = (640, 480)
+IDLE_RESOLUTION = (160, 120)  # Drivers snap this to the smallest mode they support
+
+# Motion reference: "last_frame" diffs against the previous frame, "running_average"
+# against an exponentially weighted background that averages out sensor noise
+BACKGROUND_MODELS = ("last_frame", "running_average")
+DEFAULT_LEARNING_RATE = 0.05
+
+# Per-pixel delta that counts as changed (binarization threshold)
+MOTION_PIXEL_THRESHOLD = 25
+
+# Illumination compensation: the current frame is rescaled by the ratio of mean
+# brightness (reference / current) before differencing, which cancels
+# auto-exposure steps, monitor brightness and clouds (multiplicative changes).
+# Gains this close to 1 are left alone; gains outside the limits are a scene
+# change (lights switched off), not drift, and are diffed as-is.
+ILLUMINATION_MIN_GAIN_CHANGE = 0.01
+ILLUMINATION_GAIN_LIMITS = (0.5, 2.0)
+
+# Buffer draining: grabs that return faster than this were already queued by the driver
+FRESH_GRAB_SECONDS = 0.005
+MAX_DRAIN_GRABS = 8
+
+# Lifecycle: how long stop() waits for the capture thread to let go of the device
+STOP_JOIN_SECONDS = 2.0
+
+
+class GlazedSensor(threading.Thread):
+    """
+    Background thread for privacy-first motion detection.
+
+    Captures frames from a frame source, applies Glazed Vision (blur+downsample),
+    and detects motion using frame differencing.
+
+    Attributes:
+        callback (callable): Function to call with sensor data (frame, motion, proximity)
+        camera_index (int): Webcam index (0, 1, 2, etc.)
+        frame_source (FrameSource): Where frames come from (camera by default)
+        paced (bool): Sleep between frames per the adaptive FPS. Defaults to
+            True for live sources and False for offline replay.
+        sensitivity (int): Motion detection threshold (default 350)
+        pz_reach (float): Presence Zone size as % of frame (0.1-1.0)
+        proximity_min (int): Minimum contour area to register proximity
+        calibration_mode (bool): Display zone overlay if True
+        analysis_pool (Executor): Optional shared worker pool that runs
+            process_frame(). Capture and FPS pacing stay on this thread.
+        background_model (str): "last_frame" or "running_average"
+        learning_rate (float): Running-average weight of each new frame (0-1).
+            A still object blends into the background after roughly 1/rate frames.
+        motion_history (MotionHistory): Timestamped (score, proximity, motion)
+            samples for windowed queries by PresenceEngine
+        zones (MotionZones): Optional sub-zones of the Presence Zone with their
+            own thresholds; ignored zones cannot trigger motion
+        fps_controller (AdaptiveFpsController): Picks target_fps and
+            motion_confidence from motion over time and keeps duty-cycle totals
+        release_on_pause_seconds (float): Release the camera once a pause has
+            lasted this long and reopen it on resume (0 = keep it open)
+        illumination_compensation (bool): Cancel global brightness changes
+            (mean/gain) before differencing
+        illumination_shifts (int): Frames whose raw difference had pixels
+            above the binarization threshold but whose compensated one had
+            none (a global luminance shift, not motion)
+        wakeups (int): Times the capture thread woke from a wait (pacing,
+            pause or retry). Stays flat while paused unless heartbeat is set.
+        heartbeat (callable): Optional liveness hook the capture thread calls
+            from its waits, at least every heartbeat_seconds while paused or
+            powered down. A thread stuck in a frame read stops calling it.
+        heartbeat_seconds (float): Longest idle wait between heartbeat calls
+        powered (bool): False while PresenceEngine has the camera powered
+            down (power_down()); the device is closed until power_up()
+        wake_latency_seconds (float): Time from the last power_up() to the
+            first analyzed frame (device open included), None until measured
+    """
+
+    def __init__(self, callback, camera_index=0, frame_source: Optional[FrameSource] = None,
+                 paced: Optional[bool] = None, analysis_pool: Optional[Executor] = None):
+        super().__init__(daemon=True)
+        self.callback = callback
+        self.camera_index = camera_index
+        self.frame_source = frame_source or CameraFrameSource(camera_index)
+        self.paced = self.frame_source.is_live if paced is None else paced
+        self.analysis_pool = analysis_pool
+        self.running = True
+        self.paused = False
+        # Guards running/paused; waits on it replace sleep polling so pause,
+        # resume and stop wake the capture thread immediately
+        self._state = threading.Condition()
+        self._run_entered = False  # From then on only run() releases the source
+        self.release_on_pause_seconds = 0.0
+        self.powered = True
+        self.wake_latency_seconds = None
+        self._woken_at = None
+        self.wakeups = 0
+        self.heartbeat: Optional[Callable[[], None]] = None
+        self.heartbeat_seconds = 1.0
+        self.camera_releases = 0
+        self.last_reopen_seconds = None
+        self.last_gray = None
+        self.motion_free_frames = 0
+        self.motion_frames = 0
+
+        # Adaptive FPS control (waterfall pattern)
+        self.fps_controller = AdaptiveFpsController()
+        self.target_fps = 1          # Start at 1 FPS (idle)
+        self.frame_count = 0
+        self.motion_confidence = 0   # 0.0 to 1.0
+        self._media_time = 0.0       # Simulated clock for unpaced replay
+        self.motion_history = MotionHistory()  # One sample per analyzed frame
+
+        # Adjustable Params
+        self.sensitivity = 350
+        self.pz_reach = 0.7
+        self.proximity_min = 50
+        self.calibration_mode = True
+        self.background_model = "last_frame"
+        self.learning_rate = DEFAULT_LEARNING_RATE
+        self.zones: Optional[MotionZones] = None
+        self.illumination_compensation = True
+
+        # Zone geometry and preallocated per-frame buffers (see _ensure_geometry)
+        self.geometry: Optional[ZoneGeometry] = None
+        self._background_seeded = False
+        self._allocate_buffers()
+
+        # Capture mode ("calibration" or "idle") and the resolution it negotiated
+        self._capture_mode = None
+        self.capture_resolution = None
+
+        # Throughput stats (per source)
+        self._started_at = None
+        self._processing_seconds = 0.0
+        self.frames_grabbed = 0
+        self.frames_decoded = 0
+        self.expensive_checks = 0
+        self.illumination_shifts = 0
+
+    def run(self):
+        # Also called directly (worker process, benchmarks), so Thread.ident cannot tell
+        with self._state:
+            if not self.running:
+                return  # stop() came first and released the source
+            self._run_entered = True
+        try:
+            if not self.powered:
+                # Powered down before the first frame: the device opens on power_up()
+                if not self._wait_while_paused(source_open=False):
+                    return
+            elif not self.frame_source.open():
+                self.callback(None, False, 0, "CAMERA_FAILED")
+                return
+
+            self._started_at = time.perf_counter()
+            while self.running:
+                # POWER OPTIMIZATION: Block until resumed, no polling while paused
+                if self._idle():
+                    if not self._wait_while_paused():
+                        break
+                    continue
+
+                self._apply_capture_mode()
+                ret, frame = self._read_latest()
+                if not ret:
+                    if not self.frame_source.is_live:
+                        break  # End of replay
+                    self._wait(0.5)
+                    continue
+
+                frame_started = time.perf_counter()
+                if self.analysis_pool is not None:
+                    # Wait for the shared pool: the work buffers are per-sensor
+                    result = self.analysis_pool.submit(self.process_frame, frame).result()
+                else:
+                    result = self.process_frame(frame)
+                processed_frame, stable_trigger, current_proximity = result
+                self._processing_seconds += time.perf_counter() - frame_started
+                self.frame_count += 1
+
+                self.callback(processed_frame, stable_trigger, current_proximity)
+                if self._woken_at is not None:
+                    self.wake_latency_seconds = time.perf_counter() - self._woken_at
+                    self._woken_at = None
+                    print(f"[Sensor] First frame {self.wake_latency_seconds * 1000:.0f} ms after power-up")
+
+                # Adaptive sleep: vary interval based on target FPS
+                if self.paced:
+                    self._wait(1.0 / self.target_fps if self.target_fps > 0 else 1.0)
+        except Exception as e:
+            print(f"[Sensor Error] {e}")
+        finally:
+            # Only this thread touches the device, so release cannot race a read
+            self.frame_source.release()
+
+    def _idle(self) -> bool:
+        """Paused by the UI or powered down by PresenceEngine."""
+        return self.paused or not self.powered
+
+    def _wait(self, seconds: float) -> None:
+        """Sleep between frames; pause(), power_down() and stop() cut the wait short."""
+        if self.heartbeat is not None:
+            self.heartbeat()
+        with self._state:
+            self._state.wait_for(lambda: self._idle() or not self.running, timeout=seconds)
+            self.wakeups += 1
+
+    def _wait_while_paused(self, source_open: bool = True) -> bool:
+        """
+        Block until resume()/power_up() or stop().
+
+        power_down() releases the camera right away. A plain pause releases it
+        only once it has lasted release_on_pause_seconds (a single timed
+        wakeup); otherwise the wait has no timeout at all, unless a heartbeat
+        hook bounds it to heartbeat_seconds. A released source
+        is reopened here before capture continues.
+
+        Args:
+            source_open: False when the source has not been opened yet
+
+        Returns:
+            bool: True to keep running, False on stop or a failed reopen
+        """
+        released = not source_open
+        live = self.frame_source.is_live
+        release_at = (time.monotonic() + self.release_on_pause_seconds
+                      if self.release_on_pause_seconds > 0 else None)
+        while True:
+            if self.heartbeat is not None:
+                self.heartbeat()
+            with self._state:
+                can_release = live and not released
+                timeout = None
+                if can_release and release_at is not None:
+                    timeout = max(0.0, release_at - time.monotonic())
+                if self.heartbeat is not None:
+                    timeout = min(timeout, self.heartbeat_seconds) if timeout is not None else self.heartbeat_seconds
+                self._state.wait_for(
+                    lambda: not self._idle() or not self.running or (can_release and not self.powered),
+                    timeout=timeout
+                )
+                self.wakeups += 1
+                if not self.running:
+                    return False
+                if not self._idle():
+                    break
+                release_now = can_release and (
+                    not self.powered or (release_at is not None and time.monotonic() >= release_at))
+            if release_now:
+                self.frame_source.release()
+                released = True
+                self.camera_releases += 1
+                reason = "powered down" if not self.powered else f"paused {self.release_on_pause_seconds:g}s"
+                print(f"[Sensor] Camera released ({reason})")
+        if released:
+            opened_at = time.perf_counter()
+            if not self.frame_source.open():
+                self.callback(None, False, 0, "CAMERA_FAILED")
+                return False
+            self.last_reopen_seconds = time.perf_counter() - opened_at
+            print(f"[Sensor] Camera opened in {self.last_reopen_seconds * 1000:.0f} ms")
+            # The device comes back at its default mode and the scene may have changed
+            self._capture_mode = None
+            self.last_gray = None
+            self._background_seeded = False
+        return True
+
+    def _apply_capture_mode(self) -> None:
+        """
+        Switch capture resolution when calibration mode is toggled.
+
+        The full-resolution frame is only needed for the calibration preview.
+        Outside calibration the motion path works on a 40x30 crop, so the
+        device is asked for its smallest mode to cut decode cost.
+        """
+        mode = "calibration" if self.calibration_mode else "idle"
+        if mode == self._capture_mode:
+            return
+        self._capture_mode = mode
+        width, height = CALIBRATION_RESOLUTION if self.calibration_mode else IDLE_RESOLUTION
+        actual = self.frame_source.set_resolution(width, height)
+        if actual is not None:
+            self.capture_resolution = actual
+            print(f"[Sensor] {mode} capture at {actual[0]}x{actual[1]}")
+
+    def _read_latest(self):
+        """
+        Fetch the newest frame, decoding only the one that will be analyzed.
+
+        After an adaptive-FPS sleep a live device has several stale frames
+        queued. Those are skipped with grab() (no decode) until a grab has to
+        wait for the sensor, and only that fresh frame is retrieve()d.
+        Offline sources are replayed frame by frame.
+
+        Returns:
+            tuple: (ok, frame)
+        """
+        source = self.frame_source
+        grabs = 0
+        while True:
+            grab_started = time.perf_counter()
+            if not source.grab():
+                return False, None
+            grabs += 1
+            if not source.is_live or grabs >= MAX_DRAIN_GRABS:
+                break
+            if time.perf_counter() - grab_started > FRESH_GRAB_SECONDS:
+                break  # Blocked on the device, so this frame is fresh
+        self.frames_grabbed += grabs
+        ret, frame = source.retrieve()
+        if ret:
+            self.frames_decoded += 1
+        return ret, frame
+
+    def _ensure_geometry(self, h: int, w: int) -> ZoneGeometry:
+        """
+        Rebuild the zone geometry if reach or frame size changed.
+
+        pz_reach can be written at any time (the UI pushes it on every slider
+        move), but the geometry is only rebuilt when the value actually differs.
+        A new zone also drops the previous reference frame, since diffing two
+        different crops would read as motion.
+
+        Returns:
+            ZoneGeometry: Geometry for the current frame size and reach
+        """
+        if self.geometry is not None and self.geometry.matches(w, h, self.pz_reach):
+            return self.geometry
+        self.geometry = ZoneGeometry(w, h, self.pz_reach)
+        self.last_gray = None
+        self._background_seeded = False
+        return self.geometry
+
+    def _allocate_buffers(self) -> None:
+        """Allocate the fixed-size working buffers used on every frame."""
+        # Fast motion path (40x30)
+        self._small_fast = np.empty((30, 40, 3), np.uint8)
+        self._gray_raw = np.empty((30, 40), np.uint8)
+        self._gray_slots = [np.empty((30, 40), np.uint8), np.empty((30, 40), np.uint8)]
+        self._gray_slot = 0
+        self._delta = np.empty((30, 40), np.uint8)
+        self._gray_compensated = np.empty((30, 40), np.uint8)
+        self._thresh = np.empty((30, 40), np.uint8)
+        self._background = np.empty((30, 40), np.float32)
+        self._background_u8 = np.empty((30, 40), np.uint8)
+
+        # Glazed preview (20x15 -> 320x240 fog)
+        self._glaze_small = np.empty((15, 20, 3), np.uint8)
+        self._glaze = GlazeRenderer()
+
+        # Calibration preview (downscaled first, outline cached per zone)
+        self._calibration_preview = CalibrationPreviewRenderer()
+
+    def _motion_reference(self, gray):
+        """
+        Get the frame to diff the current 40x30 gray frame against.
+
+        Args:
+            gray (np.ndarray): Current blurred 40x30 grayscale frame
+
+        Returns:
+            np.ndarray: Previous frame or running background, None on the
+                first frame after a (re)start or zone change
+        """
+        if self.background_model != "running_average":
+            self._background_seeded = False
+            return self.last_gray
+        if not self._background_seeded:
+            # Seed the background with the first frame of this zone (or model switch)
+            self._background[:] = gray
+            self._background_seeded = True
+            return None
+        cv2.convertScaleAbs(self._background, dst=self._background_u8)
+        return self._background_u8
+
+    def _compensate_illumination(self, gray, reference, mask=None):
+        """
+        Rescale the current frame to the reference's mean brightness.
+
+        Args:
+            gray (np.ndarray): Current blurred 40x30 grayscale frame
+            reference (np.ndarray): Frame or background it is diffed against
+            mask (np.ndarray): Optional include mask; ignored zones (a window)
+                do not set the gain
+
+        Returns:
+            np.ndarray: gray itself, or the compensated frame in a scratch buffer
+        """
+        current_mean = cv2.mean(gray, mask=mask)[0]
+        if current_mean < 1.0:
+            return gray
+        gain = cv2.mean(reference, mask=mask)[0] / current_mean
+        low, high = ILLUMINATION_GAIN_LIMITS
+        if abs(gain - 1.0) < ILLUMINATION_MIN_GAIN_CHANGE or not low <= gain <= high:
+            return gray
+        return cv2.convertScaleAbs(gray, dst=self._gray_compensated, alpha=gain)
+
+    def process_frame(self, frame):
+        """
+        Run the Glazed Vision motion pipeline on one BGR frame.
+
+        All intermediate results are written into preallocated buffers, so the
+        steady-state path allocates no new image arrays. The returned display
+        frame is one of those buffers and is only valid until the next call.
+
+        Args:
+            frame (np.ndarray): Full-resolution BGR frame from the source
+
+        Returns:
+            tuple: (processed_frame, stable_trigger, proximity) where
+                processed_frame is the 320x240 display frame or None in idle mode
+        """
+        # 1. APPLY PZ REACH (Map the Zone)
+        h, w, _ = frame.shape
+        geometry = self._ensure_geometry(h, w)
+        zone = geometry.crop_view(frame)
+
+        # WATERFALL PATTERN: Quick check first, expensive ops only if needed
+        is_motion = False
+        current_proximity = 0
+
+        # FAST CHECK (2-3ms): Simple pixel delta comparison
+        cv2.resize(zone, (40, 30), dst=self._small_fast, interpolation=cv2.INTER_LINEAR)
+        cv2.cvtColor(self._small_fast, cv2.COLOR_BGR2GRAY, dst=self._gray_raw)
+        gray_fast = self._gray_slots[self._gray_slot]
+        cv2.GaussianBlur(self._gray_raw, (5, 5), 0, dst=gray_fast)
+
+        zones = self.zones
+        if zones is not None:
+            zones.clear()
+        reference = self._motion_reference(gray_fast)
+        if reference is not None:
+            # Still exact with zones: only pixels outside ignored zones can trigger
+            include = zones.include_mask if zones is not None and zones.has_ignored else None
+            compared = gray_fast
+            if self.illumination_compensation:
+                compared = self._compensate_illumination(gray_fast, reference, include)
+
+            # Fast delta check - skip expensive ops 95% of the time
+            delta = cv2.absdiff(reference, compared, dst=self._delta)
+            # L1 norm == np.sum for uint8, without numpy's reduction buffer
+            quick_motion = cv2.norm(delta, cv2.NORM_L1, mask=include) > 200  # Low threshold for early exit
+            if quick_motion and self.background_model == "running_average":
+                # The averaged background carries no noise of its own, but one frame's sensor noise
+                # alone still sums past 200. With no pixel above the binarization threshold the
+                # mask is empty and no contour can follow, so this skips only certain misses
+                quick_motion = cv2.norm(delta, cv2.NORM_INF, mask=include) > MOTION_PIXEL_THRESHOLD
+            if compared is not gray_fast:
+                # Global luminance shift: some raw pixel changed enough to binarize, no compensated one did
+                if (cv2.norm(delta, cv2.NORM_INF, mask=include) <= MOTION_PIXEL_THRESHOLD
+                        and cv2.norm(reference, gray_fast, cv2.NORM_INF, mask=include) > MOTION_PIXEL_THRESHOLD):
+                    self.illumination_shifts += 1
+
+            # EXPENSIVE CHECK: Only run if fast check passed
+            if quick_motion:
+                self.expensive_checks += 1
+                thresh = cv2.threshold(delta, MOTION_PIXEL_THRESHOLD, 255, cv2.THRESH_BINARY,
+                                       dst=self._thresh)[1]
+                if zones is not None:
+                    # All zone scores in one pass, then drop ignored pixels
+                    zones.score(thresh)
+                    if zones.has_ignored:
+                        cv2.bitwise_and(thresh, zones.include_mask, dst=thresh)
+                contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+                if contours:
+                    largest_contour = max(contours, key=cv2.contourArea)
+                    current_proximity = cv2.contourArea(largest_contour)
+                    if current_proximity > (self.proximity_min / 10):
+                        if zones is not None:
+                            is_motion = zones.triggered(self.sensitivity)
+                        # countNonZero avoids summing a 255-valued mask; same test as np.sum(thresh)
+                        elif cv2.countNonZero(thresh) * 255 > self.sensitivity:
+                            is_motion = True
+
+        if self.background_model == "running_average":
+            cv2.accumulateWeighted(gray_fast, self._background, self.learning_rate)
+
+        # Double-buffer the reference frame instead of allocating a new one
+        self.last_gray = gray_fast
+        self._gray_slot ^= 1
+
+        # Motion counters drive the stable trigger below
+        if is_motion:
+            self.motion_frames += 1
+            self.motion_free_frames = 0
+        else:
+            self.motion_free_frames += 1
+            if self.motion_free_frames > 30:  # 30 frames without motion
+                self.motion_frames = 0
+
+        # Adaptive FPS: time-based tiers. Unpaced replay runs on a simulated
+        # clock that advances as if each frame had been paced at its tier.
+        now = time.monotonic() if self.paced else self._media_time
+        tier = self.fps_controller.update(is_motion, now)
+        self.target_fps = tier.fps
+        self.motion_confidence = tier.confidence
+        self._media_time += 1.0 / tier.fps if tier.fps > 0 else 1.0
+        self.motion_history.record(self.motion_confidence, current_proximity, is_motion)
+
+        # Render display frame (only in calibration mode) or continue with minimal processing
+        if self.calibration_mode:
+            processed_frame = self._calibration_preview.render(frame, geometry)
+        else:
+            # Active Mode: Crop and Glaze only on motion or frequently
+            if is_motion or self.motion_confidence > 0.5:
+                small = cv2.resize(zone, (20, 15), dst=self._glaze_small, interpolation=cv2.INTER_LINEAR)
+                processed_frame = self._glaze.render(small)
+            else:
+                processed_frame = None  # Skip frame generation in idle mode
+
+        # Stabilization: simpler approach using motion counters
+        stable_trigger = self.motion_frames > 2
+
+        return processed_frame, stable_trigger, current_proximity
+
+    def get_stats(self) -> dict:
+        """
+        Get throughput stats for the current frame source.
+
+        Returns:
+            dict: source, frames, fps (wall clock, includes pacing),
+                ms_per_frame (pipeline time only), frames grabbed vs decoded,
+                contour-path entries and illumination shifts absorbed, the
+                negotiated capture resolution, "fps_tiers" with the
+                controller's per-tier seconds, frames and duty cycle, and
+                lifecycle counters (wakeups, releases, wake latency)
+        """
+        frames = self.frame_count
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        return {
+            "source": self.frame_source.name,
+            "frames": frames,
+            "fps": frames / elapsed if elapsed > 0 else 0.0,
+            "ms_per_frame": (self._processing_seconds / frames * 1000.0) if frames else 0.0,
+            "frames_grabbed": self.frames_grabbed,
+            "frames_decoded": self.frames_decoded,
+            "expensive_checks": self.expensive_checks,
+            "illumination_shifts": self.illumination_shifts,
+            "capture_resolution": self.capture_resolution,
+            "fps_tiers": self.fps_controller.get_stats(),
+            "wakeups": self.wakeups,
+            "camera_releases": self.camera_releases,
+            "last_reopen_ms": (self.last_reopen_seconds * 1000.0
+                               if self.last_reopen_seconds is not None else None),
+            "powered": self.powered,
+            "wake_latency_ms": (self.wake_latency_seconds * 1000.0
+                                if self.wake_latency_seconds is not None else None),
+        }
+
+    def stop(self, timeout: Optional[float] = STOP_JOIN_SECONDS):
+        """
+        Stop the sensor thread and wait for it to release the camera.
+
+        The capture thread releases the source itself once its current
+        read() returns, so the device is never closed under a read.
+
+        Args:
+            timeout: Seconds to wait for the thread (0 = signal only)
+        """
+        with self._state:
+            self.running = False
+            self._state.notify_all()
+            run_entered = self._run_entered
+        if not run_entered:
+            self.frame_source.release()  # run() never entered, nothing else holds it
+            return
+        if not self.is_alive():
+            return  # run() on another thread (not ours) or finished: its finally releases
+        if timeout and self is not threading.current_thread():
+            self.join(timeout)
+            if self.is_alive():
+                print(f"[Sensor] Capture thread still busy after {timeout:g}s; it will release the camera on exit")
+
+    def pause(self):
+        """Pause the sensor (no wakeups at all while paused)."""
+        with self._state:
+            self.paused = True
+            self._state.notify_all()
+
+    def resume(self):
+        """Resume the sensor from pause."""
+        with self._state:
+            self.paused = False
+            self.fps_controller.reset()
+            self.target_fps = self.fps_controller.tier.fps  # Start at idle FPS when resuming
+            self._state.notify_all()
+
+    def power_down(self):
+        """Close the camera until power_up() (PresenceEngine's on-demand capture)."""
+        with self._state:
+            if not self.powered:
+                return
+            self.powered = False
+            self._woken_at = None
+            self._state.notify_all()
+
+    def power_up(self):
+        """Reopen the camera and resume capture; the wake latency is measured."""
+        with self._state:
+            if self.powered:
+                return
+            self.powered = True
+            self._woken_at = time.perf_counter()
+            self.fps_controller.reset()
+            self.target_fps = self.fps_controller.tier.fps
+            self._state.notify_all()
@@ -0,0 +1,225 @@
+"""
+Guardian Mode - Sleep inhibition, workstation lock and the Three Acts
+
+HPDManager wraps the OS calls (sleep inhibition, LockWorkStation);
+GuardianMode runs the Three Acts (lock, sustain a guarded process, release)
+and keeps the audit log. Both used to live in main.py next to the Tk app;
+on their own they can be driven headless (benchmarks/bench_presence_sim.py)
+with a fake HPDManager, an in-memory audit log and a simulated clock.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from datetime import datetime
+
+try:
+    import psutil  # Act II process monitoring
+except ImportError:
+    psutil = None
+
+
+class HPDManager:
+    """Handles low-level OS sleep inhibition (Kernel Level)."""
+    def __init__(self):
+        self.lock_inhibited = False
+        self.is_windows = sys.platform.startswith('win')
+        self.is_macos = sys.platform.startswith('darwin')
+
+    def inhibit_sleep(self):
+        if self.lock_inhibited: return
+        try:
+            if self.is_windows:
+                import ctypes
+                ctypes.windll.kernel32.SetThreadExecutionState(0x80000001 | 0x00000002)
+            elif self.is_macos:
+                self.caffeinate_process = subprocess.Popen(['caffeinate', '-i'])
+            self.lock_inhibited = True
+        except Exception as e: print(f"[HPD Error] {e}")
+
+    def allow_sleep(self):
+        if not self.lock_inhibited: return
+        try:
+            if self.is_windows:
+                import ctypes
+                ctypes.windll.kernel32.SetThreadExecutionState(0x80000000)
+            elif self.is_macos:
+                if hasattr(self, 'caffeinate_process'): self.caffeinate_process.terminate()
+            self.lock_inhibited = False
+        except Exception as e: print(f"[HPD Error] {e}")
+
+    def lock_workstation(self):
+        """Act I: Lock the workstation immediately."""
+        try:
+            if self.is_windows:
+                import ctypes
+                ctypes.windll.user32.LockWorkStation()
+                print(f"[Guardian] LOCKED WORKSTATION at {datetime.now().strftime('%H:%M:%S')}")
+                return True
+            elif self.is_macos:
+                subprocess.run(['open', '-a', '/System/Library/CoreServices/ScreenSaverEngine.app'], check=False)
+                print(f"[Guardian] LOCKED WORKSTATION at {datetime.now().strftime('%H:%M:%S')}")
+                return True
+        except Exception as e:
+            print(f"[Guardian Lock Error] {e}")
+            return False
+
+class GuardianMode:
+    """Manages the Three Acts of Guardian Mode: Lock, Sustain, Complete."""
+    def __init__(self, hpd_manager, audit_log_path="audit_log.json", network_service=None, config=None, logger=None,
+                 clock=datetime.now):
+        """
+        Args:
+            audit_log_path: JSON file for the audit log, or None to keep it in memory only
+            clock: Wall-clock source for audit timestamps (a simulated one in the harness)
+        """
+        self.hpd = hpd_manager
+        self.clock = clock
+        self.network_service = network_service
+        self.config = config
+        self.logger = logger
+        self.enabled = False
+        self.guarded_process_pid = None
+        self.guarded_process_name = None
+        self.lock_triggered = False
+        self.on_event = None  # Called after each logged event (any thread)
+        self.audit_log_path = audit_log_path
+        self.audit_log = self._load_audit_log()
+        self._audit_lock = threading.Lock()  # Engine events arrive on their worker thread, Act I on Tk's
+        self.last_cpu_check = 0
+        self.cpu_idle_duration = 0
+        
+    def _load_audit_log(self):
+        """Load audit log from disk or create new."""
+        if self.audit_log_path and os.path.exists(self.audit_log_path):
+            try:
+                with open(self.audit_log_path, 'r') as f:
+                    return json.load(f)
+            except: pass
+        return {"events": []}
+    
+    def _save_audit_log(self):
+        """Save audit log to disk."""
+        if not self.audit_log_path:
+            return
+        try:
+            with open(self.audit_log_path, 'w') as f:
+                json.dump(self.audit_log, f, indent=2)
+        except Exception as e:
+            print(f"[Guardian Log Error] {e}")
+    
+    def log_event(self, event_type, details=""):
+        """Log a Guardian Mode event."""
+        event = {
+            "timestamp": self.clock().isoformat(),
+            "type": event_type,
+            "details": details
+        }
+        with self._audit_lock:
+            self.audit_log["events"].append(event)
+            self._save_audit_log()
+        print(f"[Guardian Log] {event_type}: {details}")
+        if self.on_event:
+            self.on_event()
+    
+    def act_i_lock_door(self, presence_confidence):
+        """Act I: Lock the door when presence reaches 0."""
+        if not self.enabled or self.lock_triggered:
+            return False
+        
+        if presence_confidence <= 0:
+            if self.hpd.lock_workstation():
+                self.lock_triggered = True
+                self.log_event("ACT_I_LOCK", f"Workstation locked. Presence confidence: {presence_confidence}")
+                return True
+        return False
+    
+    def act_ii_sustain_process(self, presence_confidence):
+        """Act II: Keep guarded process alive while it runs."""
+        if not self.enabled or self.guarded_process_pid is None or psutil is None:
+            return False
+        
+        try:
+            # Check if process still exists
+            process = psutil.Process(self.guarded_process_pid)
+            is_running = process.is_running()
+            
+            if is_running:
+                # Keep inhibiting sleep while process is active
+                self.hpd.inhibit_sleep()
+                
+                # Monitor CPU usage (log if idle < 1%)
+                cpu_percent = process.cpu_percent(interval=0.1)
+                if cpu_percent < 1.0:
+                    self.cpu_idle_duration += 1
+                else:
+                    self.cpu_idle_duration = 0
+                
+                # If process has been < 1% CPU for 30+ seconds, consider it done
+                if self.cpu_idle_duration >= 30:
+                    print(f"[Guardian] Process {self.guarded_process_name} idle for too long, releasing...")
+                    self.guarded_process_pid = None
+                    self.guarded_process_name = None
+                    self.cpu_idle_duration = 0
+                    return True
+                
+                return True
+            else:
+                # Process ended - trigger Act III
+                print(f"[Guardian] Process {self.guarded_process_name} completed")
+                self.guarded_process_pid = None
+                self.guarded_process_name = None
+                self.cpu_idle_duration = 0
+                return True
+        
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # Process no longer exists
+            if self.guarded_process_pid:
+                self.log_event("ACT_II_COMPLETE", f"Process {self.guarded_process_name} (PID {self.guarded_process_pid}) completed")
+                self.guarded_process_pid = None
+                self.guarded_process_name = None
+                self.cpu_idle_duration = 0
+            return True
+        
+        return False
+    
+    def act_iii_complete(self):
+        """Act III: Turn out the lights - cleanup and allow sleep."""
+        if not self.enabled:
+            return False
+        
+        # Release sleep inhibition
+        self.hpd.allow_sleep()
+        self.log_event("ACT_III_COMPLETE", "Sleep inhibition released, hardware sleeping allowed")
+        self.lock_triggered = False
+
+        # Optional: Disable network adapters for security (Act III)
+        if self.network_service and self.config:
+            if self.config.get_bool("enableNetworkWiFiControl", False):
+                disabled = self.network_service.disable_all()
+                if disabled:
+                    self.log_event("ACT_III_NETWORK_DISABLED", "Network adapters disabled")
+                else:
+                    self.log_event("ACT_III_NETWORK_FAILED", "Failed to disable network adapters")
+        
+        return True
+    
+    def set_guarded_process(self, process_pid, process_name):
+        """Set the process to monitor (Act II)."""
+        self.guarded_process_pid = process_pid
+        self.guarded_process_name = process_name
+        self.log_event("ACT_II_START", f"Monitoring process: {process_name} (PID {process_pid})")
+    
+    def get_running_processes(self):
+        """Get list of user-accessible running processes."""
+        processes = []
+        if psutil is None:
+            return processes
+        for proc in psutil.process_iter(['pid', 'name']):
+            try:
+                processes.append((proc.info['pid'], proc.info['name']))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return sorted(set(processes), key=lambda x: x[1])  # Remove duplicates, sort by name
@@ -3,10 +3,17 @@ Identity Service - Windows Hello biometric verification
 
 Uses UserConsentVerifier when available. Falls back to unavailable state if
 Windows Hello or winrt bindings are not present.
+
+request_verification() returns a Future and runs the prompt on a worker
+thread with its own event loop, so the caller (PresenceEngine on the Tk
+thread) keeps running while the prompt is open. FakeIdentityVerifier has
+the same interface and is resolved by hand, for headless runs.
 """
 
 import asyncio
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from typing import List, Optional
 
 
 class IdentityService:
@@ -16,6 +23,7 @@ class IdentityService:
         self.logger = logger
         self._available = False
         self._availability_reason: Optional[str] = None
+        self._prompt: Optional[Future] = None  # The open prompt, if any
         self._initialize()
 
     def _log(self, level: str, message: str):
@@ -48,9 +56,37 @@ class IdentityService:
         # UserConsentVerificationResult.Verified == 0
         return int(result) == 0
 
+    def request_verification(self, message: str = "Verify your identity") -> Future:
+        """
+        Start a Windows Hello prompt without waiting for it.
+
+        Returns:
+            Future: Resolves to True if verified, False if declined, failed or
+                unavailable (never raises). While a prompt is open, the same
+                future is returned again.
+        """
+        future = Future()
+        if not self._available:
+            future.set_result(False)
+            return future
+        if self._prompt is not None and not self._prompt.done():
+            return self._prompt
+
+        def run():
+            if future.set_running_or_notify_cancel():
+                future.set_result(self.verify_user(message))
+
+        # Daemon thread: an unanswered prompt must not hold up app exit
+        self._prompt = future
+        threading.Thread(target=run, name="IdentityService", daemon=True).start()
+        return future
+
     def verify_user(self, message: str = "Verify your identity") -> bool:
         """
-        Prompt Windows Hello verification. Returns True if verified.
+        Prompt Windows Hello verification and wait for it. Returns True if verified.
+
+        Blocks for as long as the prompt is open; use request_verification()
+        from the UI thread.
         """
         if not self._available:
             return False
@@ -66,3 +102,65 @@ class IdentityService:
         except Exception as exc:
             self._log("warning", f"Verification failed: {exc}")
             return False
+
+
+class FakeIdentityVerifier:
+    """
+    Scriptable stand-in for IdentityService.
+
+    Each request_verification() returns a pending Future; resolve() answers
+    the oldest pending one. With auto_result set, requests resolve at once.
+
+    Attributes:
+        available (bool): What is_available() reports
+        auto_result (bool): Answer every request immediately with this (None: wait for resolve())
+        requests (list): Messages of every request made
+    """
+
+    def __init__(self, available: bool = True, auto_result: Optional[bool] = None):
+        self.available = available
+        self.auto_result = auto_result
+        self.requests: List[str] = []
+        self._pending: List[Future] = []
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def availability_reason(self) -> str:
+        return "Fake verifier" if self.available else "Fake verifier (unavailable)"
+
+    @property
+    def pending(self) -> int:
+        """Requests not answered yet (cancelled ones excluded)."""
+        return sum(1 for future in self._pending if not future.done())
+
+    def request_verification(self, message: str = "Verify your identity") -> Future:
+        self.requests.append(message)
+        future = Future()
+        if self.auto_result is not None:
+            future.set_result(self.auto_result)
+        else:
+            self._pending.append(future)
+        return future
+
+    def resolve(self, verified: bool) -> bool:
+        """
+        Answer the oldest open request.
+
+        Returns:
+            bool: False if nothing was waiting
+        """
+        while self._pending:
+            future = self._pending.pop(0)
+            if not future.done():
+                future.set_result(verified)
+                return True
+        return False
+
+    def verify_user(self, message: str = "Verify your identity") -> bool:
+        """Blocking form: nothing can resolve() meanwhile, so only auto_result answers."""
+        future = self.request_verification(message)
+        if not future.done():
+            future.cancel()
+            return False
+        return future.result()
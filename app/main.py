@@ -1,20 +1,15 @@
 import time
 import threading
+import queue
 import sys
-import os
-import subprocess
 import math
-import json
 import cv2  # Requires: pip install opencv-python
-import numpy as np
 import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk, ImageDraw
-from datetime import datetime
 import webbrowser
 from tkinter import messagebox
 import pystray
-import psutil
 try:
     import keyboard  # Global hotkey support
 except ImportError:
@@ -23,380 +18,40 @@ except ImportError:
 # Import new multi-sensor waterfall components
 from hid_monitor import HIDMonitor
 from presence_engine import PresenceEngine, PresenceState, StateChangeEvent
+from presence_confidence import PresenceConfidence
+from event_dispatcher import EventDispatcher
 from app_awareness import AppAwarenessService
 from config_service import ConfigService
 from log_service import LogService
 from network_service import NetworkService
 from identity_service import IdentityService
 from license_service_v2 import LicenseService
-
-class HPDManager:
-    """Handles low-level OS sleep inhibition (Kernel Level)."""
-    def __init__(self):
-        self.lock_inhibited = False
-        self.is_windows = sys.platform.startswith('win')
-        self.is_macos = sys.platform.startswith('darwin')
-
-    def inhibit_sleep(self):
-        if self.lock_inhibited: return
-        try:
-            if self.is_windows:
-                import ctypes
-                ctypes.windll.kernel32.SetThreadExecutionState(0x80000001 | 0x00000002)
-            elif self.is_macos:
-                self.caffeinate_process = subprocess.Popen(['caffeinate', '-i'])
-            self.lock_inhibited = True
-        except Exception as e: print(f"[HPD Error] {e}")
-
-    def allow_sleep(self):
-        if not self.lock_inhibited: return
-        try:
-            if self.is_windows:
-                import ctypes
-                ctypes.windll.kernel32.SetThreadExecutionState(0x80000000)
-            elif self.is_macos:
-                if hasattr(self, 'caffeinate_process'): self.caffeinate_process.terminate()
-            self.lock_inhibited = False
-        except Exception as e: print(f"[HPD Error] {e}")
-
-    def lock_workstation(self):
-        """Act I: Lock the workstation immediately."""
-        try:
-            if self.is_windows:
-                import ctypes
-                ctypes.windll.user32.LockWorkStation()
-                print(f"[Guardian] LOCKED WORKSTATION at {datetime.now().strftime('%H:%M:%S')}")
-                return True
-            elif self.is_macos:
-                subprocess.run(['open', '-a', '/System/Library/CoreServices/ScreenSaverEngine.app'], check=False)
-                print(f"[Guardian] LOCKED WORKSTATION at {datetime.now().strftime('%H:%M:%S')}")
-                return True
-        except Exception as e:
-            print(f"[Guardian Lock Error] {e}")
-            return False
-
-class GuardianMode:
-    """Manages the Three Acts of Guardian Mode: Lock, Sustain, Complete."""
-    def __init__(self, hpd_manager, audit_log_path="audit_log.json", network_service=None, config=None, logger=None):
-        self.hpd = hpd_manager
-        self.network_service = network_service
-        self.config = config
-        self.logger = logger
-        self.enabled = False
-        self.guarded_process_pid = None
-        self.guarded_process_name = None
-        self.lock_triggered = False
-        self.audit_log_path = audit_log_path
-        self.audit_log = self._load_audit_log()
-        self.last_cpu_check = 0
-        self.cpu_idle_duration = 0
-        
-    def _load_audit_log(self):
-        """Load audit log from disk or create new."""
-        if os.path.exists(self.audit_log_path):
-            try:
-                with open(self.audit_log_path, 'r') as f:
-                    return json.load(f)
-            except: pass
-        return {"events": []}
-    
-    def _save_audit_log(self):
-        """Save audit log to disk."""
-        try:
-            with open(self.audit_log_path, 'w') as f:
-                json.dump(self.audit_log, f, indent=2)
-        except Exception as e:
-            print(f"[Guardian Log Error] {e}")
-    
-    def log_event(self, event_type, details=""):
-        """Log a Guardian Mode event."""
-        event = {
-            "timestamp": datetime.now().isoformat(),
-            "type": event_type,
-            "details": details
-        }
-        self.audit_log["events"].append(event)
-        self._save_audit_log()
-        print(f"[Guardian Log] {event_type}: {details}")
-    
-    def act_i_lock_door(self, presence_confidence):
-        """Act I: Lock the door when presence reaches 0."""
-        if not self.enabled or self.lock_triggered:
-            return False
-        
-        if presence_confidence <= 0:
-            if self.hpd.lock_workstation():
-                self.lock_triggered = True
-                self.log_event("ACT_I_LOCK", f"Workstation locked. Presence confidence: {presence_confidence}")
-                return True
-        return False
-    
-    def act_ii_sustain_process(self, presence_confidence):
-        """Act II: Keep guarded process alive while it runs."""
-        if not self.enabled or self.guarded_process_pid is None:
-            return False
-        
-        try:
-            # Check if process still exists
-            process = psutil.Process(self.guarded_process_pid)
-            is_running = process.is_running()
-            
-            if is_running:
-                # Keep inhibiting sleep while process is active
-                self.hpd.inhibit_sleep()
-                
-                # Monitor CPU usage (log if idle < 1%)
-                cpu_percent = process.cpu_percent(interval=0.1)
-                if cpu_percent < 1.0:
-                    self.cpu_idle_duration += 1
-                else:
-                    self.cpu_idle_duration = 0
-                
-                # If process has been < 1% CPU for 30+ seconds, consider it done
-                if self.cpu_idle_duration >= 30:
-                    print(f"[Guardian] Process {self.guarded_process_name} idle for too long, releasing...")
-                    self.guarded_process_pid = None
-                    self.guarded_process_name = None
-                    self.cpu_idle_duration = 0
-                    return True
-                
-                return True
-            else:
-                # Process ended - trigger Act III
-                print(f"[Guardian] Process {self.guarded_process_name} completed")
-                self.guarded_process_pid = None
-                self.guarded_process_name = None
-                self.cpu_idle_duration = 0
-                return True
-        
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            # Process no longer exists
-            if self.guarded_process_pid:
-                self.log_event("ACT_II_COMPLETE", f"Process {self.guarded_process_name} (PID {self.guarded_process_pid}) completed")
-                self.guarded_process_pid = None
-                self.guarded_process_name = None
-                self.cpu_idle_duration = 0
-            return True
-        
-        return False
-    
-    def act_iii_complete(self):
-        """Act III: Turn out the lights - cleanup and allow sleep."""
-        if not self.enabled:
-            return False
-        
-        # Release sleep inhibition
-        self.hpd.allow_sleep()
-        self.log_event("ACT_III_COMPLETE", "Sleep inhibition released, hardware sleeping allowed")
-        self.lock_triggered = False
-
-        # Optional: Disable network adapters for security (Act III)
-        if self.network_service and self.config:
-            if self.config.get_bool("enableNetworkWiFiControl", False):
-                disabled = self.network_service.disable_all()
-                if disabled:
-                    self.log_event("ACT_III_NETWORK_DISABLED", "Network adapters disabled")
-                else:
-                    self.log_event("ACT_III_NETWORK_FAILED", "Failed to disable network adapters")
-        
-        return True
-    
-    def set_guarded_process(self, process_pid, process_name):
-        """Set the process to monitor (Act II)."""
-        self.guarded_process_pid = process_pid
-        self.guarded_process_name = process_name
-        self.log_event("ACT_II_START", f"Monitoring process: {process_name} (PID {process_pid})")
-    
-    def get_running_processes(self):
-        """Get list of user-accessible running processes."""
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name']):
-            try:
-                processes.append((proc.info['pid'], proc.info['name']))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-        return sorted(set(processes), key=lambda x: x[1])  # Remove duplicates, sort by name
-
-class GlazedSensor(threading.Thread):
-    def __init__(self, callback, camera_index=0):
-        super().__init__(daemon=True)
-        self.callback = callback
-        self.camera_index = camera_index
-        self.running = True
-        self.paused = False
-        self.last_gray = None
-        self.motion_free_frames = 0
-        self.motion_frames = 0
-        self.cap = None
-        
-        # Adaptive FPS control (waterfall pattern)
-        self.target_fps = 1          # Start at 1 FPS (idle)
-        self.frame_count = 0
-        self.motion_confidence = 0   # 0.0 to 1.0
-        
-        # Adjustable Params
-        self.sensitivity = 350
-        self.pz_reach = 0.7  
-        self.proximity_min = 50 
-        self.calibration_mode = True
-
-    def run(self):
-        try:
-            # Brio/Windows often require cycling through backends
-            backends = [cv2.CAP_DSHOW, cv2.CAP_MSMF] if sys.platform.startswith('win') else [None]
-            
-            found = False
-            for backend in backends:
-                self.cap = cv2.VideoCapture(self.camera_index, backend) if backend else cv2.VideoCapture(self.camera_index)
-                if self.cap.isOpened():
-                    self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-                    self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-                    ret, _ = self.cap.read()
-                    if ret:
-                        found = True
-                        break
-                self.cap.release()
-                self.cap = None
-            
-            if not found:
-                self.callback(None, False, 0, "CAMERA_FAILED")
-                return
-
-            while self.running:
-                # POWER OPTIMIZATION: Check pause flag and skip entire processing
-                if self.paused:
-                    time.sleep(0.1)  # Sleep while paused, minimal CPU
-                    continue
-
-                ret, frame = self.cap.read()
-                if not ret:
-                    time.sleep(0.5)
-                    continue
-
-                # 1. APPLY PZ REACH (Map the Zone)
-                h, w, _ = frame.shape
-                rw, rh = int(w * self.pz_reach), int(h * self.pz_reach)
-                x1, y1 = (w - rw) // 2, (h - rh) // 2
-                
-                # WATERFALL PATTERN: Quick check first, expensive ops only if needed
-                is_motion = False
-                current_proximity = 0
-                
-                # FAST CHECK (2-3ms): Simple pixel delta comparison
-                cropped_fast = frame[y1:y1+rh, x1:x1+rw]
-                small_fast = cv2.resize(cropped_fast, (40, 30), interpolation=cv2.INTER_LINEAR)
-                gray_fast = cv2.cvtColor(small_fast, cv2.COLOR_BGR2GRAY)
-                gray_fast = cv2.GaussianBlur(gray_fast, (5, 5), 0)
-                
-                if self.last_gray is not None:
-                    # Fast delta check - skip expensive ops 95% of the time
-                    delta = cv2.absdiff(self.last_gray, gray_fast)
-                    quick_motion = np.sum(delta) > 200  # Low threshold for early exit
-                    
-                    # EXPENSIVE CHECK: Only run if fast check passed
-                    if quick_motion:
-                        thresh = cv2.threshold(delta, 25, 255, cv2.THRESH_BINARY)[1]
-                        contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                        if contours:
-                            largest_contour = max(contours, key=cv2.contourArea)
-                            current_proximity = cv2.contourArea(largest_contour)
-                            if current_proximity > (self.proximity_min / 10):
-                                if np.sum(thresh) > self.sensitivity:
-                                    is_motion = True
-                
-                self.last_gray = gray_fast
-                
-                # Update motion confidence for adaptive FPS
-                if is_motion:
-                    self.motion_frames += 1
-                    self.motion_free_frames = 0
-                else:
-                    self.motion_free_frames += 1
-                    if self.motion_free_frames > 30:  # 30 frames without motion
-                        self.motion_frames = 0
-                
-                # Adaptive FPS calculation based on motion
-                if self.motion_frames > 5:
-                    self.target_fps = 16.7      # Active motion: full FPS
-                    self.motion_confidence = 1.0
-                elif self.motion_free_frames < 5:
-                    self.target_fps = 5         # Recent motion: medium FPS
-                    self.motion_confidence = 0.6
-                else:
-                    self.target_fps = 1         # Idle: minimal FPS
-                    self.motion_confidence = 0.1
-                
-                # Render display frame (only in calibration mode) or continue with minimal processing
-                if self.calibration_mode:
-                    display_frame = frame.copy()
-                    cv2.rectangle(display_frame, (x1, y1), (x1+rw, y1+rh), (0, 255, 204), 2)
-                    overlay = display_frame.copy()
-                    cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 0), -1)
-                    cv2.rectangle(overlay, (x1, y1), (x1+rw, y1+rh), (0, 0, 0), -1)
-                    cv2.addWeighted(overlay, 0.6, display_frame, 0.4, 0, display_frame)
-                    processed_frame = cv2.resize(display_frame, (320, 240))
-                else:
-                    # Active Mode: Crop and Glaze only on motion or frequently
-                    if is_motion or self.motion_confidence > 0.5:
-                        cropped = frame[y1:y1+rh, x1:x1+rw]
-                        small = cv2.resize(cropped, (20, 15), interpolation=cv2.INTER_LINEAR)
-                        glazed = cv2.resize(small, (320, 240), interpolation=cv2.INTER_NEAREST)
-                        processed_frame = cv2.GaussianBlur(glazed, (99, 99), 0)
-                    else:
-                        processed_frame = None  # Skip frame generation in idle mode
-                
-                # Stabilization: simpler approach using motion counters
-                stable_trigger = self.motion_frames > 2
-                
-                self.callback(processed_frame, stable_trigger, current_proximity)
-                
-                # Adaptive sleep: vary interval based on target FPS
-                if self.target_fps > 0:
-                    sleep_time = 1.0 / self.target_fps
-                    time.sleep(sleep_time)
-                else:
-                    time.sleep(1.0)
-        except Exception as e:
-            print(f"[Sensor Error] {e}")
-        finally:
-            # Absolutely ensure camera is released with maximum force
-            if self.cap is not None:
-                try:
-                    # Set properties to blank first to force release
-                    self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 0)
-                    self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 0)
-                    self.cap.release()
-                except:
-                    pass
-                finally:
-                    self.cap = None
-
-    def stop(self):
-        """Stop the sensor thread and ensure camera is released."""
-        self.running = False
-        # Daemon thread will be forcefully killed, but attempt cleanup first
-        if self.cap is not None:
-            try:
-                # Set properties to blank first
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 0)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 0)
-                self.cap.release()
-                self.cap = None
-            except:
-                pass
-    
-    def pause(self):
-        """Pause the sensor (reduce CPU to ~0% while keeping thread alive)."""
-        self.paused = True
-    
-    def resume(self):
-        """Resume the sensor from pause."""
-        self.paused = False
-        self.target_fps = 1  # Start at idle FPS when resuming
+from glazed_sensor import GlazedSensor
+from camera_array import CameraArray
+from camera_discovery import CameraDiscovery, CameraParamCache
+from frame_sources import CameraFrameSource
+from frame_mailbox import FrameMailbox
+from motion_zones import MotionZones
+from fps_controller import AdaptiveFpsController
+from vision_worker import ProcessGlazedSensor
+from timer_scheduler import TimerScheduler
+from guardian_mode import HPDManager, GuardianMode
 
 class App:
+    UI_REFRESH_SECONDS = 0.1            # LED pulse, preview and countdown while the window is shown
+    AUDIT_REFRESH_DELAY_SECONDS = 0.25  # Coalesces bursts of audit events into one redraw
+    THREAD_HANDOFF_SECONDS = 5.0        # Worst-case delay, while hidden, for work queued by other threads
+
     def __init__(self, root):
         self.root = root
+        # Every periodic or deadline-driven job is a timer here; Tk is armed for the next one only
+        self.timers = TimerScheduler(self.root.after, self.root.after_cancel, state_label=self._timer_state_label)
+        self._ui_timer = None
+        self._engine_timer = None
+        self._audit_timer = None
+        # Other threads never call Tk or the engine: they queue callbacks that the Tk thread runs
+        # from update_loop while shown and from the always-armed "handoff" timer while hidden
+        self._tk_calls = queue.SimpleQueue()
         
         # Initialize configuration and logging services
         self.config = ConfigService("config.json")
@@ -446,11 +101,22 @@ class App:
             config=self.config,
             logger=self.logger
         )
+        self.guardian.on_event = lambda: self._post_to_tk(self._schedule_audit_refresh)
         self.presence_confidence = 1.0
+        # Without the engine: camera motion decays over the Kitten Buffer (its slider sets the horizon)
+        self.legacy_confidence = PresenceConfidence(45)
+        self.legacy_confidence.observe("start", time.monotonic())
         self.motion_active = False
         self.sensor_error = False
-        self.current_camera_index = 0
+        # Start on the camera that worked last time; discovery fills the selector later
+        self.camera_cache = CameraParamCache()
+        self.camera_discovery = CameraDiscovery()
+        self.camera_devices = []
+        self.current_device_key = self.camera_cache.last_device
+        cached = self.camera_cache.get(self.current_device_key) if self.current_device_key else None
+        self.current_camera_index = cached["index"] if cached else 0
         self.sensor = None
+        self.sensor_mailbox = None  # Sensor thread posts, update_loop takes on the Tk thread
         self.last_prox = 0
         self.icon = None
         self.icon_thread = None
@@ -468,6 +134,9 @@ class App:
         self.hid_monitor = HIDMonitor()
         self.app_awareness = AppAwarenessService()
         self.presence_engine = None  # Will be initialized after sensor starts
+        # Engine events (audit log writes) run on a worker so a slow disk can't stall a tick
+        self.engine_events = EventDispatcher(max_queue=self.config.get_int("eventQueueSize", 256),
+                                             tag="PresenceEngine")
         self.identity_service = None
         self.identity_prompt_active = False
         self.identity_prompt_message = self.config.get_str("identityPromptMessage", "Confirm you're still here")
@@ -481,10 +150,17 @@ class App:
         self.setup_tray()
         self.setup_hotkey()
         self.start_sensor()
+        # The cameras just opened may refuse a second open, so the probe fallback must not need them
+        in_use = {self.current_camera_index, *(int(i) for i in self.config.get_list("cameraIndices"))}
+        self.camera_discovery.start(lambda devices: self._post_to_tk(self._populate_camera_selector, devices),
+                                    in_use=in_use)
         if self.config.get_bool("enableAppAwareness", True):
             self.app_awareness.start()  # Start app awareness service
         self.logger.info("Application initialization complete", "App")
-        self.update_loop()
+        self.update_audit_log_display()
+        self._start_ui_refresh()
+        self._schedule_engine()
+        self.timers.call_every(self.THREAD_HANDOFF_SECONDS, self._run_tk_calls, "handoff")
 
     def setup_hotkey(self):
         """Setup global hotkey for Guardian Mode toggle (Ctrl+Alt+Shift+X)."""
@@ -569,20 +245,20 @@ class App:
         cam_frame = tk.Frame(ctrl, bg="#030303")
         cam_frame.pack(fill="x", pady=(0, 15))
         tk.Label(cam_frame, text="Sensor Input:", fg="#666", bg="#030303", font=("Helvetica", 9)).pack(side="left")
-        self.cam_selector = ttk.Combobox(cam_frame, values=["Camera 0", "Camera 1", "Camera 2", "Camera 3"], state="readonly", width=12)
+        self.cam_selector = ttk.Combobox(cam_frame, values=[f"Camera {self.current_camera_index}"], state="readonly", width=28)
         self.cam_selector.current(0)
         self.cam_selector.bind("<<ComboboxSelected>>", self.on_camera_change)
         self.cam_selector.pack(side="left", padx=10)
 
         tk.Label(ctrl, text="PZ Reach (Crop Background Noise)", fg="#666", bg="#030303", font=("Helvetica", 8)).pack(anchor="w")
         self.reach_scale = tk.Scale(ctrl, from_=0.1, to=1.0, resolution=0.05, orient="horizontal", bg="#030303", fg="#00ffcc", 
-                                   highlightthickness=0, troughcolor="#111")
+                                   highlightthickness=0, troughcolor="#111", command=self._push_sliders)
         self.reach_scale.set(0.7)
         self.reach_scale.pack(fill="x", pady=(0, 10))
 
         tk.Label(ctrl, text="Proximity Floor (Ignore Small Objects)", fg="#666", bg="#030303", font=("Helvetica", 8)).pack(anchor="w")
         self.prox_scale = tk.Scale(ctrl, from_=1, to=200, orient="horizontal", bg="#030303", fg="#00ffcc", 
-                                   highlightthickness=0, troughcolor="#111")
+                                   highlightthickness=0, troughcolor="#111", command=self._push_sliders)
         self.prox_scale.set(50)
         self.prox_scale.pack(fill="x")
         
@@ -611,6 +287,7 @@ class App:
         self.process_var = tk.StringVar(value="None")
         self.process_selector = ttk.Combobox(process_frame, textvariable=self.process_var, state="readonly", width=30)
         self.process_selector.pack(side="left", padx=10, fill="x", expand=True)
+        self.process_selector.bind("<<ComboboxSelected>>", self.on_process_selected)
         self.refresh_processes_btn = ttk.Button(process_frame, text="Refresh", command=self.refresh_process_list)
         self.refresh_processes_btn.pack(side="left", padx=5)
 
@@ -738,7 +415,8 @@ class App:
         """Handle lock trigger from presence engine."""
         self.logger.warning("Lock triggered by presence engine", "PresenceEngine")
         if self.guardian.enabled:
-            self.guardian.act_i_lock_door(0)  # Presence confidence 0 = lock
+            # The engine's confidence has reached 0 at lock_at
+            self.guardian.act_i_lock_door(self.presence_engine.presence_confidence())
     
     def _on_grace_period_started(self):
         """Handle grace period started from presence engine."""
@@ -762,9 +440,11 @@ class App:
         if self.presence_engine:
             self.presence_engine.resume()
             self.guardian.log_event("MEETING_ENDED", "Resumed presence detection")
+            self._schedule_engine()  # Resuming moves the next deadline earlier
 
     def _on_window_minimize(self):
         """Pause sensor when window minimizes to save power."""
+        self._stop_ui_refresh()
         if hasattr(self, 'sensor') and self.sensor:
             try:
                 self.sensor.pause()
@@ -788,6 +468,8 @@ class App:
                 self.presence_engine.resume()
             except:
                 pass
+        self._start_ui_refresh()
+        self._schedule_engine()
 
     def quit_app(self):
         """Shutdown and exit the application."""
@@ -817,6 +499,13 @@ class App:
         # Clean up
         gc.collect()
         time.sleep(0.2)
+        # Wakeup counters for the session, then no more timers (so no more engine events)
+        self.logger.info(f"Timer wakeups: {self.timers.get_stats()}", "Timers")
+        self.timers.stop()
+        # Let queued engine events (audit log) reach disk before the root goes; the worker
+        # only queues Tk callbacks, so draining it cannot wait on this (Tk) thread
+        self.engine_events.stop(timeout=1.0)
+        self.logger.info(f"Engine events: {self.engine_events.get_stats()}", "PresenceEngine")
         # Shutdown gracefully
         try:
             self.root.quit()
@@ -832,17 +521,46 @@ class App:
             # Force cleanup of old sensor before creating new one
             gc.collect()
         self.sensor_error = False
-        self.sensor = GlazedSensor(self.on_sensor_data, camera_index=self.current_camera_index)
+        # Fresh mailbox per sensor so a stopping sensor cannot post into the new one
+        self.sensor_mailbox = FrameMailbox()
+        # Several cameras (e.g. laptop + monitor) fuse into one signal; the selected one previews
+        camera_indices = [int(i) for i in self.config.get_list("cameraIndices")]
+        if len(camera_indices) > 1:
+            ordered = [self.current_camera_index] + [i for i in camera_indices if i != self.current_camera_index]
+            self.sensor = CameraArray(self.sensor_mailbox.post, ordered, source_factory=self._make_camera_source)
+        elif self.config.get_bool("visionWorkerProcess", False):
+            # Capture and analysis in a supervised child process, off this process's GIL
+            self.sensor = ProcessGlazedSensor(self.sensor_mailbox.post, camera_index=self.current_camera_index,
+                                              device_key=self.current_device_key)
+        else:
+            self.sensor = GlazedSensor(self.sensor_mailbox.post, camera_index=self.current_camera_index,
+                                       frame_source=self._make_camera_source(self.current_camera_index))
         
         # Apply configuration values to sensor
         self.sensor.pz_reach = self.config.get_float("pz_reach", 0.7)
         self.sensor.proximity_min = self.config.get_int("proximityMin", 50)
         self.sensor.sensitivity = self.config.get_int("cameraSensitivity", 350)
+        self.sensor.background_model = self.config.get_str("motionBackgroundModel", "last_frame")
+        self.sensor.learning_rate = self.config.get_float("motionLearningRate", 0.05)
+        self.sensor.illumination_compensation = self.config.get_bool("illuminationCompensation", True)
+        self.sensor.zones = MotionZones.from_config(self.config.get_list("motionZones"))
+        self.sensor.fps_controller = AdaptiveFpsController.from_config(
+            self.config.get_list("adaptiveFpsTiers"),
+            energy_budget=self.config.get_int("fpsEnergyBudgetFramesPerHour", 0)
+        )
+        self.sensor.release_on_pause_seconds = self.config.get_float("cameraReleaseOnPauseSeconds", 0)
         
+        camera_on_demand = self.config.get_bool("cameraOnDemand", True)
         if hasattr(self, 'setup_btn') and "RE-ENTER" in self.setup_btn.cget('text'):
             self.sensor.calibration_mode = False
+            if camera_on_demand:
+                # Calibration is done: leave the device closed until the engine needs it
+                self.sensor.power_down()
         self.sensor.start()
-        self.logger.info(f"Camera sensor started (index={self.current_camera_index})", "Sensor")
+        if isinstance(self.sensor, CameraArray):
+            self.logger.info(f"Camera array started (indices={self.sensor.camera_indices})", "Sensor")
+        else:
+            self.logger.info(f"Camera sensor started (index={self.current_camera_index})", "Sensor")
         
         # Initialize PresenceEngine with HID monitor and camera sensor
         timeout = self.config.get_int("lockTimeoutSeconds", 60)
@@ -853,7 +571,11 @@ class App:
             lock_timeout_seconds=timeout,
             warning_threshold_seconds=warning_threshold,
             identity_service=self.identity_service,
-            identity_prompt_message=self.identity_prompt_message
+            identity_prompt_message=self.identity_prompt_message,
+            camera_on_demand=camera_on_demand,
+            camera_prewarm_seconds=self.config.get_float("cameraPrewarmSeconds", 3),
+            identity_timeout_seconds=self.config.get_float("identityTimeoutSeconds", 30),
+            dispatcher=self.engine_events
         )
         
         # Register event handlers
@@ -862,12 +584,45 @@ class App:
         self.presence_engine.on_grace_period_started(self._on_grace_period_started)
         self.presence_engine.on_identity_prompt(self._on_identity_prompt)
         
-        # Register app awareness handlers
-        self.app_awareness.on_meeting_started(self._on_meeting_started)
-        self.app_awareness.on_meeting_stopped(self._on_meeting_stopped)
+        # Register app awareness handlers (fired on its monitor thread, run on the Tk thread)
+        self.app_awareness.on_meeting_started(lambda: self._post_to_tk(self._on_meeting_started))
+        self.app_awareness.on_meeting_stopped(lambda: self._post_to_tk(self._on_meeting_stopped))
+        self._push_sliders()
+        self._schedule_engine()
+
+    def _populate_camera_selector(self, devices):
+        """Fill the camera selector with discovered devices (runs on the Tk thread)."""
+        self.camera_devices = list(devices)
+        if not self.camera_devices:
+            return
+        self.cam_selector.config(values=[device.label for device in self.camera_devices])
+        # Prefer the remembered device even if it re-enumerated under another index
+        position = next((i for i, d in enumerate(self.camera_devices) if d.device_key == self.current_device_key), None)
+        if position is None:
+            position = next((i for i, d in enumerate(self.camera_devices) if d.index == self.current_camera_index), 0)
+        self.cam_selector.current(position)
+        device = self.camera_devices[position]
+        if device.index != self.current_camera_index or device.device_key != self.current_device_key:
+            self.current_camera_index = device.index
+            self.current_device_key = device.device_key
+            self.start_sensor()
+
+    def _make_camera_source(self, camera_index):
+        """Build a camera source that opens with (and records) cached parameters."""
+        device_key = next((d.device_key for d in self.camera_devices if d.index == camera_index), None)
+        if device_key is None and camera_index == self.current_camera_index:
+            device_key = self.current_device_key
+        # Only the selected camera becomes the one reopened at next startup
+        return CameraFrameSource(camera_index, cache=self.camera_cache, device_key=device_key,
+                                 make_last=camera_index == self.current_camera_index)
 
     def on_camera_change(self, event):
-        new_index = self.cam_selector.current()
+        position = self.cam_selector.current()
+        if self.camera_devices:
+            device = self.camera_devices[position]
+            new_index, self.current_device_key = device.index, device.device_key
+        else:
+            new_index = self.current_camera_index
         if new_index != self.current_camera_index:
             self.current_camera_index = new_index
             self.start_sensor()
@@ -880,11 +635,22 @@ class App:
                 self.cal_banner.config(bg="#111")
                 self.cal_label.config(text="PZDetector™ ACTIVE: GLAZED VISION ON", fg="#444", bg="#111")
                 self.refresh_process_list()
+                self._schedule_engine()
             else:
+                if self.presence_engine:
+                    self.presence_engine.wake_camera()  # The preview needs the device open
                 self.setup_btn.config(text="FINISH SETUP & GLAZE")
                 self.cal_banner.config(bg="#00ffcc")
                 self.cal_label.config(text="CALIBRATION MODE: MAP YOUR ZONE", fg="#000", bg="#00ffcc")
 
+    def _drain_sensor_mailbox(self):
+        """Apply the latest sensor output to the UI (Tk thread, once per refresh)."""
+        if self.sensor_mailbox is None:
+            return
+        latest = self.sensor_mailbox.take()
+        if latest is not None:
+            self.on_sensor_data(*latest)
+
     def on_sensor_data(self, frame, motion, proximity, error=None):
         if error == "CAMERA_FAILED":
             self.sensor_error = True
@@ -896,13 +662,30 @@ class App:
             img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
             self.photo = ImageTk.PhotoImage(image=img)
             self.cam_label.config(image=self.photo, text="")
-        if motion: self.motion_active = True
+        if motion:
+            self.motion_active = True
+            self.legacy_confidence.observe("camera", time.monotonic())
+
+    def _post_to_tk(self, callback, *args):
+        """Queue callback(*args) for the Tk thread (safe from any thread)."""
+        self._tk_calls.put((callback, args))
+
+    def _run_tk_calls(self):
+        """Run callbacks queued by other threads (meetings, audit refresh, camera discovery) on the Tk thread."""
+        while True:
+            try:
+                callback, args = self._tk_calls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"[App] {getattr(callback, '__name__', callback)} failed: {e}")
 
     def update_loop(self):
-        if self.sensor:
-            self.sensor.pz_reach = self.reach_scale.get()
-            self.sensor.proximity_min = self.prox_scale.get()
-        
+        """Window refresh: preview, depth score, LED pulse, status (the "ui" timer while shown)."""
+        self._run_tk_calls()
+        self._drain_sensor_mailbox()
         self.prox_var.set(f"DEPTH SCORE: {int(self.last_prox)} / TARGET: {int(self.prox_scale.get()/10)}")
 
         t = time.time()
@@ -914,36 +697,37 @@ class App:
         else:
             led_color = '#001a33'  # Dim cyan when no confidence
         self.led_canvas.itemconfig(self.led_dot, fill=led_color)
+        self._refresh_status()
 
+    def _refresh_status(self):
+        """Apply the presence engine state (or legacy decay) to status, tray icon and sleep inhibition."""
         current_icon = self.icon.icon
         new_icon_name = 'empty'
 
         # === NEW: Presence Engine Waterfall Detection ===
         if self.presence_engine and not (self.sensor and self.sensor.calibration_mode):
-            # Tick the presence engine (stage 1: HID check, stage 2+: camera if needed)
-            self.presence_engine.tick()
-            
-            # Update UI based on presence engine state
+            # Update UI based on presence engine state; confidence is the engine's closed-form value
             engine_state = self.presence_engine.current_state
+            self.presence_confidence = self.presence_engine.presence_confidence()
             
             if engine_state == PresenceState.ACTIVE:
                 self.status_var.set(f"ACTIVE - {self.presence_engine.seconds_remaining}s")
                 new_icon_name = 'active'
                 self.hpd.inhibit_sleep()
-                self.presence_confidence = 1.0
                 self.identity_prompt_active = False
                 if self.grace_visible:
                     self.grace_banner.pack_forget()
                     self.grace_visible = False
             
             elif engine_state == PresenceState.WARNING:
+                # The prompt runs off the Tk thread; the countdown keeps going meanwhile
+                self.identity_prompt_active = self.presence_engine.identity_pending
                 if self.identity_prompt_active:
                     self.status_var.set("Windows Hello verification required")
                 else:
                     self.status_var.set(f"⚠ WARNING - {self.presence_engine.seconds_remaining}s until lock")
                 new_icon_name = 'warning'
                 self.hpd.inhibit_sleep()
-                self.presence_confidence = 0.5
                 if not self.grace_visible:
                     self.grace_banner.pack(fill="x", padx=60, pady=(0, 10))
                     self.grace_visible = True
@@ -958,7 +742,6 @@ class App:
                 self.status_var.set("🔒 LOCKED")
                 new_icon_name = 'locked'
                 self.hpd.allow_sleep()
-                self.presence_confidence = 0.0
                 self.identity_prompt_active = False
                 if self.grace_visible:
                     self.grace_banner.pack_forget()
@@ -968,7 +751,6 @@ class App:
                 pause_display = self.presence_engine.get_state_display()
                 self.status_var.set(f"⏸ {pause_display}")
                 new_icon_name = 'paused'
-                self.presence_confidence = 0.5
                 self.identity_prompt_active = False
                 if self.grace_visible:
                     self.grace_banner.pack_forget()
@@ -988,14 +770,13 @@ class App:
                 self.grace_banner.pack_forget()
                 self.grace_visible = False
         elif self.motion_active:
-            self.presence_confidence = 1.0
+            self.presence_confidence = self._legacy_confidence_now()
             self.hpd.inhibit_sleep()
             self.status_var.set("PRESENCE CONFIRMED")
             self.motion_active = False
             new_icon_name = 'active'
         else:
-            decay = 0.1 / self.buffer_scale.get()
-            self.presence_confidence = max(0, self.presence_confidence - decay)
+            self.presence_confidence = self._legacy_confidence_now()
             
             # === GUARDIAN MODE ACT I: Lock when confidence reaches 0 ===
             if self.guardian.enabled and self.presence_confidence <= 0:
@@ -1026,15 +807,66 @@ class App:
             self.icon.icon = self.icons[new_icon_name]
 
         self.progress['value'] = self.presence_confidence * 100
-        
-        # Update process selection binding
-        self.process_selector.bind("<<ComboboxSelected>>", self.on_process_selected)
-        
-        # Update audit log every ~1 second
-        self.update_audit_log_display()
 
-        
-        self.root.after(100, self.update_loop)
+    def _legacy_confidence_now(self):
+        """Engine-less confidence: last camera motion decayed over the Kitten Buffer, whenever this runs."""
+        self.legacy_confidence.horizon_seconds = self.buffer_scale.get()
+        return self.legacy_confidence.confidence(time.monotonic())
+
+    def _push_sliders(self, _value=None):
+        """Send the PZ Reach / Proximity Floor sliders to the sensor (on change, not every refresh)."""
+        if self.sensor:
+            self.sensor.pz_reach = self.reach_scale.get()
+            self.sensor.proximity_min = self.prox_scale.get()
+
+    def _timer_state_label(self):
+        """State the timer wakeup counters are charged to, e.g. "active/hidden"."""
+        if self.sensor and self.sensor.calibration_mode:
+            state = "calibrating"
+        elif self.presence_engine:
+            state = self.presence_engine.current_state.value
+        else:
+            state = "starting"
+        return f"{state}/{'shown' if self._ui_timer else 'hidden'}"
+
+    def _start_ui_refresh(self):
+        """Animate the window only while it is visible."""
+        if self._ui_timer is None:
+            self._ui_timer = self.timers.call_every(self.UI_REFRESH_SECONDS, self.update_loop, "ui", first_delay=0)
+
+    def _stop_ui_refresh(self):
+        self.timers.cancel(self._ui_timer)
+        self._ui_timer = None
+
+    def _schedule_engine(self):
+        """
+        Arm the engine timer for its next transition.
+
+        Call again whenever something may have moved the engine's deadlines
+        earlier (resume, end of calibration, new sensor); input only moves
+        them later, which the engine handles by re-planning when it fires.
+        """
+        if not self.presence_engine or (self.sensor and self.sensor.calibration_mode):
+            self.timers.cancel(self._engine_timer)
+            return
+        deadline = self.presence_engine.next_transition_time()
+        if self._engine_timer is None:
+            self._engine_timer = self.timers.call_at(deadline, self._on_engine_timer, "engine")
+        else:
+            self.timers.reschedule(self._engine_timer, deadline)
+
+    def _on_engine_timer(self):
+        """Tick the presence engine (stage 1: HID check, stage 2+: camera if needed) when it is due."""
+        if self.presence_engine and not (self.sensor and self.sensor.calibration_mode):
+            self.presence_engine.tick()
+            self._refresh_status()
+        self._schedule_engine()
+
+    def _schedule_audit_refresh(self):
+        """Redraw the audit log shortly after new events (Tk thread)."""
+        if self._audit_timer is None or not self._audit_timer.active:
+            self._audit_timer = self.timers.call_later(self.AUDIT_REFRESH_DELAY_SECONDS,
+                                                       self.update_audit_log_display, "audit_log")
 
     def update_license_status(self):
         """Update license status display."""
@@ -1270,6 +1102,8 @@ class App:
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()  # Vision worker process in frozen builds
     root = tk.Tk()
     app = App(root)
     root.mainloop()
@@ -0,0 +1,161 @@
+"""
+Motion History - Lock-free ring buffer of timestamped motion samples
+
+GlazedSensor used to expose only its latest motion_confidence, so
+PresenceEngine's answer depended on whichever frame happened to come last.
+The sensor now also appends one sample per analyzed frame (timestamp, score,
+proximity, motion flag) to a fixed-size, numpy-backed ring. The engine asks
+windowed questions instead: "max score in the last 3 s" (O(window)) or
+"fraction of motion frames since the warning started" (O(1), via a running
+motion count stored with each sample).
+
+Concurrency: exactly one writer (the sensor) and any number of readers, no
+locks. The writer fills a slot and only then advances the sequence counter,
+so readers never see a half-written sample. A reader that lags by a full
+ring re-checks the counter and drops samples that were overwritten meanwhile.
+
+Cost: ~12 KB per sensor at the default capacity, a few field writes per frame
+Benefit: Presence decisions over a time window instead of a single frame
+"""
+
+import time
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_CAPACITY = 512  # ~30 s at full rate, ~8 min at the idle 1 FPS tier
+
+
+class MotionHistory:
+    """
+    Single-writer ring buffer of motion samples.
+
+    Sequence numbers count every sample ever written (starting at 0); the
+    ring keeps the last `capacity` of them.
+
+    Attributes:
+        capacity (int): Number of samples retained
+        sequence (int): Sequence number the next sample will get
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, clock=time.monotonic):
+        self.capacity = capacity
+        self.clock = clock
+        self._timestamps = np.zeros(capacity, np.float64)
+        self._scores = np.zeros(capacity, np.float32)
+        self._proximity = np.zeros(capacity, np.float32)
+        self._motion = np.zeros(capacity, np.bool_)
+        # Motion samples written up to and including each slot
+        self._motion_total = np.zeros(capacity, np.int64)
+        self._total_motion = 0
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return min(self.sequence, self.capacity)
+
+    def record(self, score: float, proximity: float = 0.0, motion: bool = False,
+               timestamp: Optional[float] = None) -> None:
+        """
+        Append one sample (writer thread only).
+
+        Args:
+            score: Motion confidence for this frame (0.0-1.0)
+            proximity: Largest contour area seen in this frame
+            motion: Whether this frame passed the motion test
+            timestamp: Sample time on the history's clock (default: now)
+        """
+        slot = self.sequence % self.capacity
+        if motion:
+            self._total_motion += 1
+        self._timestamps[slot] = self.clock() if timestamp is None else timestamp
+        self._scores[slot] = score
+        self._proximity[slot] = proximity
+        self._motion[slot] = motion
+        self._motion_total[slot] = self._total_motion
+        # Publish only after the slot is complete
+        self.sequence += 1
+
+    def latest(self) -> Optional[Tuple[float, float, float, bool]]:
+        """Return the newest sample as (timestamp, score, proximity, motion), or None."""
+        end = self.sequence
+        if end == 0:
+            return None
+        slot = (end - 1) % self.capacity
+        return (float(self._timestamps[slot]), float(self._scores[slot]),
+                float(self._proximity[slot]), bool(self._motion[slot]))
+
+    def _first_since(self, since: float, end: int) -> int:
+        """Sequence number of the first retained sample with timestamp >= since (binary search)."""
+        lo, hi = max(0, end - self.capacity), end
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._timestamps[mid % self.capacity] < since:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _window(self, values: np.ndarray, start: int, end: int) -> np.ndarray:
+        """Samples [start, end) of one field as at most two ring segments joined."""
+        a, b = start % self.capacity, end % self.capacity
+        if end - start == 0:
+            return values[:0]
+        if a < b:
+            return values[a:b]
+        return np.concatenate((values[a:], values[:b]))
+
+    def _stable_start(self, start: int) -> int:
+        """Drop samples the writer may have overwritten while we were reading."""
+        return max(start, self.sequence - self.capacity)
+
+    def max_score(self, window_seconds: float, now: Optional[float] = None) -> float:
+        """
+        Highest motion score in the last window_seconds (0.0 if none).
+
+        Args:
+            window_seconds: Look-back window
+            now: Reference time on the history's clock (default: now)
+        """
+        end = self.sequence
+        now = self.clock() if now is None else now
+        start = self._first_since(now - window_seconds, end)
+        scores = self._window(self._scores, start, end)
+        best = float(scores.max()) if scores.size else 0.0
+        if self._stable_start(start) != start:
+            # Lapped by the writer mid-read: retry on the fresh ring
+            return self.max_score(window_seconds, now)
+        return best
+
+    def motion_fraction(self, window_seconds: float, now: Optional[float] = None) -> float:
+        """Fraction of samples in the last window_seconds that were motion frames."""
+        end = self.sequence
+        now = self.clock() if now is None else now
+        return self.motion_fraction_since(self._first_since(now - window_seconds, end), end)
+
+    def motion_fraction_since(self, start_sequence: int, end: Optional[int] = None) -> float:
+        """
+        Fraction of motion frames among samples from start_sequence on, in O(1).
+
+        Args:
+            start_sequence: e.g. history.sequence captured when a warning began
+            end: Stop before this sequence number (default: everything so far)
+
+        Returns:
+            float: 0.0-1.0, or 0.0 if no samples were written since
+        """
+        end = self.sequence if end is None else end
+        start = max(start_sequence, end - self.capacity)
+        if end <= start:
+            return 0.0
+        before = 0
+        if start > 0 and start > end - self.capacity:
+            before = int(self._motion_total[(start - 1) % self.capacity])
+        else:
+            # Oldest retained sample: derive the count before it from its own flag
+            slot = start % self.capacity
+            before = int(self._motion_total[slot]) - int(self._motion[slot])
+        total = int(self._motion_total[(end - 1) % self.capacity])
+        if self._stable_start(start) != start:
+            return self.motion_fraction_since(start_sequence)
+        return (total - before) / (end - start)
@@ -0,0 +1,173 @@
+"""
+Motion Zones - Per-region motion scoring inside the Presence Zone
+
+GlazedSensor reduces the Presence Zone to one 40x30 motion mask. Motion zones
+split that mask into named regions (a grid, or polygons drawn over the zone)
+rasterized once to 40x30 masks. Every zone is scored in a single matrix-vector
+product over the flattened mask, so the per-frame cost does not grow with a
+Python loop over zones.
+
+Each zone either counts towards presence with its own threshold or is
+ignored (a window, a doorway, a screen saver on a second monitor): ignored
+pixels are removed before the presence decision, so motion there can no
+longer trigger it.
+
+Coordinates are normalized (0.0-1.0) to the Presence Zone, so zones follow
+the PZ Reach slider and any capture resolution.
+"""
+
+from typing import List, Optional, Sequence
+
+import cv2
+import numpy as np
+
+
+MASK_SIZE = (40, 30)  # (width, height) of GlazedSensor's motion mask
+
+
+class MotionZone:
+    """
+    One named region of the motion mask.
+
+    Attributes:
+        name (str): Label used in stats and logs
+        mask (np.ndarray): 30x40 uint8 mask (255 inside the zone)
+        threshold (int, optional): Motion sum (in 255-valued mask units, like
+            GlazedSensor.sensitivity) the zone needs to count as motion.
+            None uses the sensor's sensitivity.
+        ignore (bool): Motion in this zone never counts
+    """
+
+    def __init__(self, name: str, mask: np.ndarray, threshold: Optional[int] = None, ignore: bool = False):
+        self.name = name
+        self.mask = mask
+        self.threshold = threshold
+        self.ignore = ignore
+
+    @classmethod
+    def from_polygon(cls, name: str, points: Sequence[Sequence[float]], size=MASK_SIZE, **kwargs) -> "MotionZone":
+        """Rasterize a polygon given in normalized zone coordinates."""
+        width, height = size
+        mask = np.zeros((height, width), np.uint8)
+        pts = np.array([[x * width, y * height] for x, y in points], np.float32)
+        cv2.fillPoly(mask, [np.round(pts).astype(np.int32)], 255)
+        return cls(name, mask, **kwargs)
+
+    @classmethod
+    def from_rect(cls, name: str, rect: Sequence[float], size=MASK_SIZE, **kwargs) -> "MotionZone":
+        """Build a zone from a normalized (x1, y1, x2, y2) rectangle."""
+        width, height = size
+        x1, y1, x2, y2 = rect
+        mask = np.zeros((height, width), np.uint8)
+        mask[int(round(y1 * height)):int(round(y2 * height)), int(round(x1 * width)):int(round(x2 * width))] = 255
+        return cls(name, mask, **kwargs)
+
+
+class MotionZones:
+    """
+    A set of MotionZones scored together.
+
+    Attributes:
+        zones (list): MotionZone entries, in score order
+        scores (np.ndarray): Changed-pixel count per zone from the last score() call
+        include_mask (np.ndarray): 30x40 uint8 mask of pixels that may trigger
+            presence (everything except ignored zones)
+    """
+
+    def __init__(self, zones: List[MotionZone], size=MASK_SIZE):
+        if not zones:
+            raise ValueError("MotionZones needs at least one zone")
+        width, height = size
+        self.zones = list(zones)
+        # One 0/1 row per zone: a single matmul with the flattened mask scores them all
+        self._matrix = np.stack([z.mask.reshape(-1) != 0 for z in self.zones]).astype(np.float32)
+        self._flat = np.empty(width * height, np.float32)
+        self.scores = np.zeros(len(self.zones), np.float32)
+
+        ignored = np.zeros((height, width), np.bool_)
+        for zone in self.zones:
+            if zone.ignore:
+                ignored |= zone.mask != 0
+        self.include_mask = np.where(ignored, 0, 255).astype(np.uint8)
+        self.has_ignored = bool(ignored.any())
+        self._counted = np.array([not z.ignore for z in self.zones])
+        self._thresholds = np.zeros(len(self.zones), np.float32)
+        self._hits = np.zeros(len(self.zones), np.bool_)
+        self._sensitivity = None
+
+    @classmethod
+    def grid(cls, cols: int, rows: int, size=MASK_SIZE, threshold: Optional[int] = None) -> "MotionZones":
+        """Split the Presence Zone into a cols x rows grid of zones."""
+        zones = []
+        for r in range(rows):
+            for c in range(cols):
+                rect = (c / cols, r / rows, (c + 1) / cols, (r + 1) / rows)
+                zones.append(MotionZone.from_rect(f"r{r}c{c}", rect, size, threshold=threshold))
+        return cls(zones, size)
+
+    @classmethod
+    def from_config(cls, entries: Sequence[dict], size=MASK_SIZE) -> Optional["MotionZones"]:
+        """
+        Build zones from the "motionZones" config list.
+
+        Each entry is one of:
+            {"name": "door", "polygon": [[x, y], ...], "ignore": true}
+            {"name": "desk", "rect": [x1, y1, x2, y2], "threshold": 500}
+            {"grid": [cols, rows], "threshold": 350}
+
+        Returns:
+            MotionZones or None if the list is empty or has no usable entries
+        """
+        zones: List[MotionZone] = []
+        for i, entry in enumerate(entries or []):
+            try:
+                name = entry.get("name", f"zone{i}")
+                kwargs = {"threshold": entry.get("threshold"), "ignore": bool(entry.get("ignore", False))}
+                if "grid" in entry:
+                    cols, rows = entry["grid"]
+                    zones.extend(cls.grid(int(cols), int(rows), size, kwargs["threshold"]).zones)
+                elif "polygon" in entry:
+                    zones.append(MotionZone.from_polygon(name, entry["polygon"], size, **kwargs))
+                elif "rect" in entry:
+                    zones.append(MotionZone.from_rect(name, entry["rect"], size, **kwargs))
+                else:
+                    print(f"[MotionZones] Skipping zone {i}: needs grid, polygon or rect")
+            except (TypeError, ValueError, AttributeError) as e:
+                print(f"[MotionZones] Skipping zone {i}: {e}")
+        return cls(zones, size) if zones else None
+
+    def score(self, thresh: np.ndarray) -> np.ndarray:
+        """
+        Count changed pixels per zone in one pass.
+
+        Args:
+            thresh (np.ndarray): 30x40 binary (0/255) motion mask
+
+        Returns:
+            np.ndarray: Changed-pixel count per zone (valid until the next call)
+        """
+        np.copyto(self._flat, thresh.reshape(-1))
+        np.matmul(self._matrix, self._flat, out=self.scores)
+        # Sums of 255s are exact in float32 and so is dividing them back
+        np.divide(self.scores, 255.0, out=self.scores)
+        return self.scores
+
+    def triggered(self, sensitivity: int) -> bool:
+        """
+        Check whether any counted zone passed its threshold on the last score().
+
+        Args:
+            sensitivity: Default threshold for zones without their own
+        """
+        if sensitivity != self._sensitivity:
+            # Thresholds only change with the sensitivity slider; stored in pixels
+            self._thresholds[:] = [(sensitivity if z.threshold is None else z.threshold) / 255.0
+                                   for z in self.zones]
+            self._sensitivity = sensitivity
+        np.greater(self.scores, self._thresholds, out=self._hits)
+        self._hits &= self._counted
+        return bool(self._hits.any())
+
+    def clear(self) -> None:
+        """Reset scores for a frame that never reached the expensive check."""
+        self.scores.fill(0.0)
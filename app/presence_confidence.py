@@ -0,0 +1,116 @@
+"""
+Presence Confidence - Closed-form confidence from the last evidence per source
+
+Presence confidence used to exist twice: the legacy refresh subtracted
+0.1 / buffer on every 100 ms call (so the decay speed depended on how often
+the window refreshed), and the engine path mapped states to 1.0/0.5/0.0.
+Now each source (HID, camera, identity, ...) records when it last saw the
+user and how much that is worth, and confidence is evaluated at any query
+time:
+
+    c_s(t) = weight_s * exp(-(t - last_seen_s) / tau)   while t - last_seen_s < horizon
+    c(t)   = max over sources of c_s(t)
+
+The strongest source wins rather than a noisy-OR: two sources that saw the
+same moment are one piece of evidence, not two. tau is chosen so a source
+has decayed to EMPTY_FLOOR at the horizon, where it drops to 0. With the
+engine's lock timeout as the horizon, confidence reaches 0 exactly when the
+countdown locks; the UI, Guardian Act I and the engine all read the same
+number however rarely they poll.
+
+Cost: One exp() per source per query
+Benefit: Confidence no longer depends on refresh rate
+"""
+
+import math
+from typing import Dict, Optional, Tuple
+
+
+EMPTY_FLOOR = 0.05  # Confidence left at the horizon; from there on it reads 0
+
+
+class PresenceConfidence:
+    """
+    Exponentially decaying confidence from timestamped evidence.
+
+    Args:
+        horizon_seconds: Age at which evidence stops counting (e.g. the lock
+            timeout or the Kitten Buffer)
+
+    Attributes:
+        horizon_seconds (float): See Args; may be changed at any time
+    """
+
+    def __init__(self, horizon_seconds: float):
+        self.horizon_seconds = horizon_seconds
+        self._evidence: Dict[str, Tuple[float, float]] = {}  # source -> (last_seen, weight)
+
+    @property
+    def tau_seconds(self) -> float:
+        """Decay time constant: exp(-horizon / tau) == EMPTY_FLOOR."""
+        return self.horizon_seconds / math.log(1.0 / EMPTY_FLOOR)
+
+    def observe(self, source: str, timestamp: float, weight: float = 1.0) -> None:
+        """
+        Record presence evidence.
+
+        Older evidence than what the source already reported is ignored.
+
+        Args:
+            source: Evidence name, e.g. a provider name
+            timestamp: When the user was seen (same clock as the queries)
+            weight: Confidence of the evidence when fresh (0-1)
+        """
+        previous = self._evidence.get(source)
+        if previous is None or timestamp >= previous[0]:
+            self._evidence[source] = (timestamp, max(0.0, min(1.0, weight)))
+
+    def clear(self) -> None:
+        """Forget all evidence (confidence reads 0 until the next observe())."""
+        self._evidence.clear()
+
+    def source_confidence(self, source: str, now: float) -> float:
+        """Decayed confidence from one source at time now."""
+        evidence = self._evidence.get(source)
+        if evidence is None:
+            return 0.0
+        last_seen, weight = evidence
+        # Same expression as the engine's lock_at: now - last_seen < horizon can hold
+        # in floating point at the very instant the countdown locks
+        if now >= last_seen + self.horizon_seconds:
+            return 0.0
+        age = max(0.0, now - last_seen)
+        return weight * math.exp(-age / self.tau_seconds)
+
+    def confidence(self, now: float) -> float:
+        """
+        Confidence that someone is present at time now (strongest source).
+
+        Returns:
+            float: 0-1; exactly 0 once every source is older than the horizon
+        """
+        return max((self.source_confidence(source, now) for source in self._evidence), default=0.0)
+
+    def last_evidence(self) -> Optional[float]:
+        """Timestamp of the most recent evidence from any source."""
+        return max((seen for seen, _ in self._evidence.values()), default=None)
+
+    def empty_at(self) -> Optional[float]:
+        """Time at which confidence reaches 0 without new evidence."""
+        last = self.last_evidence()
+        return None if last is None else last + self.horizon_seconds
+
+    def get_stats(self, now: float) -> dict:
+        """
+        Per-source breakdown.
+
+        Returns:
+            dict: confidence, and per source age_seconds and confidence
+        """
+        return {
+            "confidence": self.confidence(now),
+            "sources": {
+                source: {"age_seconds": now - seen, "confidence": self.source_confidence(source, now)}
+                for source, (seen, _) in self._evidence.items()
+            },
+        }
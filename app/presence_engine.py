@@ -6,18 +6,56 @@ Orchestrates the three-stage sensor fusion waterfall:
 2. Camera (motion) - Only when HID suggests absence
 3. Network/locks - Only when all sensors confirm absence
 
+Stages 1 and 2 are PresenceProviders (presence_providers.py), consulted
+cheapest-first and fused until presence is established; more providers
+can be added without changing tick().
+
 State machine:
   ACTIVE (Green)    -> Countdown > 10s, HID only
   WARNING (Yellow)  -> Countdown 1-10s, HID + Camera
   LOCKING (Red)     -> Instant, executing lock
   PAUSED (Gray)     -> User paused detection
+
+Timing: the countdown is a pair of monotonic deadlines (warning_at, lock_at)
+measured from the last input or camera confirmation, so the state depends on
+elapsed time, not on how often tick() is called. next_transition_time() tells
+the caller when the state can next change.
+
+Camera power (camera_on_demand): the engine opens the camera a few seconds
+before WARNING (prewarm, long enough to cover the measured open latency) and
+closes it again on fresh HID input, on pause, and after a lock.
+
+Confidence: every event that restarts the countdown (input, a camera
+confirmation, a verified identity, resume) is also recorded as timestamped
+evidence in a PresenceConfidence (presence_confidence.py) whose horizon is
+the lock timeout. presence_confidence() evaluates it in closed form, so the
+UI and Guardian read a number that reaches 0 exactly at lock_at.
+
+Events: handlers run through an EventDispatcher (event_dispatcher.py).
+Lock handlers are called inline, in the tick that decided the lock; state,
+grace period and identity prompt events are posted and, with a queued
+dispatcher (App), delivered in order on a worker thread. The default
+dispatcher is synchronous.
+
+Identity (Windows Hello): entering WARNING requests a verification and
+returns immediately; the countdown keeps running while the prompt is open.
+An answer that arrived before lock_at restarts the countdown from the
+moment it arrived; a decline, a timeout or the lock itself drops it.
 """
 
+import math
+import time
+from concurrent.futures import Future
 from enum import Enum
-from datetime import datetime, timedelta
-from typing import Callable, Optional
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
 from dataclasses import dataclass
 
+from event_dispatcher import EventDispatcher
+from presence_confidence import PresenceConfidence
+from presence_providers import (PASSIVE_COST, CameraPresenceProvider, HIDPresenceProvider,
+                                PresenceProvider, fuse)
+
 
 class PresenceState(Enum):
     """Presence detection state."""
@@ -45,6 +83,11 @@ class PresenceEngine:
     # Default configuration
     DEFAULT_LOCK_TIMEOUT_SECONDS = 60
     WARNING_THRESHOLD_SECONDS = 10
+    PRESENCE_THRESHOLD = 0.5            # Fused probability that counts as presence
+    CAMERA_PREWARM_SECONDS = 3          # Open the camera this long before WARNING
+    POLL_SECONDS = 1.0                  # Re-check cadence while the camera is in play
+    IDENTITY_TIMEOUT_SECONDS = 30       # Stop waiting for a Windows Hello answer after this
+    PAUSED_CONFIDENCE = 0.5             # Detection off: neither present nor absent
     
     def __init__(
         self,
@@ -53,7 +96,14 @@ class PresenceEngine:
         lock_timeout_seconds: int = DEFAULT_LOCK_TIMEOUT_SECONDS,
         warning_threshold_seconds: int = WARNING_THRESHOLD_SECONDS,
         identity_service=None,
-        identity_prompt_message: str = "Confirm you're still here"
+        identity_prompt_message: str = "Confirm you're still here",
+        camera_on_demand: bool = False,
+        camera_prewarm_seconds: float = CAMERA_PREWARM_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        identity_timeout_seconds: float = IDENTITY_TIMEOUT_SECONDS,
+        providers: Optional[List[PresenceProvider]] = None,
+        wall_clock: Callable[[], datetime] = datetime.now,
+        dispatcher: Optional[EventDispatcher] = None
     ):
         """
         Initialize the Presence Engine.
@@ -62,20 +112,66 @@ class PresenceEngine:
             hid_monitor: HIDMonitor instance
             camera_sensor: GlazedSensor or similar camera sensor instance
             lock_timeout_seconds: Seconds until lock if idle
+            camera_on_demand: Power the camera up and down with the countdown
+                (sensor needs power_up()/power_down())
+            camera_prewarm_seconds: Minimum lead before WARNING to open the camera
+            clock: Monotonic time source in seconds (deadlines use this clock)
+            identity_timeout_seconds: Give up on an unanswered identity prompt after this
+            providers: Extra presence providers, besides the HID and camera
+                ones built from hid_monitor and camera_sensor
+            wall_clock: Date/time source for StateChangeEvent timestamps
+            dispatcher: Delivers events to handlers (default: synchronous,
+                inline in tick()); lock handlers are always called inline
         """
         self.hid_monitor = hid_monitor
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self.dispatcher = dispatcher or EventDispatcher(synchronous=True, tag="PresenceEngine")
         self.camera_sensor = camera_sensor
         self.lock_timeout_seconds = lock_timeout_seconds
         self.warning_threshold_seconds = warning_threshold_seconds
         self.identity_service = identity_service
         self.identity_prompt_message = identity_prompt_message
         self._identity_checked = False
+        self.identity_timeout_seconds = identity_timeout_seconds
+        self._identity_future: Optional[Future] = None
+        self._identity_requested_at = 0.0
+        self._identity_answered_at: Optional[float] = None
+        self.identity_requests = 0
+        self.identity_verified = 0
+        self.identity_declined = 0  # Declined, failed, or verified only after lock_at
+        self.identity_timeouts = 0
+
+        # Presence providers, cheapest first
+        self._providers: List[PresenceProvider] = []
+        self.provider_consults: Dict[str, int] = {}
+        self.provider_established: Dict[str, int] = {}  # Times a provider's reading settled presence
+        self.presence_probability = 0.0  # Fused probability from the last consultation
+        self._camera_provider = CameraPresenceProvider(camera_sensor) if camera_sensor else None
+        if hid_monitor:
+            self.add_provider(HIDPresenceProvider(hid_monitor))
+        if self._camera_provider:
+            self.add_provider(self._camera_provider)
+        for provider in providers or []:
+            self.add_provider(provider)
+
+        # On-demand camera power
+        self.camera_on_demand = camera_on_demand
+        self.camera_prewarm_seconds = camera_prewarm_seconds
+        self._camera_powered: Optional[bool] = None  # Unknown until the first decision
+        self._camera_powered_at: Optional[float] = None
+        self._passive_present = False  # A free provider (HID input) says present right now
+        self._camera_confirmed = False  # An escalated provider saw presence since the last HID input
+        self.camera_power_ups = 0
+        self.cold_warnings = 0  # Warnings entered before the camera delivered a frame
         
         # State management
         self._current_state = PresenceState.ACTIVE
-        self._seconds_remaining = lock_timeout_seconds
-        self._pause_until: Optional[datetime] = None
-        self._state_entered_at = datetime.now()
+        self._countdown_from = clock()  # Last input or camera confirmation
+        self.confidence_model = PresenceConfidence(lock_timeout_seconds)
+        self.confidence_model.observe("start", self._countdown_from)
+        self._pause_until: Optional[float] = None
+        self._state_entered_at = self._wall_clock()
         
         # Event handlers
         self._state_changed_handlers = []
@@ -88,11 +184,28 @@ class PresenceEngine:
         """Get current state."""
         return self._current_state
     
+    @property
+    def lock_at(self) -> float:
+        """Clock time at which the screen locks if nothing intervenes."""
+        return self._countdown_from + self.lock_timeout_seconds
+
+    @property
+    def warning_at(self) -> float:
+        """Clock time at which the WARNING grace period starts."""
+        return self.lock_at - self.warning_threshold_seconds
+
     @property
     def seconds_remaining(self) -> int:
-        """Get seconds until lock."""
-        return self._seconds_remaining
+        """Get seconds until lock (whole seconds, rounded up)."""
+        if self._current_state == PresenceState.PAUSED:
+            return self.lock_timeout_seconds
+        return max(0, math.ceil(self.lock_at - self._clock()))
     
+    @property
+    def identity_pending(self) -> bool:
+        """True while a Windows Hello prompt is open and not yet answered."""
+        return self._identity_future is not None and not self._identity_future.done()
+
     @property
     def is_paused(self) -> bool:
         """Check if detection is paused."""
@@ -114,85 +227,321 @@ class PresenceEngine:
         """Register handler for identity prompt events."""
         self._identity_prompt_handlers.append(handler)
     
-    def tick(self):
+    def tick(self, now: Optional[float] = None):
         """
-        Called every second to update presence detection.
-        Implements the waterfall pattern with proper state transitions.
+        Update presence detection at the current time.
+
+        Implements the waterfall pattern with proper state transitions. The
+        state follows from deadlines, so calling this more or less often only
+        changes how promptly transitions are noticed (see next_transition_time()).
+
+        Args:
+            now: Clock time to evaluate at (default: the engine's clock)
         """
+        now = self._clock() if now is None else now
+        self._tick(now)
+        if self.camera_on_demand:
+            self._set_camera_power(self._camera_wanted(now))
+
+    def _tick(self, now: float):
         # Handle pause mode
         if self._current_state == PresenceState.PAUSED:
-            if self._pause_until and datetime.now() >= self._pause_until:
+            if self._pause_until is not None and now >= self._pause_until:
+                self._pause_until = None
+                self._note_evidence("resume", now)
                 self._set_state(PresenceState.ACTIVE)
-                self._seconds_remaining = self.lock_timeout_seconds
             return
         
-        # Stage 1: HID Check (always active, negligible cost)
-        idle_seconds = self.hid_monitor.get_idle_seconds()
-        
-        if idle_seconds < 1.0:
-            # User is active - reset timer
-            if self._seconds_remaining != self.lock_timeout_seconds:
-                self._seconds_remaining = self.lock_timeout_seconds
-                if self._current_state != PresenceState.ACTIVE:
-                    self._set_state(PresenceState.ACTIVE)
+        # Stage 1: passive providers (HID: always active, negligible cost)
+        absent = self._consult(now, escalated=False)
+        self._passive_present = 1.0 - absent >= self.PRESENCE_THRESHOLD
+        if self._passive_present:
+            self._camera_confirmed = False
             self._identity_checked = False
-            return
-        
-        # User has been idle, decrement countdown
-        self._seconds_remaining -= 1
+        # An identity answer counts from when it arrived, not from this tick
+        self._poll_identity(now)
         
         # Check for state transitions
-        if self._seconds_remaining <= 0:
+        if now >= self.lock_at:
             # Time to lock!
+            self._drop_identity()
             self._set_state(PresenceState.LOCKING)
             self._trigger_lock()
             # Reset after lock
-            self._seconds_remaining = self.lock_timeout_seconds
+            self._countdown_from = now
+            self._camera_confirmed = False
             self._set_state(PresenceState.ACTIVE)
         
-        elif self._seconds_remaining <= self.warning_threshold_seconds:
+        elif now >= self.warning_at:
             # Entering warning state - time for expensive sensor checks
             if self._current_state == PresenceState.ACTIVE:
                 if self.identity_service and not self._identity_checked:
-                    if hasattr(self.identity_service, "is_available") and not self.identity_service.is_available():
-                        self._identity_checked = True
-                    else:
-                        self._trigger_identity_prompt(self.identity_prompt_message)
-                        verified = self.identity_service.verify_user(self.identity_prompt_message)
-                        self._identity_checked = True
-                        if verified:
-                            self._seconds_remaining = self.lock_timeout_seconds
-                            self._set_state(PresenceState.ACTIVE)
+                    self._identity_checked = True
+                    if not (hasattr(self.identity_service, "is_available")
+                            and not self.identity_service.is_available()):
+                        self._request_identity(now)
+                        self._poll_identity(now)  # Answered on the spot (e.g. cached)
+                        if now < self.warning_at:
                             return
                 self._set_state(PresenceState.WARNING)
+                for provider in self._providers:
+                    provider.begin_warning()
+                self._note_camera_readiness()
                 self._trigger_grace_period()
-                # Stage 2/3: Poll camera if in warning state
-                self._check_camera_presence()
+                # Stage 2/3: escalated providers (camera) in warning state
+                self._check_escalated_presence(now, absent)
+            elif self._current_state == PresenceState.WARNING:
+                # Motion history makes re-checking each warning tick a cheap query
+                self._check_escalated_presence(now, absent)
         
-        elif self._current_state == PresenceState.WARNING and self._seconds_remaining > self.warning_threshold_seconds:
+        elif self._current_state == PresenceState.WARNING:
             # Activity detected, return to active
             self._set_state(PresenceState.ACTIVE)
             self._identity_checked = False
+
+    def next_transition_time(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Earliest clock time at which tick() can change anything.
+
+        Input only ever moves the deadlines later, so a caller that sleeps
+        until this time (and ticks then) never misses a transition. While the
+        camera is in play (prewarmed, confirming a still user, or WARNING)
+        the engine asks to be re-checked every POLL_SECONDS.
+
+        Args:
+            now: Clock time to plan from (default: the engine's clock)
+
+        Returns:
+            float: Clock time for the next tick(), or None while paused
+                indefinitely
+        """
+        now = self._clock() if now is None else now
+        if self._current_state == PresenceState.PAUSED:
+            return self._pause_until
+        if self._current_state == PresenceState.WARNING:
+            return max(now, min(self.lock_at, now + self.POLL_SECONDS))
+        deadline = self.warning_at
+        if self.camera_on_demand:
+            prewarm_at = self.warning_at - self.camera_lead_seconds()
+            if self._camera_powered:
+                deadline = min(deadline, now + self.POLL_SECONDS)
+            elif prewarm_at > now:
+                deadline = min(deadline, prewarm_at)
+        return max(now, deadline)
     
-    def _check_camera_presence(self):
+    def _request_identity(self, now: float):
+        """Open a Windows Hello prompt; the answer is collected by later ticks."""
+        self._trigger_identity_prompt(self.identity_prompt_message)
+        try:
+            future = self.identity_service.request_verification(self.identity_prompt_message)
+        except Exception as e:
+            print(f"[PresenceEngine] Error requesting identity verification: {e}")
+            return
+        self.identity_requests += 1
+        self._identity_future = future
+        self._identity_requested_at = now
+        self._identity_answered_at = None
+
+        def answered(done: Future):
+            # Runs on the verifier's thread (or right here if already resolved)
+            if done is self._identity_future:
+                self._identity_answered_at = self._clock()
+
+        future.add_done_callback(answered)
+
+    def _poll_identity(self, now: float):
+        """Apply an identity answer that has arrived, or give up on a stale prompt."""
+        future = self._identity_future
+        if future is None:
+            return
+        if future.done():
+            answered_at = self._identity_answered_at if self._identity_answered_at is not None else now
+            self._identity_future = None
+            verified = not future.cancelled() and future.exception() is None and bool(future.result())
+            if verified and answered_at < self.lock_at:
+                self.identity_verified += 1
+                self._note_evidence("identity", answered_at)
+                print("[PresenceEngine] Identity verified, countdown restarted")
+            else:
+                self.identity_declined += 1
+        elif now - self._identity_requested_at >= self.identity_timeout_seconds:
+            self.identity_timeouts += 1
+            self._drop_identity()
+            print("[PresenceEngine] Identity prompt timed out")
+
+    def _drop_identity(self):
+        """Stop waiting for the open prompt (a late answer is ignored)."""
+        if self._identity_future is not None:
+            self._identity_future.cancel()
+            self._identity_future = None
+
+    def get_identity_stats(self) -> dict:
+        """
+        Identity verification counters.
+
+        Returns:
+            dict: pending, requests, verified, declined (or failed, or
+                answered after lock_at) and timeouts; prompts dropped by a
+                lock or pause are in none of these
+        """
+        return {
+            "pending": self.identity_pending,
+            "requests": self.identity_requests,
+            "verified": self.identity_verified,
+            "declined": self.identity_declined,
+            "timeouts": self.identity_timeouts,
+        }
+
+    def add_provider(self, provider: PresenceProvider):
+        """Register a presence provider; providers are kept in ascending cost."""
+        self._providers.append(provider)
+        self._providers.sort(key=lambda p: p.cost)
+        self.provider_consults.setdefault(provider.name, 0)
+        self.provider_established.setdefault(provider.name, 0)
+
+    def _consult(self, now: float, escalated: bool, absent: float = 1.0) -> float:
+        """
+        Read one tier of providers cheapest-first until presence is established.
+
+        Any provider's last_seen also moves the countdown start (HID: the
+        last input). Once the fused probability reaches PRESENCE_THRESHOLD
+        the remaining, costlier providers are skipped.
+
+        Args:
+            now: Clock time
+            escalated: False for the passive tier (cost below PASSIVE_COST),
+                True for the providers consulted only in WARNING
+            absent: Fused P(absent) carried over from the cheaper tier
+
+        Returns:
+            float: Fused P(absent) after this tier
+        """
+        for provider in self._providers:
+            if (provider.cost >= PASSIVE_COST) != escalated:
+                continue
+            if 1.0 - absent >= self.PRESENCE_THRESHOLD:
+                break
+            self.provider_consults[provider.name] += 1
+            try:
+                reading = provider.read(now)
+            except Exception as e:
+                print(f"[PresenceEngine] Error reading {provider.name}: {e}")
+                continue
+            if reading is None:
+                continue
+            if reading.last_seen is not None:
+                self._note_evidence(provider.name, min(now, reading.last_seen), provider.confidence)
+            absent = fuse(absent, provider.confidence, reading.probability)
+            if 1.0 - absent >= self.PRESENCE_THRESHOLD:
+                self.provider_established[provider.name] += 1
+        self.presence_probability = 1.0 - absent
+        return absent
+
+    def _check_escalated_presence(self, now: float, absent: float):
+        """
+        Stage 2/3: Ask the costly providers (camera) for actual presence.
+        Only called in WARNING, i.e. when the passive tier suggests absence.
+        """
+        absent = self._consult(now, escalated=True, absent=absent)
+        # If a provider confirms presence, reset timer
+        if 1.0 - absent >= self.PRESENCE_THRESHOLD:
+            self._camera_confirmed = True
+            self._note_evidence("escalated", now, 1.0 - absent)
+            self._set_state(PresenceState.ACTIVE)
+
+    def get_provider_stats(self) -> list:
+        """
+        Per-provider consult counters, cheapest first.
+
+        Returns:
+            list: dicts with name, cost, latency_seconds, confidence,
+                consults and established (reads that settled presence)
+        """
+        return [{
+            "name": p.name,
+            "cost": p.cost,
+            "latency_seconds": p.latency_seconds,
+            "confidence": p.confidence,
+            "consults": self.provider_consults[p.name],
+            "established": self.provider_established[p.name],
+        } for p in self._providers]
+
+    def _camera_wanted(self, now: float) -> bool:
+        """
+        Whether the camera should be on.
+
+        Off on fresh HID input and while paused. On from the prewarm point
+        through WARNING, and kept on after the camera has confirmed a still
+        user (reading, watching) so it is not cycled every countdown.
         """
-        Stage 2/3: Check camera for actual presence.
-        Only called if HID suggests absence.
+        if self._current_state == PresenceState.PAUSED or self._passive_present:
+            return False
+        if self._current_state == PresenceState.WARNING or self._camera_confirmed:
+            return True
+        return now >= self.warning_at - self.camera_lead_seconds()
+
+    def camera_lead_seconds(self) -> float:
+        """
+        How long before WARNING the camera is opened.
+
+        At least camera_prewarm_seconds; if the sensor has measured a slower
+        power-up (device open to first frame), the lead grows to cover it.
         """
-        if not self.camera_sensor:
+        lead = self.camera_prewarm_seconds
+        latency = getattr(self.camera_sensor, 'wake_latency_seconds', None)
+        if latency is not None:
+            lead = max(lead, math.ceil(latency) + 1)
+        return lead
+
+    def wake_camera(self):
+        """Power the camera up now (e.g. for the calibration preview)."""
+        self._set_camera_power(True)
+
+    def _set_camera_power(self, on: bool):
+        """Power the camera up or down if it is not already in that state."""
+        if on == self._camera_powered or not self.camera_sensor:
+            return
+        method = getattr(self.camera_sensor, 'power_up' if on else 'power_down', None)
+        if method is None:
             return
-        
         try:
-            # Get recent motion confidence from camera
-            # This is a lightweight check (one frame)
-            confidence = getattr(self.camera_sensor, 'motion_confidence', 0.0)
-            
-            # If camera detects motion, reset timer
-            if confidence > 0.3:  # Threshold: 30% confidence
-                self._seconds_remaining = self.lock_timeout_seconds
-                self._set_state(PresenceState.ACTIVE)
+            method()
         except Exception as e:
-            print(f"[PresenceEngine] Error checking camera presence: {e}")
+            print(f"[PresenceEngine] Error switching camera power: {e}")
+            return
+        self._camera_powered = on
+        if on:
+            self.camera_power_ups += 1
+            self._camera_powered_at = self._clock()
+
+    def _note_camera_readiness(self):
+        """Count warnings that began before the prewarmed camera produced a frame."""
+        if not self.camera_on_demand or self._camera_powered_at is None:
+            return
+        histories = self._motion_histories()
+        if histories and len(histories[0]) and histories[0].latest()[0] >= self._camera_powered_at:
+            return
+        self.cold_warnings += 1
+        print("[PresenceEngine] Warning started before the camera was ready; consider a longer prewarm")
+
+    def get_camera_power_stats(self) -> dict:
+        """
+        On-demand camera power counters.
+
+        Returns:
+            dict: powered (None until decided), power_ups, cold_warnings
+                (warnings entered before the first frame) and lead_seconds
+        """
+        return {
+            "powered": self._camera_powered,
+            "power_ups": self.camera_power_ups,
+            "cold_warnings": self.cold_warnings,
+            "lead_seconds": self.camera_lead_seconds(),
+        }
+
+    def _motion_histories(self) -> list:
+        """MotionHistory rings published by the camera sensor (one per camera)."""
+        return self._camera_provider.histories() if self._camera_provider else []
     
     def pause(self, duration_minutes: int = 60):
         """
@@ -201,14 +550,43 @@ class PresenceEngine:
         Args:
             duration_minutes: How long to pause (default 60)
         """
-        self._pause_until = datetime.now() + timedelta(minutes=duration_minutes)
+        self._pause_until = self._clock() + duration_minutes * 60.0
+        self._camera_confirmed = False
+        self._drop_identity()
         self._set_state(PresenceState.PAUSED)
     
     def resume(self):
         """Resume presence detection."""
         self._pause_until = None
-        self._seconds_remaining = self.lock_timeout_seconds
+        self._note_evidence("resume", self._clock())
         self._set_state(PresenceState.ACTIVE)
+
+    def _note_evidence(self, source: str, at: float, weight: float = 1.0):
+        """Restart the countdown from presence evidence and record it for presence_confidence()."""
+        self._countdown_from = max(self._countdown_from, at)
+        self.confidence_model.observe(source, at, weight)
+
+    def presence_confidence(self, now: Optional[float] = None) -> float:
+        """
+        Confidence that someone is at the desk, decayed from the last evidence.
+
+        Reaches 0 at lock_at (the horizon is the lock timeout) and stays 0
+        after a lock until new evidence arrives; independent of how often
+        tick() or this method is called.
+
+        Args:
+            now: Clock time to evaluate at (default: the engine's clock)
+
+        Returns:
+            float: 0-1, PAUSED_CONFIDENCE while paused
+        """
+        if self._current_state == PresenceState.PAUSED:
+            return self.PAUSED_CONFIDENCE
+        now = self._clock() if now is None else now
+        if now >= self.lock_at:
+            return 0.0  # Exactly 0 when the countdown locks, whatever exp() rounds to
+        self.confidence_model.horizon_seconds = self.lock_timeout_seconds
+        return self.confidence_model.confidence(now)
     
     def _set_state(self, new_state: PresenceState):
         """
@@ -222,40 +600,38 @@ class PresenceEngine:
         
         old_state = self._current_state
         self._current_state = new_state
-        self._state_entered_at = datetime.now()
+        self._state_entered_at = self._wall_clock()
         
         # Fire event
         event = StateChangeEvent(old_state, new_state, self._state_entered_at)
         for handler in self._state_changed_handlers:
-            try:
-                handler(event)
-            except Exception as e:
-                print(f"[PresenceEngine] Error in state changed handler: {e}")
+            self.dispatcher.post("state_changed", handler, event)
     
     def _trigger_grace_period(self):
         """Fire grace period started event."""
         for handler in self._grace_period_started_handlers:
-            try:
-                handler()
-            except Exception as e:
-                print(f"[PresenceEngine] Error in grace period handler: {e}")
+            self.dispatcher.post("grace_period", handler)
 
     def _trigger_identity_prompt(self, message: str):
         """Fire identity prompt event with message."""
         for handler in self._identity_prompt_handlers:
-            try:
-                handler(message)
-            except Exception as e:
-                print(f"[PresenceEngine] Error in identity prompt handler: {e}")
+            self.dispatcher.post("identity_prompt", handler, message)
     
     def _trigger_lock(self):
-        """Fire lock triggered event."""
+        """Fire lock triggered event (synchronous fast path: the lock must not wait in a queue)."""
         for handler in self._lock_triggered_handlers:
-            try:
-                handler()
-            except Exception as e:
-                print(f"[PresenceEngine] Error in lock triggered handler: {e}")
+            self.dispatcher.call("lock_triggered", handler)
     
+    def get_event_stats(self) -> dict:
+        """
+        Event delivery counters (see EventDispatcher.get_stats()).
+
+        Returns:
+            dict: queued, max_depth, dropped and per "event/handler" calls,
+                failures, mean_ms, max_ms
+        """
+        return self.dispatcher.get_stats()
+
     def get_state_display(self) -> str:
         """
         Get human-readable state display for UI.
@@ -264,15 +640,14 @@ class PresenceEngine:
             str: E.g., "ACTIVE - 45s" or "WARNING - 5s" or "LOCKED" or "PAUSED - 30 min"
         """
         if self._current_state == PresenceState.ACTIVE:
-            return f"ACTIVE - {self._seconds_remaining}s"
+            return f"ACTIVE - {self.seconds_remaining}s"
         elif self._current_state == PresenceState.WARNING:
-            return f"WARNING - {self._seconds_remaining}s"
+            return f"WARNING - {self.seconds_remaining}s"
         elif self._current_state == PresenceState.LOCKING:
             return "LOCKED"
         elif self._current_state == PresenceState.PAUSED:
-            if self._pause_until:
-                remaining = self._pause_until - datetime.now()
-                minutes = int(remaining.total_seconds() / 60)
+            if self._pause_until is not None:
+                minutes = int(max(0.0, self._pause_until - self._clock()) / 60)
                 return f"PAUSED - {minutes} min"
             return "PAUSED"
         return str(self._current_state.value).upper()
@@ -0,0 +1,153 @@
+"""
+Presence Providers - Cost-ordered presence signals fused by PresenceEngine
+
+PresenceEngine used to hardcode its waterfall: HID idle time, then a camera
+getattr against a fixed 0.3 threshold. Each signal is now a PresenceProvider
+that declares what a reading costs, how long it takes to get one (latency)
+and how much a positive reading is worth (confidence). The engine asks
+providers cheapest-first, stops as soon as the fused probability reaches its
+presence threshold, and counts consultations per provider. Audio, proximity
+sensors or remote signals become a provider, not a change to tick().
+
+Providers cheaper than PASSIVE_COST (HID) are read on every tick; the rest
+only once the countdown has reached WARNING, as the camera always was.
+
+Fusion is noisy-OR: P(present) = 1 - prod(1 - confidence * probability), so
+one trusted positive reading is enough and several weak ones add up.
+
+Cost: One read() per consulted provider per tick
+Benefit: New presence signals without touching the state machine
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+PASSIVE_COST = 1.0  # Providers below this cost are read every tick, the rest only in WARNING
+
+
+@dataclass
+class PresenceReading:
+    """One provider's answer."""
+    probability: float                  # Someone is at the desk right now (0-1)
+    last_seen: Optional[float] = None   # Engine-clock time of the latest evidence of presence
+
+
+def fuse(absent: float, confidence: float, probability: float) -> float:
+    """Fold one reading into the running P(absent) product (noisy-OR)."""
+    return absent * (1.0 - max(0.0, min(1.0, confidence * probability)))
+
+
+class PresenceProvider(ABC):
+    """
+    Base class for a presence signal; subclasses implement read().
+
+    Attributes:
+        name (str): Label in stats and logs
+        cost (float): Relative cost of one read(); providers are consulted
+            in ascending cost, 0 is free
+        latency_seconds (float): How long the sensor needs to produce a
+            reading (e.g. device power-up)
+        confidence (float): Weight of a positive reading in the fusion (0-1)
+    """
+
+    name = "provider"
+    cost = PASSIVE_COST
+    latency_seconds = 0.0
+    confidence = 0.5
+
+    @abstractmethod
+    def read(self, now: float) -> Optional[PresenceReading]:
+        """
+        Current presence evidence.
+
+        Args:
+            now: Engine clock time
+
+        Returns:
+            PresenceReading, or None if the provider has no opinion (e.g.
+            the sensor is unavailable)
+        """
+
+    def begin_warning(self) -> None:
+        """Called when a WARNING grace period starts (e.g. to mark history)."""
+
+
+class HIDPresenceProvider(PresenceProvider):
+    """
+    Keyboard/mouse idle time. Free, and input is certain presence.
+
+    Always reports last_seen (the last input), so the countdown runs from
+    the most recent input even when the reading itself says "absent".
+    """
+
+    name = "hid"
+    cost = 0.0
+    confidence = 1.0
+    ACTIVE_SECONDS = 1.0  # Input this recent counts as present now
+
+    def __init__(self, hid_monitor):
+        self.hid_monitor = hid_monitor
+
+    def read(self, now: float) -> Optional[PresenceReading]:
+        idle_seconds = self.hid_monitor.get_idle_seconds()
+        return PresenceReading(1.0 if idle_seconds < self.ACTIVE_SECONDS else 0.0, now - idle_seconds)
+
+
+class CameraPresenceProvider(PresenceProvider):
+    """
+    Motion in the Presence Zone from a GlazedSensor-like camera sensor.
+
+    With MotionHistory rings (one per camera), presence is the strongest
+    score in the last WINDOW_SECONDS or a steady share of motion frames
+    since the warning began; otherwise only the latest motion_confidence.
+    Below the thresholds the probability is graded up to 0.5, so a weak
+    camera reading can still combine with another weak signal.
+    """
+
+    name = "camera"
+    cost = 10.0
+    confidence = 0.9
+    SCORE_THRESHOLD = 0.3      # Motion score that counts as presence
+    WINDOW_SECONDS = 3.0       # Look-back for the max motion score
+    MOTION_FRACTION = 0.25     # Share of motion frames since the warning began
+
+    def __init__(self, camera_sensor):
+        self.camera_sensor = camera_sensor
+        self._warning_marks: list = []  # MotionHistory sequence per camera at warning start
+
+    @property
+    def latency_seconds(self) -> float:
+        latency = getattr(self.camera_sensor, 'wake_latency_seconds', None)
+        return latency or 0.0
+
+    def histories(self) -> list:
+        """MotionHistory rings published by the camera sensor (one per camera)."""
+        histories = getattr(self.camera_sensor, 'motion_histories', None)
+        if histories is not None:
+            return list(histories)
+        history = getattr(self.camera_sensor, 'motion_history', None)
+        return [history] if history is not None else []
+
+    def begin_warning(self) -> None:
+        self._warning_marks = [h.sequence for h in self.histories()]
+
+    def read(self, now: float) -> Optional[PresenceReading]:
+        histories = self.histories()
+        if histories:
+            # Windowed query: strongest recent motion on any camera, or a
+            # steady share of motion frames since the warning began
+            score = max(h.max_score(self.WINDOW_SECONDS) for h in histories)
+            fraction = max(
+                (h.motion_fraction_since(mark) for h, mark in zip(histories, self._warning_marks)),
+                default=0.0
+            )
+        else:
+            # Sensors without history: latest confidence only (one frame)
+            score = getattr(self.camera_sensor, 'motion_confidence', 0.0)
+            fraction = 0.0
+        if score > self.SCORE_THRESHOLD or fraction >= self.MOTION_FRACTION:
+            return PresenceReading(1.0, now)
+        strength = max(score / self.SCORE_THRESHOLD, fraction / self.MOTION_FRACTION)
+        return PresenceReading(0.5 * min(1.0, strength))
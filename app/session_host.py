@@ -0,0 +1,351 @@
+"""
+Session Host - Headless presence engines for many users on one machine
+
+The desktop app assumes one user: one PresenceEngine, one HIDMonitor
+(GetLastInputInfo only sees the caller's session) and one Tk window. On a
+terminal server or VDI host, SessionHost runs one engine per user session
+without any UI:
+
+- every engine's next_transition_time() is a timer on one shared
+  TimerScheduler, driven by a headless host loop (run()), so the host
+  wakes only when some session has a deadline, not sessions x 10 Hz;
+  wakeups are rounded up to a coalesce_seconds grid so sessions due within
+  the same 250 ms share one
+- each session reads idle time from its own source (get_idle_seconds(),
+  e.g. WTSSessionIdle) and fires the host's lock action with its id
+- per-session state stays small: engines share one synchronous event
+  dispatcher and have no camera; the host keeps a slotted Session record
+
+On Windows, running this module hosts every active WTS session, reads idle
+time from WTSQuerySessionInformation and disconnects sessions that reach the
+lock timeout (reconnecting needs the user's credentials).
+
+Single-threaded like TimerScheduler: add_session()/remove_session() from
+other threads are serialized with the host loop by a lock.
+
+Cost: One heap entry and one small engine per session
+Benefit: Thousands of sessions per host, ticked only at their deadlines
+"""
+
+import ctypes
+import math
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional
+
+from event_dispatcher import EventDispatcher
+from presence_engine import PresenceEngine
+from timer_scheduler import TimerScheduler
+
+
+SESSION_REFRESH_SECONDS = 10  # How often the Windows runtime re-enumerates sessions
+COALESCE_SECONDS = 0.25       # Host wakeup grid; a deadline fires at most this late
+
+WTS_CURRENT_SERVER_HANDLE = 0
+WTS_ACTIVE = 0          # WTS_CONNECTSTATE_CLASS.WTSActive
+WTS_SESSION_INFO = 24   # WTS_INFO_CLASS.WTSSessionInfo
+
+
+class Session:
+    """
+    One hosted user session.
+
+    Attributes:
+        session_id: Host-specific id (e.g. a Windows session id)
+        engine (PresenceEngine): The session's state machine
+        timer (Timer): The engine's slot in the shared scheduler
+        locks (int): Lock actions fired for this session
+    """
+
+    __slots__ = ("session_id", "engine", "timer", "locks")
+
+    def __init__(self, session_id, engine: PresenceEngine):
+        self.session_id = session_id
+        self.engine = engine
+        self.timer = None
+        self.locks = 0
+
+
+class SessionHost:
+    """
+    Many PresenceEngines on one TimerScheduler, without Tk.
+
+    Args:
+        lock_action: lock_action(session_id) -> bool, run when a session's
+            countdown expires
+        lock_timeout_seconds: Per-session idle timeout
+        warning_threshold_seconds: Grace period before the lock
+        clock: Monotonic seconds (a simulated clock for benchmarks)
+        coalesce_seconds: Round host wakeups up to this grid (0: exact)
+
+    Attributes:
+        sessions (dict): session_id -> Session
+        timers (TimerScheduler): The shared scheduler (host timers may be added)
+        locks (int): Lock actions fired
+        lock_failures (int): Lock actions that failed or returned False
+    """
+
+    def __init__(self, lock_action: Callable[[object], bool],
+                 lock_timeout_seconds: int = PresenceEngine.DEFAULT_LOCK_TIMEOUT_SECONDS,
+                 warning_threshold_seconds: int = PresenceEngine.WARNING_THRESHOLD_SECONDS,
+                 clock: Callable[[], float] = time.monotonic,
+                 coalesce_seconds: float = COALESCE_SECONDS):
+        self.lock_action = lock_action
+        self.coalesce_seconds = coalesce_seconds
+        self.lock_timeout_seconds = lock_timeout_seconds
+        self.warning_threshold_seconds = warning_threshold_seconds
+        self._clock = clock
+        self.dispatcher = EventDispatcher(synchronous=True, tag="SessionHost")
+        self.sessions: Dict[object, Session] = {}
+        self.locks = 0
+        self.lock_failures = 0
+        self._lock = threading.RLock()  # Lock actions may add/remove sessions
+        self._wake = threading.Event()
+        self._armed = None  # (deadline, fire) of the host timer
+        self._firing = False
+        self._running = False
+        self.timers = TimerScheduler(self._arm, self._disarm, clock=clock, state_label=lambda: "sessions")
+
+    def add_session(self, session_id, idle_source) -> PresenceEngine:
+        """
+        Start hosting a session (replacing one with the same id).
+
+        Args:
+            session_id: Passed back to lock_action
+            idle_source: Object with get_idle_seconds() for this session only
+
+        Returns:
+            PresenceEngine: The session's engine
+        """
+        with self._lock:
+            self.remove_session(session_id)
+            engine = PresenceEngine(idle_source, None, lock_timeout_seconds=self.lock_timeout_seconds,
+                                    warning_threshold_seconds=self.warning_threshold_seconds,
+                                    clock=self._clock, dispatcher=self.dispatcher)
+            session = Session(session_id, engine)
+            engine.on_lock_triggered(lambda: self._lock_session(session))
+            session.timer = self.timers.call_at(engine.next_transition_time(), lambda: self._tick(session), "session")
+            self.sessions[session_id] = session
+            return engine
+
+    def remove_session(self, session_id) -> None:
+        with self._lock:
+            session = self.sessions.pop(session_id, None)
+            if session is not None:
+                self.timers.cancel(session.timer)
+
+    def sync_sessions(self, session_ids: Iterable, make_idle_source: Callable[[object], object]) -> None:
+        """Host exactly these sessions: add the new ids, drop the ones that are gone."""
+        wanted = set(session_ids)
+        with self._lock:
+            for session_id in [s for s in self.sessions if s not in wanted]:
+                self.remove_session(session_id)
+            for session_id in wanted:
+                if session_id not in self.sessions:
+                    self.add_session(session_id, make_idle_source(session_id))
+
+    def reschedule(self, session_id) -> None:
+        """Re-plan a session after its engine was paused or resumed from outside."""
+        with self._lock:
+            session = self.sessions.get(session_id)
+            if session is not None:
+                self._plan(session)
+
+    def _tick(self, session: Session) -> None:
+        session.engine.tick()
+        if self.sessions.get(session.session_id) is session:
+            self._plan(session)
+
+    def _plan(self, session: Session) -> None:
+        deadline = session.engine.next_transition_time()
+        if deadline is None:
+            self.timers.cancel(session.timer)  # Paused indefinitely
+        else:
+            self.timers.reschedule(session.timer, deadline)
+
+    def _lock_session(self, session: Session) -> None:
+        session.locks += 1
+        self.locks += 1
+        try:
+            locked = self.lock_action(session.session_id)
+        except Exception as e:
+            print(f"[SessionHost] Lock action failed for session {session.session_id}: {e}")
+            locked = False
+        if not locked:
+            self.lock_failures += 1
+
+    # Host loop: TimerScheduler arms one deadline, run() sleeps until it
+    def _arm(self, delay_ms: int, fire: Callable[[], None]):
+        deadline = self._clock() + delay_ms / 1000.0
+        if self.coalesce_seconds > 0:
+            deadline = math.ceil(deadline / self.coalesce_seconds) * self.coalesce_seconds
+        self._armed = (deadline, fire)
+        if not self._firing:
+            self._wake.set()  # Armed from another thread: run() recomputes its sleep
+        return self._armed
+
+    def _disarm(self, handle) -> None:
+        if self._armed is handle:
+            self._armed = None
+
+    def next_deadline(self) -> Optional[float]:
+        """Clock time of the next host wakeup, None if nothing is scheduled."""
+        armed = self._armed
+        return armed[0] if armed is not None else None
+
+    def fire_due(self) -> bool:
+        """Run the scheduler if its deadline has passed (one host wakeup)."""
+        with self._lock:
+            armed = self._armed
+            if armed is None or armed[0] > self._clock():
+                return False
+            self._armed = None
+            self._firing = True
+            try:
+                armed[1]()
+            finally:
+                self._firing = False
+            return True
+
+    def run(self) -> None:
+        """Serve deadlines on the calling thread until stop() (real clock)."""
+        self._running = True
+        while self._running:
+            self._wake.clear()
+            deadline = self.next_deadline()
+            timeout = None if deadline is None else max(0.0, deadline - self._clock())
+            if timeout is None or timeout > 0:
+                self._wake.wait(timeout)
+            self.fire_due()
+
+    def stop(self) -> None:
+        self._running = False
+        self._wake.set()
+
+    def get_stats(self) -> dict:
+        """
+        Host counters.
+
+        Returns:
+            dict: sessions, states (sessions per engine state), wakeups,
+                ticks (engine ticks across sessions), locks, lock_failures
+        """
+        with self._lock:
+            states: Dict[str, int] = {}
+            for session in self.sessions.values():
+                state = session.engine.current_state.value
+                states[state] = states.get(state, 0) + 1
+            return {
+                "sessions": len(self.sessions),
+                "states": states,
+                "wakeups": self.timers.wakeups,
+                "ticks": self.timers.fired.get("session", 0),
+                "locks": self.locks,
+                "lock_failures": self.lock_failures,
+            }
+
+
+# === Windows Terminal Services (per-session idle and disconnect) ===
+
+class WTSINFOW(ctypes.Structure):
+    _fields_ = [
+        ("State", ctypes.c_int),
+        ("SessionId", ctypes.c_uint32),
+        ("IncomingBytes", ctypes.c_uint32),
+        ("OutgoingBytes", ctypes.c_uint32),
+        ("IncomingFrames", ctypes.c_uint32),
+        ("OutgoingFrames", ctypes.c_uint32),
+        ("IncomingCompressedBytes", ctypes.c_uint32),
+        ("OutgoingCompressedBytes", ctypes.c_uint32),
+        ("WinStationName", ctypes.c_wchar * 32),
+        ("Domain", ctypes.c_wchar * 17),
+        ("UserName", ctypes.c_wchar * 21),
+        ("ConnectTime", ctypes.c_int64),
+        ("DisconnectTime", ctypes.c_int64),
+        ("LastInputTime", ctypes.c_int64),
+        ("LogonTime", ctypes.c_int64),
+        ("CurrentTime", ctypes.c_int64),
+    ]
+
+
+class WTS_SESSION_INFOW(ctypes.Structure):
+    _fields_ = [("SessionId", ctypes.c_uint32), ("pWinStationName", ctypes.c_wchar_p), ("State", ctypes.c_int)]
+
+
+class WTSSessionIdle:
+    """
+    Idle time of one Windows session (the HIDMonitor interface).
+
+    WTSSessionInfo reports LastInputTime and CurrentTime in 100 ns units.
+    Like HIDMonitor, errors read as 0 (assume active) so a failing query
+    never locks anyone.
+    """
+
+    __slots__ = ("session_id",)
+
+    def __init__(self, session_id: int):
+        self.session_id = session_id
+
+    def get_idle_seconds(self) -> float:
+        try:
+            wtsapi32 = ctypes.windll.wtsapi32
+            buffer = ctypes.c_void_p()
+            size = ctypes.c_uint32()
+            if not wtsapi32.WTSQuerySessionInformationW(WTS_CURRENT_SERVER_HANDLE, self.session_id, WTS_SESSION_INFO,
+                                                        ctypes.byref(buffer), ctypes.byref(size)):
+                return 0.0
+            try:
+                info = ctypes.cast(buffer, ctypes.POINTER(WTSINFOW)).contents
+                if not info.LastInputTime:
+                    return 0.0  # Not reported for this session
+                return max(0.0, (info.CurrentTime - info.LastInputTime) / 1e7)
+            finally:
+                wtsapi32.WTSFreeMemory(buffer)
+        except Exception as e:
+            print(f"[SessionHost] Error reading idle time for session {self.session_id}: {e}")
+            return 0.0
+
+
+def active_wts_sessions() -> list:
+    """Ids of the sessions with a user attached (WTSActive)."""
+    wtsapi32 = ctypes.windll.wtsapi32
+    sessions = ctypes.POINTER(WTS_SESSION_INFOW)()
+    count = ctypes.c_uint32()
+    if not wtsapi32.WTSEnumerateSessionsW(WTS_CURRENT_SERVER_HANDLE, 0, 1, ctypes.byref(sessions), ctypes.byref(count)):
+        return []
+    try:
+        return [sessions[i].SessionId for i in range(count.value) if sessions[i].State == WTS_ACTIVE]
+    finally:
+        wtsapi32.WTSFreeMemory(sessions)
+
+
+def disconnect_wts_session(session_id: int) -> bool:
+    """Lock action: disconnect the session (it stays logged on; reconnecting needs credentials)."""
+    ok = bool(ctypes.windll.wtsapi32.WTSDisconnectSession(WTS_CURRENT_SERVER_HANDLE, session_id, False))
+    print(f"[SessionHost] {'Disconnected' if ok else 'Could not disconnect'} session {session_id}")
+    return ok
+
+
+def main():
+    if not sys.platform.startswith('win'):
+        print("[SessionHost] The multi-session runtime needs Windows Terminal Services")
+        return
+    from config_service import ConfigService
+    config = ConfigService("config.json")
+    host = SessionHost(disconnect_wts_session,
+                       lock_timeout_seconds=config.get_int("lockTimeoutSeconds", 60),
+                       warning_threshold_seconds=config.get_int("warningThresholdSeconds", 10))
+    host.timers.call_every(SESSION_REFRESH_SECONDS,
+                           lambda: host.sync_sessions(active_wts_sessions(), WTSSessionIdle),
+                           "session_refresh", first_delay=0)
+    print("[SessionHost] Hosting active sessions (Ctrl+C to stop)")
+    try:
+        host.run()
+    except KeyboardInterrupt:
+        host.stop()
+    print(f"[SessionHost] {host.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Timer Scheduler - One armed host timer for every deadline in the app
+
+App used to hang everything (engine ticks, LED pulse, audit-log redraw,
+slider pushes) off a single root.after(100, update_loop), i.e. 10 wakeups
+per second whether or not anything was due. Subsystems now register
+one-shot or periodic timers here instead. Deadlines live in a heap and only
+the earliest one is armed on the host loop (Tk's after/after_cancel), so
+the process wakes exactly when some subsystem has work and sleeps otherwise.
+
+Every wakeup, and the time since the previous one, is charged to the state
+state_label() reported after the previous batch of callbacks (the state the
+app was sleeping in), giving wakeups per minute per state (active,
+warning, ...).
+
+Single-threaded: call it from the host loop's thread only. Other threads
+must not call it or Tk; App has them queue callbacks that a periodic
+"handoff" timer runs on the Tk thread.
+
+Cost: A heap push/pop per timer firing
+Benefit: Idle wakeups follow real deadlines instead of a fixed 10 Hz poll
+"""
+
+import heapq
+import itertools
+import math
+import time
+from typing import Callable, Dict, Optional
+
+
+TIMER_SLACK_SECONDS = 0.002  # Fire timers this close to due in the same wakeup
+
+
+class Timer:
+    """
+    Handle for a scheduled callback.
+
+    Attributes:
+        name (str): Label used in the firing counters
+        deadline (float): Next due time on the scheduler clock
+        interval (float): Period for repeating timers, None for one-shot
+        active (bool): False once cancelled or a one-shot has fired
+    """
+
+    def __init__(self, scheduler: "TimerScheduler", name: str, callback: Callable[[], None],
+                 deadline: float, interval: Optional[float]):
+        self._scheduler = scheduler
+        self.name = name
+        self.callback = callback
+        self.deadline = deadline
+        self.interval = interval
+        self.active = True
+        self._version = 0  # Bumped on reschedule; stale heap entries are skipped
+
+    def cancel(self) -> None:
+        self._scheduler.cancel(self)
+
+
+class TimerScheduler:
+    """
+    Heap of deadlines driven by a host loop's single-shot timer.
+
+    Args:
+        arm: Host hook arm(delay_ms, fire) -> handle, e.g. root.after
+        disarm: Host hook disarm(handle), e.g. root.after_cancel
+        clock: Monotonic seconds
+        state_label: Returns the current app state, sampled after each batch
+
+    Attributes:
+        wakeups (int): Times the host loop woke the scheduler
+        fired (dict): Timer name -> callbacks run
+    """
+
+    def __init__(self, arm: Callable[[int, Callable[[], None]], object], disarm: Callable[[object], None],
+                 clock: Callable[[], float] = time.monotonic,
+                 state_label: Optional[Callable[[], str]] = None):
+        self._arm_host = arm
+        self._disarm_host = disarm
+        self._clock = clock
+        self._state_label = state_label or (lambda: "running")
+        self._heap = []
+        self._seq = itertools.count()
+        self._armed = None          # Host handle
+        self._armed_for = None      # Deadline the host timer was armed for
+        self._firing = False
+        self.wakeups = 0
+        self.fired: Dict[str, int] = {}
+        # Per-state wakeups and seconds, charged to the state sampled after the previous batch
+        self._state_wakeups: Dict[str, int] = {}
+        self._state_seconds: Dict[str, float] = {}
+        self._last_state = None
+        self._last_state_at = clock()
+
+    def call_at(self, deadline: float, callback: Callable[[], None], name: str = "timer") -> Timer:
+        """Run callback once at a time on the scheduler clock."""
+        timer = Timer(self, name, callback, deadline, None)
+        self._push(timer)
+        return timer
+
+    def call_later(self, delay: float, callback: Callable[[], None], name: str = "timer") -> Timer:
+        """Run callback once, delay seconds from now."""
+        return self.call_at(self._clock() + max(0.0, delay), callback, name)
+
+    def call_every(self, interval: float, callback: Callable[[], None], name: str = "timer",
+                   first_delay: Optional[float] = None) -> Timer:
+        """
+        Run callback every interval seconds.
+
+        A late wakeup does not cause a burst of catch-up calls: the next run
+        is scheduled one interval after the late one.
+        """
+        delay = interval if first_delay is None else first_delay
+        timer = Timer(self, name, callback, self._clock() + max(0.0, delay), interval)
+        self._push(timer)
+        return timer
+
+    def reschedule(self, timer: Timer, deadline: float) -> None:
+        """Move a timer (reactivating a fired one-shot) to a new deadline."""
+        timer.active = True
+        timer.deadline = deadline
+        timer._version += 1
+        self._push(timer)
+
+    def cancel(self, timer: Optional[Timer]) -> None:
+        if timer is None or not timer.active:
+            return
+        timer.active = False
+        timer._version += 1
+        self._arm()
+
+    def stop(self) -> None:
+        """Disarm the host timer; registered timers stay but never fire."""
+        self._heap.clear()
+        self._disarm()
+
+    def _push(self, timer: Timer) -> None:
+        heapq.heappush(self._heap, (timer.deadline, next(self._seq), timer._version, timer))
+        self._arm()
+
+    def _next_deadline(self) -> Optional[float]:
+        """Earliest live deadline, dropping stale heap entries on the way."""
+        while self._heap:
+            deadline, _, version, timer = self._heap[0]
+            if timer.active and version == timer._version:
+                return deadline
+            heapq.heappop(self._heap)
+        return None
+
+    def _disarm(self) -> None:
+        if self._armed is not None:
+            self._disarm_host(self._armed)
+        self._armed = None
+        self._armed_for = None
+
+    def _arm(self) -> None:
+        """Arm the host timer for the earliest deadline (once per firing batch)."""
+        if self._firing:
+            return
+        deadline = self._next_deadline()
+        if deadline == self._armed_for:
+            return
+        self._disarm()
+        if deadline is None:
+            return
+        delay_ms = max(0, int(math.ceil((deadline - self._clock()) * 1000.0)))
+        self._armed = self._arm_host(delay_ms, self._fire)
+        self._armed_for = deadline
+
+    def _count_wakeup(self, now: float) -> None:
+        state = self._last_state if self._last_state is not None else self._state_label()
+        self._state_seconds[state] = self._state_seconds.get(state, 0.0) + now - self._last_state_at
+        self._state_wakeups[state] = self._state_wakeups.get(state, 0) + 1
+        self._last_state_at = now
+
+    def _fire(self) -> None:
+        """Host timer callback: run everything that is due, then re-arm."""
+        self._armed = None
+        self._armed_for = None
+        now = self._clock()
+        self.wakeups += 1
+        self._count_wakeup(now)
+        # Collect what is due first: a callback that re-arms its timer inside
+        # the slack window runs on the next wakeup, not again in this one
+        due = []
+        while True:
+            deadline = self._next_deadline()
+            if deadline is None or deadline > now + TIMER_SLACK_SECONDS:
+                break
+            _, _, version, timer = heapq.heappop(self._heap)
+            if timer.interval is not None:
+                timer.deadline = deadline + timer.interval
+                if timer.deadline <= now:
+                    timer.deadline = now + timer.interval  # Late: skip the missed runs
+                heapq.heappush(self._heap, (timer.deadline, next(self._seq), version, timer))
+            else:
+                timer.active = False
+            due.append((timer, version))
+        self._firing = True
+        try:
+            for timer, version in due:
+                if timer._version != version:
+                    continue  # Cancelled or moved by an earlier callback in this batch
+                self.fired[timer.name] = self.fired.get(timer.name, 0) + 1
+                try:
+                    timer.callback()
+                except Exception as e:
+                    print(f"[Timers] {timer.name} failed: {e}")
+        finally:
+            self._firing = False
+        self._last_state = self._state_label()
+        self._arm()
+
+    def get_stats(self) -> dict:
+        """
+        Wakeup counters.
+
+        Returns:
+            dict: wakeups, fired (per timer name), and states: per state
+                wakeups, seconds spent and wakeups_per_minute
+        """
+        seconds = dict(self._state_seconds)
+        if self._last_state is not None:
+            seconds[self._last_state] = seconds.get(self._last_state, 0.0) + self._clock() - self._last_state_at
+        states = {}
+        for state, wakeups in self._state_wakeups.items():
+            spent = seconds.get(state, 0.0)
+            states[state] = {
+                "wakeups": wakeups,
+                "seconds": round(spent, 1),
+                "wakeups_per_minute": round(wakeups * 60.0 / spent, 1) if spent > 0 else None,
+            }
+        return {"wakeups": self.wakeups, "fired": dict(self.fired), "states": states}
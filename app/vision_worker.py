@@ -0,0 +1,486 @@
+"""
+Vision Worker - Optional out-of-process GlazedSensor
+
+GlazedSensor normally runs as a thread inside the Tk process, so its
+NumPy/OpenCV calls and per-frame Python overhead compete with update_loop()
+for the GIL. In worker mode the capture and motion pipeline run in a separate
+process; the UI process only receives compact results.
+
+Shared memory layout (one multiprocessing.shared_memory block):
+    header   float64[9]        result/frame sequence numbers, heartbeat,
+                               frame and timing counters, error code,
+                               wake latency
+    results  float64[64, 8]    ring of (timestamp, score, proximity, motion,
+                               stable trigger, target fps, frame sequence,
+                               slot stamp)
+    stamps   float64[3]        slot stamp of each preview frame
+    frames   uint8[3, 240, 320, 3]  ring of preview frames (calibration or
+                               glaze), written only when the sensor made one
+
+Each slot is a seqlock: the worker sets the slot's stamp to -1, fills the
+slot, stamps it with its sequence number and then advances the header
+sequence. The reader checks the stamp before and after copying a slot and
+drops the copy if the worker lapped it meanwhile (counted as torn), so a
+reader that falls a whole ring behind never accepts a half-written result
+or frame. A semaphore wakes the reader per
+result; its timeout doubles as the supervision tick. Parameter changes
+(PZ Reach, calibration, pause) travel the other way on a queue and are sent
+only when a value actually changes.
+
+Supervision: a worker that dies or stops heart-beating is restarted with
+exponential backoff. Only the capture thread beats, on each published
+result and from its pacing and pause waits, so a worker paused or powered
+down stays alive while one stuck in a frame read is restarted. A camera that cannot be opened is reported once through
+the normal CAMERA_FAILED callback and not retried.
+
+Privacy: frames only exist in the shared block in RAM; nothing is written to
+disk and the block is unlinked on stop.
+
+Cost: One extra Python process (~40 MB) and a 0.7 MB shared block
+Benefit: Vision work no longer holds the UI process's GIL
+"""
+
+import multiprocessing as mp
+import queue
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from fps_controller import AdaptiveFpsController
+from motion_history import MotionHistory
+
+
+RESULT_SLOTS = 64
+FRAME_SLOTS = 3
+PREVIEW_SHAPE = (240, 320, 3)
+
+# Header fields
+HEADER_FIELDS = 9
+(H_RESULT_SEQ, H_FRAME_SEQ, H_HEARTBEAT, H_FRAMES, H_PROCESSING, H_ERROR,
+ H_CAPTURE_W, H_CAPTURE_H, H_WAKE_LATENCY) = range(HEADER_FIELDS)
+# Result columns
+RESULT_FIELDS = 8
+R_TIME, R_SCORE, R_PROXIMITY, R_MOTION, R_STABLE, R_FPS, R_FRAME, R_STAMP = range(RESULT_FIELDS)
+SLOT_WRITING = -1.0  # Stamp while the worker is filling a slot
+
+ERROR_CAMERA_FAILED = 1.0
+
+HEARTBEAT_SECONDS = 1.0
+HEARTBEAT_TIMEOUT_SECONDS = 5.0
+RESTART_BACKOFF_SECONDS = (1, 2, 4, 8, 16, 30)
+
+# Sensor attributes the UI sets; mirrored into the worker on change
+FORWARDED_PARAMS = ("calibration_mode", "pz_reach", "proximity_min", "sensitivity",
+                    "background_model", "learning_rate", "zones", "fps_controller",
+                    "release_on_pause_seconds", "illumination_compensation")
+
+
+class _SharedLayout:
+    """Numpy views over the shared block (same layout on both sides)."""
+
+    HEADER_BYTES = HEADER_FIELDS * 8
+    RESULTS_BYTES = RESULT_SLOTS * RESULT_FIELDS * 8
+    STAMPS_BYTES = FRAME_SLOTS * 8
+    FRAMES_BYTES = FRAME_SLOTS * int(np.prod(PREVIEW_SHAPE))
+    SIZE = HEADER_BYTES + RESULTS_BYTES + STAMPS_BYTES + FRAMES_BYTES
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        buf = shm.buf
+        self.header = np.ndarray((HEADER_FIELDS,), np.float64, buf, 0)
+        self.results = np.ndarray((RESULT_SLOTS, RESULT_FIELDS), np.float64, buf, self.HEADER_BYTES)
+        self.frame_stamps = np.ndarray((FRAME_SLOTS,), np.float64, buf, self.HEADER_BYTES + self.RESULTS_BYTES)
+        self.frames = np.ndarray((FRAME_SLOTS,) + PREVIEW_SHAPE, np.uint8, buf,
+                                 self.HEADER_BYTES + self.RESULTS_BYTES + self.STAMPS_BYTES)
+
+    def close(self) -> None:
+        """Drop the views; SharedMemory.close() fails while any still exists."""
+        self.header = self.results = self.frame_stamps = self.frames = None
+
+
+def _build_source(source, device_key, num_frames):
+    """Create the FrameSource inside the worker (devices cannot be pickled)."""
+    from frame_sources import CameraFrameSource, create_frame_source
+    if isinstance(source, int) or str(source).isdigit():
+        from camera_discovery import CameraParamCache
+        return CameraFrameSource(int(source), cache=CameraParamCache(), device_key=device_key)
+    return create_frame_source(source, num_frames=num_frames)
+
+
+def _worker_main(shm_name, wakeup, control, source, device_key, num_frames, paced, params):
+    """Worker process entry point: run GlazedSensor and publish results."""
+    from glazed_sensor import GlazedSensor
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    layout = _SharedLayout(shm)
+
+    def publish(frame, stable_trigger, proximity, error=None):
+        header, results, frames, frame_stamps = layout.header, layout.results, layout.frames, layout.frame_stamps
+        if error:
+            header[H_ERROR] = ERROR_CAMERA_FAILED
+            wakeup.release()
+            return
+        frame_seq = -1.0
+        if frame is not None and frame.shape == PREVIEW_SHAPE:
+            frame_seq = header[H_FRAME_SEQ]
+            slot = int(frame_seq) % FRAME_SLOTS
+            frame_stamps[slot] = SLOT_WRITING
+            np.copyto(frames[slot], frame)
+            frame_stamps[slot] = frame_seq
+            header[H_FRAME_SEQ] = frame_seq + 1
+        timestamp, score, _, motion = sensor.motion_history.latest()
+        seq = header[H_RESULT_SEQ]
+        row = results[int(seq) % RESULT_SLOTS]
+        row[R_STAMP] = SLOT_WRITING
+        row[:R_STAMP] = (timestamp, score, proximity, motion, stable_trigger, sensor.target_fps, frame_seq)
+        row[R_STAMP] = seq
+        header[H_FRAMES] = sensor.frame_count
+        header[H_PROCESSING] = sensor._processing_seconds
+        if sensor.capture_resolution:
+            header[H_CAPTURE_W], header[H_CAPTURE_H] = sensor.capture_resolution
+        if sensor.wake_latency_seconds is not None:
+            header[H_WAKE_LATENCY] = sensor.wake_latency_seconds
+        header[H_HEARTBEAT] = time.monotonic()
+        # Publish only after the slot is complete
+        header[H_RESULT_SEQ] = seq + 1
+        wakeup.release()
+
+    sensor = GlazedSensor(publish, frame_source=_build_source(source, device_key, num_frames), paced=paced)
+    for name, value in params.items():
+        setattr(sensor, name, value)
+    if params.get("_paused"):
+        sensor.pause()
+    if not params.get("_powered", True):
+        sensor.power_down()
+
+    def heartbeat():
+        layout.header[H_HEARTBEAT] = time.monotonic()
+
+    # Only the capture thread beats (publish and the sensor's waits), so a
+    # read() that never returns stops the heartbeat while a pause does not
+    sensor.heartbeat = heartbeat
+    sensor.heartbeat_seconds = HEARTBEAT_SECONDS
+
+    def apply_control():
+        while sensor.running:
+            try:
+                message = control.get(timeout=HEARTBEAT_SECONDS)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            command = message[0]
+            if command == "set":
+                setattr(sensor, message[1], message[2])
+            elif command == "pause":
+                sensor.pause()
+            elif command == "resume":
+                sensor.resume()
+            elif command == "power_down":
+                sensor.power_down()
+            elif command == "power_up":
+                sensor.power_up()
+            elif command == "stop":
+                sensor.stop()
+
+    heartbeat()
+    control_thread = threading.Thread(target=apply_control, daemon=True, name="VisionWorkerControl")
+    control_thread.start()
+    try:
+        sensor.run()
+    finally:
+        sensor.running = False
+        control_thread.join(timeout=2 * HEARTBEAT_SECONDS)  # Leaves at its next get() timeout
+        layout.close()
+        shm.close()
+
+
+class ProcessGlazedSensor:
+    """
+    GlazedSensor running in a supervised worker process.
+
+    Exposes the surface the App and PresenceEngine use (start/stop/pause/
+    resume, the tunable parameters, motion_confidence, target_fps and a local
+    MotionHistory), so it can stand in for a GlazedSensor.
+
+    Attributes:
+        camera_index (int): Camera index when the source is a camera
+        motion_history (MotionHistory): Samples copied from the worker
+        restarts (int): Worker restarts performed by supervision
+    """
+
+    def __init__(self, callback: Callable, camera_index: int = 0, source: Optional[Union[int, str]] = None,
+                 device_key: Optional[str] = None, num_frames: Optional[int] = None,
+                 paced: Optional[bool] = None):
+        """
+        Args:
+            callback: Same signature as the GlazedSensor callback
+            camera_index: Camera to open when no source spec is given
+            source: create_frame_source() spec (camera index, "synthetic:busy", path)
+            device_key: Camera cache key (see CameraParamCache)
+            num_frames: Frame limit for synthetic sources
+            paced: As for GlazedSensor (default: paced for cameras only)
+        """
+        self.callback = callback
+        self.camera_index = camera_index
+        self.source = camera_index if source is None else source
+        self.device_key = device_key
+        self.num_frames = num_frames
+        self.is_live = isinstance(self.source, int) or str(self.source).isdigit()
+        self.paced = self.is_live if paced is None else paced
+
+        self._ctx = mp.get_context("spawn")  # No fork of a process holding Tk and camera handles
+        self._shm = shared_memory.SharedMemory(create=True, size=_SharedLayout.SIZE)
+        self._layout = _SharedLayout(self._shm)
+        self._layout.header[:] = 0
+        self._wakeup = self._ctx.Semaphore(0)
+        self._control = None
+        self._process = None
+        self._pump = None
+
+        self._params = {"calibration_mode": True, "pz_reach": 0.7, "proximity_min": 50, "sensitivity": 350,
+                        "background_model": "last_frame", "learning_rate": 0.05, "zones": None,
+                        "fps_controller": AdaptiveFpsController(), "release_on_pause_seconds": 0.0,
+                        "illumination_compensation": True}
+        self.paused = False
+        self.powered = True
+        self.running = False
+        self.motion_history = MotionHistory()
+        self.motion_confidence = 0.0
+        self.target_fps = 1
+        self.restarts = 0
+        self._last_result_seq = 0
+        self._last_frame_seq = 0
+        self._row = np.empty(RESULT_FIELDS)
+        self._frame = np.empty(PREVIEW_SHAPE, np.uint8)  # Handed to the callback, which copies it
+        self.torn_results = 0
+        self.torn_frames = 0
+        self._restart_at = None
+        self._failed = False
+
+    def __getattr__(self, name):
+        params = self.__dict__.get("_params")
+        if params is not None and name in params:
+            return params[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in FORWARDED_PARAMS:
+            if self._params.get(name) is value or self._params.get(name) == value:
+                return  # Unchanged values (e.g. re-pushed on sensor restart) need no message
+            self._params[name] = value
+            self._send(("set", name, value))
+            return
+        super().__setattr__(name, value)
+
+    def _send(self, message) -> None:
+        if self._control is not None:
+            try:
+                self._control.put(message)
+            except (OSError, ValueError):
+                pass
+
+    def _spawn(self) -> None:
+        self._control = self._ctx.Queue()
+        params = dict(self._params, _paused=self.paused, _powered=self.powered)
+        self._process = self._ctx.Process(
+            target=_worker_main,
+            args=(self._shm.name, self._wakeup, self._control, self.source, self.device_key,
+                  self.num_frames, self.paced, params),
+            daemon=True,
+            name="VisionWorker"
+        )
+        self._spawned_at = time.monotonic()
+        self._process.start()
+        print(f"[VisionWorker] Started pid {self._process.pid} for {self.source}")
+
+    def start(self):
+        """Start the worker process and the result pump."""
+        self.running = True
+        self._spawn()
+        self._pump = threading.Thread(target=self._pump_results, daemon=True, name="VisionWorkerPump")
+        self._pump.start()
+
+    def _pump_results(self) -> None:
+        """Forward worker results to the callback and supervise the worker."""
+        try:
+            while self.running:
+                self._wakeup.acquire(timeout=HEARTBEAT_SECONDS)
+                if not self.running:
+                    break
+                self._drain()
+                self._supervise()
+        finally:
+            if not self.running:
+                self._release_shared()  # stop() leaves the block to a pump it could not join
+
+    def _drain(self) -> None:
+        """Copy every new result into motion_history and forward the newest to the callback."""
+        header, results = self._layout.header, self._layout.results
+        if header[H_ERROR] == ERROR_CAMERA_FAILED and not self._failed:
+            self._failed = True
+            self.callback(None, False, 0, "CAMERA_FAILED")
+            return
+
+        end = int(header[H_RESULT_SEQ])
+        start = max(self._last_result_seq, end - RESULT_SLOTS)
+        if end <= start:
+            return
+        self._last_result_seq = end
+        row = self._row
+        stable = False
+        newest_frame = -1
+        latest = None
+        for seq in range(start, end):
+            slot = results[seq % RESULT_SLOTS]
+            if slot[R_STAMP] != seq:
+                self.torn_results += 1  # Already lapped by the worker
+                continue
+            np.copyto(row, slot)
+            if slot[R_STAMP] != seq:
+                self.torn_results += 1  # Lapped while we copied
+                continue
+            self.motion_history.record(row[R_SCORE], row[R_PROXIMITY], bool(row[R_MOTION]), timestamp=row[R_TIME])
+            stable = stable or bool(row[R_STABLE])
+            if row[R_FRAME] >= 0:
+                newest_frame = int(row[R_FRAME])
+            latest = (float(row[R_SCORE]), float(row[R_FPS]), float(row[R_PROXIMITY]))
+        if latest is None:
+            return
+        self.motion_confidence, self.target_fps, proximity = latest
+
+        frame = None
+        if newest_frame >= 0:
+            frame = self._copy_frame(newest_frame)
+        self.callback(frame, stable, proximity)
+
+    def _copy_frame(self, frame_seq: int) -> Optional[np.ndarray]:
+        """Copy one preview frame out of its ring slot; None if the worker overwrote it."""
+        slot = frame_seq % FRAME_SLOTS
+        stamps = self._layout.frame_stamps
+        if stamps[slot] != frame_seq:
+            self.torn_frames += 1
+            return None
+        np.copyto(self._frame, self._layout.frames[slot])
+        if stamps[slot] != frame_seq:
+            self.torn_frames += 1
+            return None
+        return self._frame
+
+    def _supervise(self) -> None:
+        """Restart a worker that exited unexpectedly or stopped heart-beating."""
+        if self._failed or self._process is None:
+            return
+        now = time.monotonic()
+        if self._restart_at is not None:
+            if now >= self._restart_at:
+                self._restart_at = None
+                self._spawn()
+            return
+
+        exitcode = self._process.exitcode
+        if exitcode is not None:
+            if not self.is_live and exitcode == 0:
+                self.running = False  # Replay finished
+                return
+            reason = f"exited with code {exitcode}"
+        else:
+            heartbeat = self._layout.header[H_HEARTBEAT]
+            started = getattr(self, "_spawned_at", now)
+            if now - max(heartbeat, started) < HEARTBEAT_TIMEOUT_SECONDS:
+                return
+            reason = "stopped responding"
+            self._process.terminate()
+            self._process.join(timeout=1.0)
+
+        delay = RESTART_BACKOFF_SECONDS[min(self.restarts, len(RESTART_BACKOFF_SECONDS) - 1)]
+        self.restarts += 1
+        self._restart_at = now + delay
+        print(f"[VisionWorker] Worker {reason}; restarting in {delay}s (restart #{self.restarts})")
+
+    def stop(self):
+        """Stop the worker process and release the shared block."""
+        self.running = False
+        self._send(("stop",))
+        process = self._process
+        if process is not None:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1.0)
+        self._wakeup.release()  # Wake the pump so it sees running=False
+        if self._pump is not None and self._pump is not threading.current_thread():
+            self._pump.join(timeout=2.0)
+        if self._pump is None or not self._pump.is_alive():
+            self._release_shared()
+        # Otherwise the pump is still inside _drain() (a slow callback, or stop()
+        # called from the callback itself) and releases the block when it exits
+
+    def _release_shared(self) -> None:
+        """Drop the shared-memory views, then close and unlink the block."""
+        self._layout = None
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except (FileNotFoundError, BufferError):
+            pass
+
+    def pause(self):
+        """Pause the worker's sensor."""
+        self.paused = True
+        self._send(("pause",))
+
+    def resume(self):
+        """Resume the worker's sensor."""
+        self.paused = False
+        self._send(("resume",))
+
+    def power_down(self):
+        """Close the worker's camera until power_up() (the process stays up)."""
+        if self.powered:
+            self.powered = False
+            self._send(("power_down",))
+
+    def power_up(self):
+        """Reopen the worker's camera."""
+        if not self.powered:
+            self.powered = True
+            self._send(("power_up",))
+
+    @property
+    def wake_latency_seconds(self) -> Optional[float]:
+        """Worker-measured time from power_up() to the first analyzed frame."""
+        if self._layout is None or not self._layout.header[H_WAKE_LATENCY]:
+            return None
+        return float(self._layout.header[H_WAKE_LATENCY])
+
+    def is_alive(self) -> bool:
+        return self.running
+
+    def join(self, timeout: Optional[float] = None):
+        """Wait for the pump to finish (e.g. an offline replay ending)."""
+        if self._pump is not None:
+            self._pump.join(timeout)
+
+    def get_stats(self) -> dict:
+        """
+        Worker throughput stats.
+
+        Returns:
+            dict: source, frames, ms_per_frame, capture_resolution, restarts,
+                torn_results, torn_frames (lapped by the worker and dropped), pid
+        """
+        header = self._layout.header if self._layout is not None else np.zeros(HEADER_FIELDS)
+        frames = int(header[H_FRAMES])
+        return {
+            "source": f"worker:{self.source}",
+            "frames": frames,
+            "ms_per_frame": float(header[H_PROCESSING] / frames * 1000.0) if frames else 0.0,
+            "capture_resolution": (int(header[H_CAPTURE_W]), int(header[H_CAPTURE_H])) if header[H_CAPTURE_W] else None,
+            "restarts": self.restarts,
+            "torn_results": self.torn_results,
+            "torn_frames": self.torn_frames,
+            "pid": self._process.pid if self._process else None,
+        }
@@ -0,0 +1,55 @@
+"""
+Zone Geometry - Cached Presence Zone layout for GlazedSensor
+
+The Presence Zone is a centered rectangle covering pz_reach of the frame.
+Its crop slices and overlay rectangles only change when the PZ Reach slider
+or the capture resolution changes, so they are computed once per
+(frame size, pz_reach) pair instead of on every frame.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+PREVIEW_SIZE = (320, 240)
+
+
+class ZoneGeometry:
+    """
+    Precomputed Presence Zone layout for one frame size and reach.
+
+    Attributes:
+        frame_size (tuple): (width, height) of the source frame
+        pz_reach (float): Zone size as a fraction of the frame (0.1-1.0)
+        crop (tuple): (row slice, column slice) selecting the zone; applying it
+            is a view, so crop-and-downscale is a single resize call
+        zone_rect (tuple): (x1, y1, x2, y2) zone outline in frame pixels
+        preview_rect (tuple): (x1, y1, x2, y2) zone outline in preview pixels
+    """
+
+    def __init__(self, frame_width: int, frame_height: int, pz_reach: float,
+                 preview_size: Tuple[int, int] = PREVIEW_SIZE):
+        self.frame_size = (frame_width, frame_height)
+        self.pz_reach = pz_reach
+        self.preview_size = preview_size
+
+        rw, rh = int(frame_width * pz_reach), int(frame_height * pz_reach)
+        x1, y1 = (frame_width - rw) // 2, (frame_height - rh) // 2
+        self.crop = (slice(y1, y1 + rh), slice(x1, x1 + rw))
+        self.zone_rect = (x1, y1, x1 + rw, y1 + rh)
+
+        sx = preview_size[0] / frame_width
+        sy = preview_size[1] / frame_height
+        self.preview_rect = (
+            int(round(x1 * sx)), int(round(y1 * sy)),
+            int(round((x1 + rw) * sx)), int(round((y1 + rh) * sy)),
+        )
+
+    def matches(self, frame_width: int, frame_height: int, pz_reach: float) -> bool:
+        """Check whether this geometry is still valid for the given frame and reach."""
+        return self.frame_size == (frame_width, frame_height) and self.pz_reach == pz_reach
+
+    def crop_view(self, frame: np.ndarray) -> np.ndarray:
+        """Return the zone of a full frame as a view (no copy)."""
+        return frame[self.crop]
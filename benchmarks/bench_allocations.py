@@ -0,0 +1,98 @@
+"""
+Allocation Benchmark - Per-frame allocations and latency, before vs after
+
+Feeds identical synthetic frames through the legacy pipeline (fresh arrays
+every frame) and the current GlazedSensor (preallocated buffers) and reports
+bytes allocated per frame (tracemalloc peak above the steady-state baseline)
+and ms per frame.
+
+Usage:
+    python benchmarks/bench_allocations.py
+    python benchmarks/bench_allocations.py --scenario busy --frames 1000 --active
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from glazed_sensor import GlazedSensor  # noqa: E402
+from legacy_pipeline import LegacyGlazedSensor  # noqa: E402
+
+
+def measure(sensor_cls, scenario: str, frames: int, calibration_mode: bool) -> dict:
+    """
+    Measure allocations and latency for one pipeline variant.
+
+    Returns:
+        dict: alloc_kb_per_frame, allocating_frames, ms_per_frame
+    """
+    # Pass 1: allocations (tracemalloc slows Python, so latency is measured separately)
+    source = SyntheticFrameSource(scenario, num_frames=frames)
+    source.open()
+    sensor = sensor_cls(None, frame_source=source, paced=False)
+    sensor.calibration_mode = calibration_mode
+    ok, frame = source.read()
+    sensor.process_frame(frame)  # Warm-up: first frame sizes any buffers
+
+    tracemalloc.start()
+    total_bytes = 0
+    allocating_frames = 0
+    while True:
+        ok, frame = source.read()
+        if not ok:
+            break
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        sensor.process_frame(frame)
+        _, peak = tracemalloc.get_traced_memory()
+        transient = peak - baseline
+        total_bytes += transient
+        # Anything above a few hundred bytes is an array buffer, not a Python scalar
+        if transient > 1024:
+            allocating_frames += 1
+    tracemalloc.stop()
+    measured = frames - 1
+
+    # Pass 2: latency
+    source = SyntheticFrameSource(scenario, num_frames=frames)
+    source.open()
+    sensor = sensor_cls(None, frame_source=source, paced=False)
+    sensor.calibration_mode = calibration_mode
+    elapsed = 0.0
+    while True:
+        ok, frame = source.read()
+        if not ok:
+            break
+        started = time.perf_counter()
+        sensor.process_frame(frame)
+        elapsed += time.perf_counter() - started
+
+    return {
+        "alloc_kb_per_frame": total_bytes / measured / 1024.0,
+        "allocating_frames": allocating_frames,
+        "ms_per_frame": elapsed / frames * 1000.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-frame allocation benchmark (legacy vs current)")
+    parser.add_argument("--scenario", default="desk", choices=sorted(SyntheticFrameSource.SCENARIOS))
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--active", action="store_true", help="Active (glazed) mode instead of calibration")
+    args = parser.parse_args()
+
+    mode = "active" if args.active else "calibration"
+    print(f"scenario={args.scenario} mode={mode} frames={args.frames}")
+    print(f"{'pipeline':<10} {'KB alloc/frame':>15} {'alloc frames':>13} {'ms/frame':>10}")
+    for label, cls in (("before", LegacyGlazedSensor), ("after", GlazedSensor)):
+        r = measure(cls, args.scenario, args.frames, calibration_mode=not args.active)
+        print(f"{label:<10} {r['alloc_kb_per_frame']:>15.1f} {r['allocating_frames']:>13} {r['ms_per_frame']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Background Model Benchmark - Expensive-path entries and time at full FPS
+
+Replays synthetic scenes through the legacy pipeline and the current
+GlazedSensor with each background model ("last_frame" and
+"running_average") and reports how often the contour path ran, how many
+frames were flagged as motion, and how long the sensor would have spent at
+16.7 FPS (simulated from each frame's target FPS).
+
+Each model runs with illumination compensation off (the background model
+alone; last_frame then matches legacy) and on (the app default).
+last_frame keeps the sum-of-delta early exit, which sensor noise passes on
+nearly every frame. running_average also skips the contour path when no
+pixel differs from the background by more than the binarization
+threshold.
+
+Usage:
+    python benchmarks/bench_background.py
+    python benchmarks/bench_background.py --scenario lowlight --learning-rate 0.1
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from glazed_sensor import GlazedSensor, IDLE_RESOLUTION, DEFAULT_LEARNING_RATE  # noqa: E402
+from legacy_pipeline import LegacyGlazedSensor  # noqa: E402
+
+
+DEFAULT_SCENARIOS = ["idle", "lowlight", "slow", "desk"]
+FULL_FPS = 16.7
+
+
+def replay(sensor, frames: int) -> dict:
+    """
+    Replay a sensor's synthetic source frame by frame at the idle capture size.
+
+    Returns:
+        dict: expensive, motion frames, seconds at full FPS, total simulated seconds
+    """
+    source = sensor.frame_source
+    source.open()
+    source.set_resolution(*IDLE_RESOLUTION)
+    motion = 0
+    full_fps_seconds = 0.0
+    total_seconds = 0.0
+    for _ in range(frames):
+        ok, frame = source.read()
+        if not ok:
+            break
+        _, stable_trigger, _ = sensor.process_frame(frame)
+        motion += int(stable_trigger)
+        # Each frame stands for one sleep interval at the FPS it selected
+        interval = 1.0 / sensor.target_fps
+        total_seconds += interval
+        if sensor.target_fps >= FULL_FPS:
+            full_fps_seconds += interval
+    return {
+        "expensive": sensor.expensive_checks,
+        "motion": motion,
+        "full_fps_seconds": full_fps_seconds,
+        "total_seconds": total_seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare motion background models on replayed scenes")
+    parser.add_argument("--scenario", action="append", choices=sorted(SyntheticFrameSource.SCENARIOS))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--learning-rate", type=float, default=DEFAULT_LEARNING_RATE)
+    args = parser.parse_args()
+
+    variants = [
+        ("legacy", LegacyGlazedSensor, None, None),
+        ("last_frame", GlazedSensor, "last_frame", False),
+        ("running_avg", GlazedSensor, "running_average", False),
+        ("last_frame+ic", GlazedSensor, "last_frame", True),
+        ("running_avg+ic", GlazedSensor, "running_average", True),
+    ]
+    print(f"frames={args.frames} learning_rate={args.learning_rate} (+ic: illumination compensation on)")
+    print(f"{'scenario':<10} {'pipeline':<15} {'expensive':>10} {'motion':>8} {'s @16.7':>9} {'sim s':>8} {'% @16.7':>8}")
+    for scenario in args.scenario or DEFAULT_SCENARIOS:
+        for label, cls, model, compensate in variants:
+            sensor = cls(None, frame_source=SyntheticFrameSource(scenario), paced=False)
+            sensor.calibration_mode = False
+            if model:
+                sensor.background_model = model
+                sensor.learning_rate = args.learning_rate
+                sensor.illumination_compensation = compensate
+            r = replay(sensor, args.frames)
+            print(f"{scenario:<10} {label:<15} {r['expensive']:>10} {r['motion']:>8} "
+                  f"{r['full_fps_seconds']:>9.1f} {r['total_seconds']:>8.1f} "
+                  f"{100.0 * r['full_fps_seconds'] / r['total_seconds']:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Calibration Preview Benchmark - Full-resolution blend vs downscale-first renderer
+
+Renders the calibration preview for the same synthetic frames three ways:
+
+    legacy     frame.copy(), outline, overlay.copy(), addWeighted, resize
+               (the original GlazedSensor code)
+    buffered   the same steps into preallocated full-resolution buffers
+    renderer   CalibrationPreviewRenderer: resize, dim, cached outline
+
+and reports ms per render and the pixel difference from the legacy output
+at each capture size: away from the zone outline (the camera image), and
+the mean over the whole preview (the outline is drawn after the downscale,
+so its edges are not anti-aliased the same way).
+
+Usage:
+    python benchmarks/bench_calibration_preview.py
+    python benchmarks/bench_calibration_preview.py --renders 1000 --reach 0.5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+
+from calibration_preview import CalibrationPreviewRenderer  # noqa: E402
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from zone_geometry import ZoneGeometry  # noqa: E402
+
+
+SIZES = [(640, 480), (1280, 720), (1920, 1080)]
+
+
+def legacy_preview(frame, geometry):
+    h, w, _ = frame.shape
+    x1, y1, x2, y2 = geometry.zone_rect
+    display_frame = frame.copy()
+    cv2.rectangle(display_frame, (x1, y1), (x2, y2), (0, 255, 204), 2)
+    overlay = display_frame.copy()
+    cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 0), -1)
+    cv2.addWeighted(overlay, 0.6, display_frame, 0.4, 0, display_frame)
+    return cv2.resize(display_frame, (320, 240))
+
+
+class BufferedPreview:
+    """The preallocated-buffer version GlazedSensor used before the renderer."""
+
+    def __init__(self, h, w):
+        self.display = np.empty((h, w, 3), np.uint8)
+        self.overlay = np.zeros((h, w, 3), np.uint8)
+        self.preview = np.empty((240, 320, 3), np.uint8)
+
+    def __call__(self, frame, geometry):
+        np.copyto(self.display, frame)
+        x1, y1, x2, y2 = geometry.zone_rect
+        cv2.rectangle(self.display, (x1, y1), (x2, y2), (0, 255, 204), 2)
+        cv2.addWeighted(self.overlay, 0.6, self.display, 0.4, 0, self.display)
+        return cv2.resize(self.display, (320, 240), dst=self.preview)
+
+
+def outline_band(geometry) -> np.ndarray:
+    """Preview pixels within a couple of pixels of the zone outline."""
+    band = np.zeros((240, 320), np.uint8)
+    x1, y1, x2, y2 = geometry.preview_rect
+    cv2.rectangle(band, (x1, y1), (x2, y2), 255, 5)
+    return band > 0
+
+
+def time_renders(render, frames, geometry) -> float:
+    started = time.perf_counter()
+    for frame in frames:
+        render(frame, geometry)
+    return (time.perf_counter() - started) / len(frames) * 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare calibration preview renderers")
+    parser.add_argument("--renders", type=int, default=300)
+    parser.add_argument("--reach", type=float, default=0.7)
+    args = parser.parse_args()
+
+    print(f"renders={args.renders} reach={args.reach}")
+    print(f"{'capture':<10} {'renderer':<10} {'ms/render':>10} {'speedup':>8} {'max diff off outline':>21} {'mean diff':>10}")
+    for width, height in SIZES:
+        source = SyntheticFrameSource("busy", num_frames=args.renders, width=width, height=height)
+        source.open()
+        frames = []
+        while True:
+            ok, frame = source.read()
+            if not ok:
+                break
+            frames.append(frame)
+        geometry = ZoneGeometry(width, height, args.reach)
+        renderer = CalibrationPreviewRenderer()
+        variants = [("legacy", legacy_preview), ("buffered", BufferedPreview(height, width)),
+                    ("renderer", renderer.render)]
+        reference = [legacy_preview(frame, geometry) for frame in frames[:20]]
+        off_outline = ~outline_band(geometry)
+        baseline = None
+        for label, render in variants:
+            ms = time_renders(render, frames, geometry)
+            baseline = baseline or ms
+            diffs = [cv2.absdiff(render(frame, geometry), ref) for frame, ref in zip(frames, reference)]
+            print(f"{f'{width}x{height}':<10} {label:<10} {ms:>10.3f} {baseline / ms:>7.1f}x "
+                  f"{max(int(d[off_outline].max()) for d in diffs):>21} {np.mean([d.mean() for d in diffs]):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
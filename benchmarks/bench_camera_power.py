@@ -0,0 +1,135 @@
+"""
+Camera Power Benchmark - Always-on capture vs PresenceEngine-driven power
+
+Drives a real PresenceEngine and GlazedSensor with a scripted keyboard/mouse
+timeline (typing, short breaks, one walk-away that ends in a lock) on a
+synthetic live camera with a simulated open latency, once with the camera
+always on and once with camera_on_demand. Reports how long the device was
+open, frames analyzed, power-ups, the measured power-up-to-first-frame
+latency, and warnings that began before the camera was ready (should be 0:
+the prewarm hides the open latency).
+
+The engine ticks once per real second, so the default timeline takes about
+a minute.
+
+Usage:
+    python benchmarks/bench_camera_power.py
+    python benchmarks/bench_camera_power.py --open-ms 1500 --prewarm 2
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from bench_lifecycle import LiveSyntheticSource  # noqa: E402
+from glazed_sensor import GlazedSensor  # noqa: E402
+from presence_engine import PresenceEngine, PresenceState  # noqa: E402
+
+
+# (activity, seconds): "typing" keeps HID fresh, "away" leaves it idle
+DEFAULT_TIMELINE = [("typing", 8), ("away", 4), ("typing", 6), ("away", 24), ("typing", 6), ("away", 8)]
+LOCK_TIMEOUT = 14
+WARNING_THRESHOLD = 6
+
+
+class ScriptedHID:
+    """HID monitor stand-in: idle time follows the timeline."""
+
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.started = time.monotonic()
+        self.last_input = self.started
+
+    def get_idle_seconds(self) -> float:
+        now = time.monotonic()
+        elapsed = now - self.started
+        for activity, seconds in self.timeline:
+            if elapsed < seconds:
+                if activity == "typing":
+                    self.last_input = now
+                break
+            elapsed -= seconds
+        return now - self.last_input
+
+
+class MeteredSource(LiveSyntheticSource):
+    """Keeps a running total of time the device was open."""
+
+    def __init__(self, scenario: str, open_seconds: float):
+        super().__init__(scenario, open_seconds)
+        self.open_total = 0.0
+        self._opened_at = None
+
+    def open(self) -> bool:
+        ok = super().open()
+        if ok:
+            self._opened_at = time.monotonic()
+        return ok
+
+    def release(self) -> None:
+        if self._opened_at is not None:
+            self.open_total += time.monotonic() - self._opened_at
+            self._opened_at = None
+        super().release()
+
+
+def run(on_demand: bool, timeline, open_seconds: float, prewarm: float) -> dict:
+    source = MeteredSource("idle", open_seconds)
+    sensor = GlazedSensor(lambda *a, **k: None, frame_source=source, paced=True)
+    sensor.calibration_mode = False
+    if on_demand:
+        sensor.power_down()
+    sensor.start()
+    engine = PresenceEngine(ScriptedHID(timeline), sensor, lock_timeout_seconds=LOCK_TIMEOUT,
+                            warning_threshold_seconds=WARNING_THRESHOLD,
+                            camera_on_demand=on_demand, camera_prewarm_seconds=prewarm)
+    locks = []
+    engine.on_lock_triggered(lambda: locks.append(time.monotonic()))
+    warnings = []
+    engine.on_state_changed(lambda e: warnings.append(e) if e.new_state == PresenceState.WARNING else None)
+
+    total = sum(seconds for _, seconds in timeline)
+    started = time.monotonic()
+    next_tick = started + 1.0
+    while next_tick - started <= total:
+        time.sleep(max(0.0, next_tick - time.monotonic()))
+        engine.tick()
+        next_tick += 1.0
+    sensor.stop()
+    stats = sensor.get_stats()
+    power = engine.get_camera_power_stats()
+    return {
+        "open_seconds": source.open_total,
+        "seconds": total,
+        "frames": stats["frames"],
+        "power_ups": power["power_ups"],
+        "wake_ms": stats["wake_latency_ms"],
+        "warnings": len(warnings),
+        "cold": power["cold_warnings"],
+        "locks": len(locks),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare always-on and engine-driven camera power")
+    parser.add_argument("--open-ms", type=float, default=800.0, help="Simulated device open latency")
+    parser.add_argument("--prewarm", type=float, default=PresenceEngine.CAMERA_PREWARM_SECONDS)
+    args = parser.parse_args()
+
+    timeline = DEFAULT_TIMELINE
+    print(f"timeline: {sum(s for _, s in timeline)} s, lock after {LOCK_TIMEOUT} idle ticks, "
+          f"open {args.open_ms:g} ms, prewarm {args.prewarm:g} s")
+    print(f"{'camera':<10} {'open s':>7} {'open %':>7} {'frames':>7} {'power-ups':>10} "
+          f"{'wake ms':>8} {'warnings':>9} {'cold':>5} {'locks':>6}")
+    for label, on_demand in (("always-on", False), ("on-demand", True)):
+        r = run(on_demand, timeline, args.open_ms / 1000.0, args.prewarm)
+        wake = f"{r['wake_ms']:.0f}" if r["wake_ms"] is not None else "-"
+        print(f"{label:<10} {r['open_seconds']:>7.1f} {r['open_seconds'] / r['seconds']:>7.0%} {r['frames']:>7} "
+              f"{r['power_ups']:>10} {wake:>8} {r['warnings']:>9} {r['cold']:>5} {r['locks']:>6}")
+
+
+if __name__ == "__main__":
+    main()
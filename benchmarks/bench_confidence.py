@@ -0,0 +1,118 @@
+"""
+Confidence Benchmark - Presence confidence vs how often it is polled
+
+Part 1: a 45 s Kitten Buffer after the last motion, polled at different
+rates. The legacy refresh subtracted 0.1 / buffer per call (calibrated for
+10 Hz), so the value and the moment it hits 0 (Guardian Act I) moved with
+the poll rate; PresenceConfidence is evaluated in closed form.
+
+Part 2: PresenceEngine on a simulated clock, last input at t=0, ticked at
+different cadences. Reports presence_confidence() at a few query times and
+at the moment the lock fired (must be 0, which Act I requires).
+
+Usage:
+    python benchmarks/bench_confidence.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from presence_confidence import PresenceConfidence  # noqa: E402
+from presence_engine import PresenceEngine  # noqa: E402
+
+
+BUFFER_SECONDS = 45
+RATES_HZ = [10.0, 4.0, 1.0, 0.2]  # 10 Hz: the old shown window; lower: hidden/timer-driven refresh
+QUERY_SECONDS = [10, 30, 50]
+TICK_CADENCES = [0.1, 1.0, None]  # None: only at next_transition_time()
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class IdleHID:
+    """No input since t=0."""
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def get_idle_seconds(self) -> float:
+        return self.clock()
+
+
+def legacy(rate_hz: float) -> dict:
+    """The old per-call decay: value at the query times and when it reached 0."""
+    confidence, t, step = 1.0, 0.0, 1.0 / rate_hz
+    values, empty_at = {}, None
+    while empty_at is None or len(values) < len(QUERY_SECONDS):
+        t += step
+        confidence = max(0, confidence - 0.1 / BUFFER_SECONDS)
+        for q in QUERY_SECONDS:
+            if q not in values and t >= q:
+                values[q] = confidence
+        if confidence <= 0 and empty_at is None:
+            empty_at = t
+    return {"values": values, "empty_at": empty_at}
+
+
+def closed_form(rate_hz: float) -> dict:
+    model = PresenceConfidence(BUFFER_SECONDS)
+    model.observe("camera", 0.0)
+    t, step = 0.0, 1.0 / rate_hz
+    values, empty_at = {}, None
+    while empty_at is None or len(values) < len(QUERY_SECONDS):
+        t += step
+        confidence = model.confidence(t)
+        for q in QUERY_SECONDS:
+            if q not in values and t >= q:
+                values[q] = model.confidence(q)  # Any query time, not just poll times
+        if confidence <= 0 and empty_at is None:
+            empty_at = t
+    return {"values": values, "empty_at": empty_at}
+
+
+def engine_run(cadence) -> dict:
+    clock = SimClock()
+    engine = PresenceEngine(IdleHID(clock), None, clock=clock)
+    locks = []
+    engine.on_lock_triggered(lambda: locks.append((clock.now, engine.presence_confidence())))
+    values = {}
+    while not locks:
+        clock.now = clock.now + cadence if cadence else engine.next_transition_time()
+        engine.tick()
+        for q in QUERY_SECONDS:
+            if q not in values and clock.now >= q:
+                values[q] = engine.presence_confidence(q)
+    return {"values": values, "lock_at": locks[0][0], "at_lock": locks[0][1]}
+
+
+def fmt(values: dict) -> str:
+    return "  ".join(f"{values[q]:.2f}" for q in QUERY_SECONDS)
+
+
+def main():
+    queries = "  ".join(f"t={q}s" for q in QUERY_SECONDS)
+    print(f"Kitten Buffer {BUFFER_SECONDS}s after the last motion; confidence at {queries}")
+    print(f"{'poll':>7}  {'legacy':<20} {'reaches 0':>10}   {'closed form':<20} {'reaches 0':>10}")
+    for rate in RATES_HZ:
+        old, new = legacy(rate), closed_form(rate)
+        print(f"{rate:>5g}Hz  {fmt(old['values']):<20} {old['empty_at']:>9.1f}s   "
+              f"{fmt(new['values']):<20} {new['empty_at']:>9.1f}s")
+
+    print(f"\nPresenceEngine, 60 s timeout, idle since t=0; presence_confidence() at {queries}")
+    print(f"{'ticks':>12}  {'confidence':<20} {'lock at':>8} {'at lock':>8}")
+    for cadence in TICK_CADENCES:
+        r = engine_run(cadence)
+        label = f"every {cadence:g}s" if cadence else "deadlines"
+        print(f"{label:>12}  {fmt(r['values']):<20} {r['lock_at']:>7.1f}s {r['at_lock']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
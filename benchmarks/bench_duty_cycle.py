@@ -0,0 +1,92 @@
+"""
+Duty Cycle Benchmark - Time and frames per FPS tier over a simulated day
+
+Replays a schedule of synthetic scenes (empty room, someone at the desk,
+busy periods) through the legacy frame-counter tiers and the time-based
+AdaptiveFpsController, on simulated time: each frame advances the clock by
+one interval at the rate the sensor selected. Reports seconds per tier,
+analyzed frames, average FPS and the frame load relative to running at
+16.7 FPS all the time (the "before" column in POWER_OPTIMIZATION_STRATEGY.md).
+
+Usage:
+    python benchmarks/bench_duty_cycle.py
+    python benchmarks/bench_duty_cycle.py --budget 20000
+    python benchmarks/bench_duty_cycle.py --schedule idle:600 --schedule busy:120
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from fps_controller import AdaptiveFpsController, DEFAULT_TIERS  # noqa: E402
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from glazed_sensor import GlazedSensor, IDLE_RESOLUTION  # noqa: E402
+from legacy_pipeline import LegacyGlazedSensor  # noqa: E402
+
+
+# Twenty minutes: at the desk, empty room, fidgeting (short bursts of motion with
+# stillness in between, where frame-counted decay and time-based decay differ),
+# a busy spell, then empty again
+DEFAULT_SCHEDULE = (["desk:300", "idle:240"] + ["busy:2", "idle:10"] * 20
+                    + ["busy:120", "idle:300"])
+TOP_FPS = DEFAULT_TIERS[-1].fps
+
+
+def simulate(sensor, schedule) -> dict:
+    """Run the schedule on simulated time; returns per-rate seconds and frames."""
+    seconds_at = {}
+    frames = 0
+    for scenario, duration in schedule:
+        source = SyntheticFrameSource(scenario)
+        source.open()
+        source.set_resolution(*IDLE_RESOLUTION)
+        sensor.last_gray = None  # Scene cut: do not diff across segments
+        elapsed = 0.0
+        while elapsed < duration:
+            ok, frame = source.read()
+            if not ok:
+                break
+            sensor.process_frame(frame)
+            frames += 1
+            interval = 1.0 / sensor.target_fps
+            seconds_at[sensor.target_fps] = seconds_at.get(sensor.target_fps, 0.0) + interval
+            elapsed += interval
+    total = sum(seconds_at.values())
+    return {"seconds_at": seconds_at, "frames": frames, "seconds": total}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure FPS tier duty cycles over a simulated schedule")
+    parser.add_argument("--schedule", action="append",
+                        help="scenario:seconds segment (repeatable, default is a one-hour mix)")
+    parser.add_argument("--budget", type=int, default=0, help="Energy budget in analyzed frames per hour")
+    args = parser.parse_args()
+
+    schedule = []
+    for item in args.schedule or DEFAULT_SCHEDULE:
+        scenario, _, seconds = item.partition(":")
+        schedule.append((scenario, float(seconds or 60)))
+
+    variants = [("legacy", LegacyGlazedSensor, None), ("time-based", GlazedSensor, 0)]
+    if args.budget:
+        variants.append((f"budget {args.budget}/h", GlazedSensor, args.budget))
+
+    print(f"schedule: {len(schedule)} segments, {sum(d for _, d in schedule):.0f} s simulated")
+    rates = [tier.fps for tier in DEFAULT_TIERS]
+    header = " ".join(f"{'s @' + format(r, 'g'):>9}" for r in rates)
+    print(f"{'controller':<16} {header} {'frames':>8} {'avg fps':>8} {'load':>7}")
+    for label, cls, budget in variants:
+        sensor = cls(None, frame_source=SyntheticFrameSource("idle"), paced=False)
+        sensor.calibration_mode = False
+        if budget is not None:
+            sensor.fps_controller = AdaptiveFpsController(energy_budget=budget)
+        result = simulate(sensor, schedule)
+        per_rate = " ".join(f"{result['seconds_at'].get(r, 0.0):>9.0f}" for r in rates)
+        average = result["frames"] / result["seconds"] if result["seconds"] else 0.0
+        print(f"{label:<16} {per_rate} {result['frames']:>8} {average:>8.2f} {average / TOP_FPS:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Engine Timing Benchmark - Lock timing vs tick cadence, and ticks per idle hour
+
+Drives PresenceEngine on a simulated clock with a user who stops typing at
+t=0 and never comes back, ticking it at several fixed cadences (10 Hz like
+App.update_loop, 1 Hz, jittery 0.5-1.5 s) and once by sleeping until
+next_transition_time(). Reports when WARNING and the first lock happened
+(should be the configured times regardless of cadence, to within one
+tick) and how many ticks an hour of that costs.
+
+Usage:
+    python benchmarks/bench_engine_timing.py
+    python benchmarks/bench_engine_timing.py --timeout 300 --warning 30
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from presence_engine import PresenceEngine, PresenceState  # noqa: E402
+
+
+HOUR = 3600.0
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class IdleHID:
+    """No input since t=0."""
+
+    def __init__(self, clock: SimClock):
+        self.clock = clock
+
+    def get_idle_seconds(self) -> float:
+        return self.clock.now
+
+
+def run(cadence, timeout: int, warning: int) -> dict:
+    clock = SimClock()
+    engine = PresenceEngine(IdleHID(clock), None, lock_timeout_seconds=timeout,
+                            warning_threshold_seconds=warning, clock=clock)
+    first = {}
+    engine.on_state_changed(lambda e: first.setdefault(e.new_state, clock.now))
+    ticks = 0
+    while clock.now < HOUR:
+        clock.now = cadence(engine, clock.now)
+        engine.tick()
+        ticks += 1
+    return {"warning": first.get(PresenceState.WARNING), "lock": first.get(PresenceState.LOCKING), "ticks": ticks}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check PresenceEngine timing against tick cadence")
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--warning", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    cadences = [
+        ("10 Hz", lambda engine, now: now + 0.1),
+        ("1 Hz", lambda engine, now: now + 1.0),
+        ("jitter", lambda engine, now: now + rng.uniform(0.5, 1.5)),
+        ("scheduled", lambda engine, now: engine.next_transition_time(now)),
+    ]
+    print(f"lock timeout {args.timeout}s, warning {args.warning}s, one simulated idle hour")
+    print(f"{'cadence':<10} {'warning at s':>13} {'lock at s':>10} {'ticks/hour':>11}")
+    for label, cadence in cadences:
+        r = run(cadence, args.timeout, args.warning)
+        print(f"{label:<10} {r['warning']:>13.1f} {r['lock']:>10.1f} {r['ticks']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Event Dispatch Benchmark - tick() latency with inline vs queued event handlers
+
+Runs PresenceEngine on a simulated clock through 125 s cycles: input, 55 s
+idle (WARNING, then back to ACTIVE), input, 70 s idle (WARNING, lock), with
+App's handler pattern attached:
+the state handler logs into a real GuardianMode whose audit log is a JSON
+file already holding --events entries, so every state change rewrites it.
+The lock handler runs Guardian Act I.
+
+Compares the synchronous dispatcher (handlers inline, as before) with the
+queued one App uses. Reports tick() time (mean/max) for ordinary ticks and
+for the ticks that locked (the lock handler stays inline and Act I writes
+the audit log itself), that events arrived in order (each event's old
+state is the previous one's new state), per-handler counters, and drops
+with a deliberately tiny queue.
+
+Usage:
+    python benchmarks/bench_event_dispatch.py
+    python benchmarks/bench_event_dispatch.py --events 20000 --cycles 100
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from event_dispatcher import EventDispatcher  # noqa: E402
+from guardian_mode import GuardianMode  # noqa: E402
+from presence_engine import PresenceEngine  # noqa: E402
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+CYCLE_SECONDS = 125.0
+RETURN_SECONDS = 55.0  # Second input of each cycle; the 70 s after it end in a lock
+
+
+class CycleHID:
+    """Input at the start of each cycle and RETURN_SECONDS into it."""
+
+    def __init__(self, clock: SimClock):
+        self.clock = clock
+
+    def get_idle_seconds(self) -> float:
+        into = self.clock.now % CYCLE_SECONDS
+        return into - RETURN_SECONDS if into >= RETURN_SECONDS else into
+
+
+class QuietHPD:
+    def inhibit_sleep(self):
+        pass
+
+    def allow_sleep(self):
+        pass
+
+    def lock_workstation(self):
+        return True
+
+
+def run(dispatcher: EventDispatcher, audit_path: str, cycles: int) -> dict:
+    clock = SimClock()
+    engine = PresenceEngine(CycleHID(clock), None, clock=clock, dispatcher=dispatcher)
+    guardian = GuardianMode(QuietHPD(), audit_log_path=audit_path)
+    guardian.enabled = True
+    seen = []
+
+    def on_state_changed(event):
+        seen.append(event)
+        guardian.log_event("PRESENCE_STATE_CHANGE", f"State: {event.old_state.value} -> {event.new_state.value}")
+
+    locks = []
+
+    def on_lock():
+        locks.append(clock.now)
+        guardian.lock_triggered = False  # Let every cycle lock
+        guardian.act_i_lock_door(engine.presence_confidence())
+
+    engine.on_state_changed(on_state_changed)
+    engine.on_lock_triggered(on_lock)
+
+    tick_times, lock_ticks = [], []
+    end = cycles * CYCLE_SECONDS
+    while True:
+        wake = engine.next_transition_time()
+        if wake > end:
+            break
+        clock.now = wake
+        locked = len(locks)
+        started = time.perf_counter()
+        engine.tick()
+        (lock_ticks if len(locks) > locked else tick_times).append(time.perf_counter() - started)
+    drained_started = time.perf_counter()
+    dispatcher.flush()
+    drain = time.perf_counter() - drained_started
+    stats = dispatcher.get_stats()
+    return {
+        "ticks": len(tick_times) + len(lock_ticks),
+        "tick_mean_ms": sum(tick_times) * 1000.0 / len(tick_times),
+        "tick_max_ms": max(tick_times) * 1000.0,
+        "lock_mean_ms": sum(lock_ticks) * 1000.0 / len(lock_ticks),
+        "in_order": all(a.new_state == b.old_state for a, b in zip(seen, seen[1:])),
+        "delivered": len(seen),
+        "posted": len(seen) + stats["dropped"],
+        "drain_ms": drain * 1000.0,
+        "stats": stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="tick() latency with inline vs queued engine event handlers")
+    parser.add_argument("--events", type=int, default=5000, help="Entries already in the audit log")
+    parser.add_argument("--cycles", type=int, default=40, help="Idle/return cycles")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "audit_log.json")
+        seed = {"events": [{"timestamp": "2026-01-01T00:00:00", "type": "PRESENCE_STATE_CHANGE",
+                            "details": "State: active -> warning"}] * args.events}
+        rows = []
+        for label, dispatcher in (("inline", EventDispatcher(synchronous=True, tag="PresenceEngine")),
+                                  ("queued", EventDispatcher(tag="PresenceEngine")),
+                                  ("queued, size 2", EventDispatcher(max_queue=2, tag="PresenceEngine"))):
+            with open(path, "w") as f:
+                json.dump(seed, f)
+            with contextlib.redirect_stdout(io.StringIO()):
+                r = run(dispatcher, path, args.cycles)
+                dispatcher.stop()
+            rows.append((label, r))
+
+    print(f"audit log starts with {args.events} entries; {args.cycles} idle cycles, state handler rewrites it")
+    print(f"{'dispatch':<15} {'ticks':>6} {'tick mean ms':>13} {'tick max ms':>12} {'lock tick ms':>13} "
+          f"{'delivered':>10} {'dropped':>8} {'in order':>9} {'drain ms':>9}")
+    for label, r in rows:
+        s = r["stats"]
+        in_order = str(r["in_order"]) if not s["dropped"] else "-"
+        print(f"{label:<15} {r['ticks']:>6} {r['tick_mean_ms']:>13.3f} {r['tick_max_ms']:>12.2f} "
+              f"{r['lock_mean_ms']:>13.2f} {r['delivered']:>6}/{r['posted']:<3} {s['dropped']:>8} "
+              f"{in_order:>9} {r['drain_ms']:>9.1f}")
+    print("\nper handler (queued):")
+    for key, h in rows[1][1]["stats"]["handlers"].items():
+        print(f"  {key:<60} calls {h['calls']:>4}  failures {h['failures']}  mean {h['mean_ms']:.2f} ms  "
+              f"max {h['max_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
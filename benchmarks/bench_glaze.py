@@ -0,0 +1,73 @@
+"""
+Glaze Benchmark - Fog Mode preview cost, legacy blur vs GlazeRenderer
+
+Renders the same 20x15 zone thumbnails with the original path
+(nearest-neighbour upsample to 320x240 + 99x99 GaussianBlur) and with
+GlazeRenderer, and reports ms per render plus the pixel difference between
+the two outputs.
+
+Usage:
+    python benchmarks/bench_glaze.py
+    python benchmarks/bench_glaze.py --renders 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from glaze import GlazeRenderer  # noqa: E402
+
+
+def legacy_glaze(small: np.ndarray) -> np.ndarray:
+    """Original Fog Mode path from GlazedSensor."""
+    glazed = cv2.resize(small, (320, 240), interpolation=cv2.INTER_NEAREST)
+    return cv2.GaussianBlur(glazed, (99, 99), 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Fog Mode glaze renderers")
+    parser.add_argument("--renders", type=int, default=500)
+    args = parser.parse_args()
+
+    # Thumbnails from a moving synthetic scene, as GlazedSensor would produce them
+    source = SyntheticFrameSource("busy", num_frames=args.renders)
+    source.open()
+    thumbs = []
+    while True:
+        ok, frame = source.read()
+        if not ok:
+            break
+        thumbs.append(cv2.resize(frame[72:408, 96:544], (20, 15), interpolation=cv2.INTER_LINEAR))
+
+    renderer = GlazeRenderer()
+    timings = {}
+    for label, fn in (("legacy", legacy_glaze), ("renderer", renderer.render)):
+        started = time.perf_counter()
+        for small in thumbs:
+            fn(small)
+        timings[label] = (time.perf_counter() - started) / len(thumbs) * 1000.0
+
+    max_diff = 0
+    total_diff = 0.0
+    for small in thumbs:
+        diff = cv2.absdiff(legacy_glaze(small), renderer.render(small))
+        max_diff = max(max_diff, int(diff.max()))
+        total_diff += float(diff.mean())
+
+    print(f"renders={len(thumbs)}")
+    print(f"{'path':<10} {'ms/render':>10}")
+    for label, ms in timings.items():
+        print(f"{label:<10} {ms:>10.3f}")
+    print(f"speedup: {timings['legacy'] / timings['renderer']:.1f}x")
+    print(f"difference vs legacy: max {max_diff} levels, mean {total_diff / len(thumbs):.3f} levels")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Identity Benchmark - Windows Hello verification without blocking the engine
+
+Part 1 (simulated clock, FakeIdentityVerifier): an idle user reaches
+WARNING, the engine opens a prompt, and the script answers it (verified,
+declined, after the lock, or never). Reports when the first lock happened,
+how many warnings there were and the engine's identity counters.
+
+Part 2 (real time): a verifier whose prompt stays open for --prompt-ms,
+called the old way (verify_user() inside tick()) and through
+request_verification(). Reports the longest tick() and how many ticks ran
+while the prompt was open, i.e. how long the Tk thread would have frozen.
+
+Usage:
+    python benchmarks/bench_identity.py
+    python benchmarks/bench_identity.py --prompt-ms 3000
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import Future
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from identity_service import FakeIdentityVerifier, IdentityService  # noqa: E402
+from presence_engine import PresenceEngine, PresenceState  # noqa: E402
+
+
+LOCK_TIMEOUT = 60
+WARNING_THRESHOLD = 10
+# (label, seconds after the prompt opened, answer); None: never answered
+CASES = [
+    ("verified +3s", 3, True),
+    ("declined +2s", 2, False),
+    ("verified late", 15, True),
+    ("no answer", None, None),
+]
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class IdleHID:
+    """No input since t=0."""
+
+    def __init__(self, clock):
+        self.clock = clock
+
+    def get_idle_seconds(self) -> float:
+        return self.clock()
+
+
+class RealIdleHID:
+    """No input since construction, on the real clock."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+
+    def get_idle_seconds(self) -> float:
+        return time.monotonic() - self.started
+
+
+def run_case(answer_after, verified, seconds: float = 90.0) -> dict:
+    clock = SimClock()
+    verifier = FakeIdentityVerifier()
+    engine = PresenceEngine(IdleHID(clock), None, lock_timeout_seconds=LOCK_TIMEOUT,
+                            warning_threshold_seconds=WARNING_THRESHOLD, identity_service=verifier, clock=clock)
+    locks, warnings = [], []
+    engine.on_lock_triggered(lambda: locks.append(clock.now))
+    engine.on_state_changed(lambda e: warnings.append(clock.now) if e.new_state == PresenceState.WARNING else None)
+    prompt_at = None
+    while True:
+        # Sleep until the engine's next deadline or the scripted answer, whichever is first
+        wake = engine.next_transition_time()
+        answer_at = prompt_at + answer_after if prompt_at is not None and answer_after is not None else None
+        if answer_at is not None and answer_at <= wake and verifier.pending:
+            clock.now = answer_at
+            verifier.resolve(verified)
+            continue
+        if wake > seconds:
+            break
+        clock.now = wake
+        engine.tick()
+        if prompt_at is None and verifier.requests:
+            prompt_at = clock.now
+    return {"lock": locks[0] if locks else None, "warnings": len(warnings), **engine.get_identity_stats()}
+
+
+class SlowPrompt(IdentityService):
+    """IdentityService whose prompt stays open for a fixed time, then verifies."""
+
+    def __init__(self, prompt_seconds: float):
+        self.prompt_seconds = prompt_seconds
+        super().__init__()
+        self._available = True
+
+    def verify_user(self, message: str = "Verify your identity") -> bool:
+        time.sleep(self.prompt_seconds)
+        return True
+
+
+class BlockingPrompt(SlowPrompt):
+    """The old call pattern: the prompt runs inside tick()."""
+
+    def request_verification(self, message: str = "Verify your identity") -> Future:
+        future = Future()
+        future.set_result(self.verify_user(message))
+        return future
+
+
+def run_real(verifier, prompt_seconds: float) -> dict:
+    # Warning 0.2 s into the run; tick every 50 ms for prompt + 1 s
+    engine = PresenceEngine(RealIdleHID(), None, lock_timeout_seconds=30,
+                            warning_threshold_seconds=29.8, identity_service=verifier)
+    longest, ticks, during = 0.0, 0, 0
+    end = time.monotonic() + prompt_seconds + 1.0
+    while time.monotonic() < end:
+        started = time.perf_counter()
+        engine.tick()
+        longest = max(longest, time.perf_counter() - started)
+        ticks += 1
+        during += engine.identity_pending
+        time.sleep(0.05)
+    return {"longest_ms": longest * 1000.0, "ticks": ticks, "during": during,
+            "verified": engine.get_identity_stats()["verified"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exercise the asynchronous identity flow")
+    parser.add_argument("--prompt-ms", type=float, default=1500.0, help="How long the real-time prompt stays open")
+    args = parser.parse_args()
+
+    print(f"simulated: lock timeout {LOCK_TIMEOUT}s, warning {WARNING_THRESHOLD}s, prompt opens at WARNING")
+    print(f"{'case':<15} {'first lock s':>13} {'warnings':>9} {'verified':>9} {'declined':>9} {'timeouts':>9}")
+    for label, after, verified in CASES:
+        r = run_case(after, verified)
+        lock = f"{r['lock']:.1f}" if r["lock"] is not None else "-"
+        print(f"{label:<15} {lock:>13} {r['warnings']:>9} {r['verified']:>9} {r['declined']:>9} {r['timeouts']:>9}")
+
+    prompt_seconds = args.prompt_ms / 1000.0
+    print(f"\nreal time: prompt open {args.prompt_ms:g} ms, tick every 50 ms")
+    print(f"{'call':<10} {'longest tick ms':>16} {'ticks':>6} {'ticks while prompt open':>24} {'verified':>9}")
+    for label, verifier in (("blocking", BlockingPrompt(prompt_seconds)), ("async", SlowPrompt(prompt_seconds))):
+        r = run_real(verifier, prompt_seconds)
+        print(f"{label:<10} {r['longest_ms']:>16.1f} {r['ticks']:>6} {r['during']:>24} {r['verified']:>9}")
+
+
+if __name__ == "__main__":
+    main()
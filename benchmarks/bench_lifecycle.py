@@ -0,0 +1,112 @@
+"""
+Lifecycle Benchmark - Wakeups while paused and time to stop the capture thread
+
+Runs a paced sensor on a synthetic scene, pauses it, and counts how often
+the capture thread woke up during the pause, then measures how long after
+stop() the thread is gone (and with it the device handle). Compared:
+
+    polling    the previous loop: time.sleep(0.1) while paused, plain sleeps
+               between frames, stop() that does not wait for the thread
+    condition  GlazedSensor as it is now (waits on a condition variable)
+    release    condition, plus release_on_pause_seconds=1 so the source is
+               closed during the pause and reopened on resume
+
+The synthetic source is marked live and given a simulated open latency so
+the release/reopen path runs as it would for a camera.
+
+Usage:
+    python benchmarks/bench_lifecycle.py
+    python benchmarks/bench_lifecycle.py --pause 10 --open-ms 300
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from glazed_sensor import GlazedSensor  # noqa: E402
+
+
+class LiveSyntheticSource(SyntheticFrameSource):
+    """Synthetic scene that behaves like a device: live, slow to open."""
+
+    is_live = True
+
+    def __init__(self, scenario: str, open_seconds: float):
+        super().__init__(scenario)
+        self.open_seconds = open_seconds
+
+    def open(self) -> bool:
+        time.sleep(self.open_seconds)
+        return super().open()
+
+
+class PollingSensor(GlazedSensor):
+    """The lifecycle before condition variables, for comparison."""
+
+    def _wait(self, seconds):
+        time.sleep(seconds)
+        self.wakeups += 1
+
+    def _wait_while_paused(self):
+        time.sleep(0.1)
+        self.wakeups += 1
+        return self.running
+
+    def stop(self, timeout=None):
+        self.running = False
+
+
+def measure(label: str, sensor: GlazedSensor, pause_seconds: float) -> None:
+    sensor.calibration_mode = False
+    sensor.start()
+    time.sleep(2.0)
+    sensor.pause()
+    time.sleep(0.2)  # Let an in-flight frame finish
+    before = sensor.wakeups
+    time.sleep(pause_seconds)
+    paused_wakeups = sensor.wakeups - before
+    resumed_at = time.perf_counter()
+    frames_before = sensor.frame_count
+    sensor.resume()
+    while sensor.frame_count == frames_before and time.perf_counter() - resumed_at < 5.0:
+        time.sleep(0.001)
+    first_frame_ms = (time.perf_counter() - resumed_at) * 1000.0
+
+    stop_started = time.perf_counter()
+    sensor.stop()
+    while sensor.is_alive():
+        time.sleep(0.001)
+    stop_ms = (time.perf_counter() - stop_started) * 1000.0
+    stats = sensor.get_stats()
+    reopen = stats["last_reopen_ms"]
+    print(f"{label:<10} {paused_wakeups:>15} {paused_wakeups / pause_seconds:>9.1f} "
+          f"{first_frame_ms:>15.1f} {stop_ms:>12.1f} {stats['camera_releases']:>9} "
+          f"{(f'{reopen:.0f}' if reopen is not None else '-'):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count wakeups while paused and time sensor shutdown")
+    parser.add_argument("--pause", type=float, default=5.0, help="Seconds to stay paused")
+    parser.add_argument("--open-ms", type=float, default=150.0, help="Simulated device open latency")
+    parser.add_argument("--scenario", default="idle")
+    args = parser.parse_args()
+
+    open_seconds = args.open_ms / 1000.0
+    print(f"scenario={args.scenario} pause={args.pause:g}s open={args.open_ms:g}ms")
+    print(f"{'lifecycle':<10} {'paused wakeups':>15} {'per sec':>9} {'resume->frame ms':>15} "
+          f"{'stop->exit ms':>12} {'releases':>9} {'reopen ms':>10}")
+    for label, cls, release_after in (("polling", PollingSensor, 0.0),
+                                      ("condition", GlazedSensor, 0.0),
+                                      ("release", GlazedSensor, 1.0)):
+        sensor = cls(None, frame_source=LiveSyntheticSource(args.scenario, open_seconds), paced=True)
+        sensor.callback = lambda *a, **k: None
+        sensor.release_on_pause_seconds = release_after
+        measure(label, sensor, args.pause)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Presence Fusion Benchmark - Provider consults and locks with cost-ordered fusion
+
+Runs PresenceEngine on a simulated clock through a scripted session: typing,
+then reading (present but no input, only faint camera motion), then gone.
+Scripted providers stand in for the sensors:
+
+    hid        free, certain          input while typing
+    proximity  passive, cost 0.5      someone within ~1 m (optional)
+    audio      cost 2, weak           room noise while present (optional)
+    camera     cost 10                faint motion while reading
+
+and the engine is ticked at next_transition_time(). Reports locks while the
+user was still there (false locks), how long after leaving the lock came,
+and how often each provider was consulted, cheapest first.
+
+Usage:
+    python benchmarks/bench_presence_fusion.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from presence_engine import PresenceEngine  # noqa: E402
+from presence_providers import PresenceProvider, PresenceReading  # noqa: E402
+
+
+# (activity, seconds)
+TIMELINE = [("typing", 120), ("reading", 480), ("away", 300)]
+# Probability each scripted sensor reports per activity
+SIGNALS = {
+    "proximity": {"typing": 1.0, "reading": 1.0, "away": 0.0},
+    "audio": {"typing": 0.6, "reading": 0.5, "away": 0.05},
+    "camera": {"typing": 1.0, "reading": 0.4, "away": 0.0},
+}
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def activity(self) -> str:
+        start = 0.0
+        for activity, seconds in TIMELINE:
+            if self.now < start + seconds:
+                return activity
+            start += seconds
+        return TIMELINE[-1][0]
+
+
+class ScriptedHID:
+    """Keys every 2 s while typing; idle since typing stopped otherwise."""
+
+    def __init__(self, clock: SimClock):
+        self.clock = clock
+
+    def get_idle_seconds(self) -> float:
+        typing_end = TIMELINE[0][1]
+        if self.clock.now < typing_end:
+            return self.clock.now % 2.0
+        return self.clock.now - typing_end
+
+
+class ScriptedProvider(PresenceProvider):
+    def __init__(self, clock: SimClock, name: str, cost: float, confidence: float):
+        self.clock = clock
+        self.name = name
+        self.cost = cost
+        self.confidence = confidence
+
+    def read(self, now: float) -> PresenceReading:
+        probability = SIGNALS[self.name][self.clock.activity()]
+        return PresenceReading(probability, now if probability >= 1.0 else None)
+
+
+def run(extra: list) -> dict:
+    clock = SimClock()
+    providers = [ScriptedProvider(clock, "camera", 10.0, 0.9)]
+    if "audio" in extra:
+        providers.append(ScriptedProvider(clock, "audio", 2.0, 0.6))
+    if "proximity" in extra:
+        providers.append(ScriptedProvider(clock, "proximity", 0.5, 0.8))
+    engine = PresenceEngine(ScriptedHID(clock), None, clock=clock, providers=providers)
+    locks = []
+    engine.on_lock_triggered(lambda: locks.append(clock.now))
+    end = sum(seconds for _, seconds in TIMELINE)
+    left_at = end - TIMELINE[-1][1]
+    ticks = 0
+    while True:
+        wake = engine.next_transition_time()
+        if wake > end:
+            break
+        clock.now = wake
+        engine.tick()
+        ticks += 1
+    return {
+        "false_locks": sum(1 for t in locks if t < left_at),
+        "lock_after_leaving": next((t - left_at for t in locks if t >= left_at), None),
+        "ticks": ticks,
+        "providers": engine.get_provider_stats(),
+    }
+
+
+def main():
+    print(f"timeline: {', '.join(f'{a} {s}s' for a, s in TIMELINE)}; lock timeout 60 s, warning 10 s")
+    for label, extra in (("hid+camera", []), ("+audio", ["audio"]), ("+audio+proximity", ["audio", "proximity"])):
+        r = run(extra)
+        after = f"{r['lock_after_leaving']:.0f}s" if r["lock_after_leaving"] is not None else "-"
+        consults = ", ".join(f"{p['name']} {p['consults']}/{p['established']}" for p in r["providers"])
+        print(f"{label:<18} false locks {r['false_locks']:>2}  lock after leaving {after:>5}  ticks {r['ticks']:>4}  "
+              f"consults/established: {consults}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Presence Simulation - Fast-forward days through the presence stack
+
+Drives the real PresenceEngine, GuardianMode and AppAwarenessService on a
+simulated clock with scripted, seeded traces:
+
+    HID        input gaps drawn per activity (typing, reading, meeting)
+    camera     a stand-in sensor with a MotionHistory, power_up/power_down,
+               open latency and per-activity motion scores
+    meetings   a scripted process list polled through AppAwarenessService
+
+Time jumps straight to the next thing that can happen (engine deadline,
+camera frame, meeting poll), so a simulated day takes well under a second.
+Reports false locks (user still there), time from departure to lock,
+departures that never locked, camera-on time and Guardian Act I locks.
+
+With --gate it exits non-zero when false locks or missed locks appear or a
+lock comes later than the timeout plus GATE_SLACK_SECONDS: run it after any
+change to thresholds or timings.
+
+Usage:
+    python benchmarks/bench_presence_sim.py
+    python benchmarks/bench_presence_sim.py --days 30 --seed 7 --gate
+    python benchmarks/bench_presence_sim.py --timeout 120 --warning 20
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from app_awareness import AppAwarenessService  # noqa: E402
+from guardian_mode import GuardianMode  # noqa: E402
+from motion_history import MotionHistory  # noqa: E402
+from presence_engine import PresenceEngine  # noqa: E402
+
+
+DAY_SECONDS = 24 * 3600
+START = datetime(2026, 3, 2)  # A Monday
+GATE_SLACK_SECONDS = 5.0
+
+# A working day: (activity, minutes), stretched +-20% per day; the rest is away
+WORKDAY = [("away", 480), ("typing", 90), ("reading", 25), ("typing", 60), ("away", 12),
+           ("meeting", 45), ("typing", 75), ("away", 50), ("reading", 30), ("typing", 100),
+           ("away", 4), ("typing", 45)]
+
+# Per activity: mean seconds between HID inputs (None: no input), chance a
+# camera frame shows motion, and whether a meeting app is running
+ACTIVITIES = {
+    "typing": (3.0, 0.8, False),
+    "reading": (30.0, 0.35, False),
+    "meeting": (90.0, 0.5, True),
+    "away": (None, 0.0, False),
+}
+CAMERA_FPS = 2.0
+CAMERA_OPEN_SECONDS = 0.8
+MEETING_PROCESS = "teams.exe"
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def wall(self) -> datetime:
+        return START + timedelta(seconds=self.now)
+
+
+class Schedule:
+    """Activity segments over the whole run."""
+
+    def __init__(self, days: int, rng: random.Random):
+        self.segments = []  # (start, end, activity)
+        t = 0.0
+        for day in range(days):
+            day_end = (day + 1) * DAY_SECONDS
+            for activity, minutes in WORKDAY:
+                seconds = minutes * 60.0 * rng.uniform(0.8, 1.2)
+                self._add(t, t + seconds, activity)
+                t += seconds
+            self._add(t, day_end, "away")
+            t = day_end
+        self._index = 0
+
+    def _add(self, start: float, end: float, activity: str) -> None:
+        # The night runs into the next morning's away time
+        if self.segments and self.segments[-1][2] == activity:
+            start = self.segments.pop()[0]
+        self.segments.append((start, end, activity))
+
+    def at(self, t: float) -> str:
+        """Activity at time t (times are asked in increasing order)."""
+        while self._index < len(self.segments) - 1 and t >= self.segments[self._index][1]:
+            self._index += 1
+        return self.segments[self._index][2]
+
+
+class SimHID:
+    """HID monitor stand-in: inputs drawn lazily from the schedule."""
+
+    def __init__(self, clock: SimClock, schedule: Schedule, rng: random.Random):
+        self.clock = clock
+        self.schedule = schedule
+        self.rng = rng
+        self.last_input = 0.0
+        self._next_input = 0.0
+
+    def _draw(self, t: float) -> float:
+        gap = ACTIVITIES[self.schedule.at(t)][0]
+        # Away: look again in a minute in case the user came back
+        return t + (self.rng.expovariate(1.0 / gap) if gap else 60.0)
+
+    def get_idle_seconds(self) -> float:
+        while self._next_input <= self.clock.now:
+            if ACTIVITIES[self.schedule.at(self._next_input)][0]:
+                self.last_input = self._next_input
+            self._next_input = self._draw(self._next_input)
+        return self.clock.now - self.last_input
+
+
+class SimCamera:
+    """Camera sensor stand-in: frames only while powered, after an open delay."""
+
+    def __init__(self, clock: SimClock, schedule: Schedule, rng: random.Random):
+        self.clock = clock
+        self.schedule = schedule
+        self.rng = rng
+        self.motion_history = MotionHistory(clock=clock)
+        self.motion_confidence = 0.0
+        self.wake_latency_seconds = None
+        self.powered = False  # App powers the sensor down before the engine takes over
+        self.on_seconds = 0.0
+        self._powered_at = None
+        self.next_frame_at = math.inf
+
+    def power_up(self) -> None:
+        if not self.powered:
+            self.powered = True
+            self._powered_at = self.clock.now
+            self.next_frame_at = self.clock.now + CAMERA_OPEN_SECONDS
+
+    def power_down(self) -> None:
+        if self.powered:
+            self.powered = False
+            self.on_seconds += self.clock.now - self._powered_at
+            self.next_frame_at = math.inf
+
+    def frame(self) -> None:
+        """Record one analyzed frame at the current time."""
+        if self.wake_latency_seconds is None:
+            self.wake_latency_seconds = self.clock.now - self._powered_at
+        motion = self.rng.random() < ACTIVITIES[self.schedule.at(self.clock.now)][1]
+        score = self.rng.uniform(0.35, 0.8) if motion else self.rng.uniform(0.0, 0.1)
+        self.motion_confidence = score
+        self.motion_history.record(score, 0.0, motion)
+        self.next_frame_at += 1.0 / CAMERA_FPS
+
+    def finish(self) -> None:
+        if self.powered:
+            self.on_seconds += self.clock.now - self._powered_at
+
+
+class SimHPD:
+    """HPDManager stand-in: locking always succeeds, nothing touches the OS."""
+
+    def __init__(self):
+        self.locks = 0
+
+    def inhibit_sleep(self):
+        pass
+
+    def allow_sleep(self):
+        pass
+
+    def lock_workstation(self):
+        self.locks += 1
+        return True
+
+
+def simulate(days: int, seed: int, timeout: int, warning: int) -> dict:
+    rng = random.Random(seed)
+    clock = SimClock()
+    schedule = Schedule(days, rng)
+    hid = SimHID(clock, schedule, rng)
+    camera = SimCamera(clock, schedule, rng)
+    engine = PresenceEngine(hid, camera, lock_timeout_seconds=timeout, warning_threshold_seconds=warning,
+                            camera_on_demand=True, clock=clock, wall_clock=clock.wall)
+    guardian = GuardianMode(SimHPD(), audit_log_path=None, clock=clock.wall)
+    guardian.enabled = True
+    awareness = AppAwarenessService(
+        process_names=lambda: {MEETING_PROCESS} if ACTIVITIES[schedule.at(clock.now)][2] else set())
+
+    # The engine keeps re-locking every timeout while nobody is there; only
+    # a lock of an unlocked workstation counts. Input after it unlocks.
+    locks, false_locks, lock_calls = [], [], [0]
+
+    def on_lock():
+        lock_calls[0] += 1
+        if guardian.lock_triggered:
+            return
+        (false_locks if schedule.at(clock.now) != "away" else locks).append(clock.now)
+        guardian.act_i_lock_door(0)
+
+    engine.on_lock_triggered(on_lock)
+    # As App does: meetings pause the engine, their end resumes it, and
+    # either one re-plans the engine timer
+    replan = []
+    awareness.on_meeting_started(lambda: (engine.pause(), replan.append(True)))
+    awareness.on_meeting_stopped(lambda: (engine.resume(), replan.append(True)))
+
+    end = days * DAY_SECONDS
+    next_poll = 0.0
+    next_tick = 0.0  # Like App's engine timer: planned after each tick, not per event
+    ticks = 0
+    while True:
+        now = min(next_tick, camera.next_frame_at, next_poll)
+        if now >= end:
+            break
+        clock.now = now
+        if now == next_poll:
+            awareness.poll()
+            next_poll += awareness.check_interval_seconds
+        if now == camera.next_frame_at:
+            camera.frame()
+        if now == next_tick or replan:
+            if now == next_tick:
+                engine.tick()
+                ticks += 1
+            replan.clear()
+            wake = engine.next_transition_time()
+            next_tick = math.inf if wake is None else wake
+        if guardian.lock_triggered and hid.last_input > max(locks[-1:] + false_locks[-1:]):
+            guardian.lock_triggered = False  # The user unlocked the workstation
+    clock.now = end
+    camera.finish()
+
+    # Each departure longer than the timeout should lock once
+    to_lock, missed = [], 0
+    lock_iter = iter(locks)
+    next_lock = next(lock_iter, None)
+    for start, stop, activity in schedule.segments:
+        while next_lock is not None and next_lock < start:
+            next_lock = next(lock_iter, None)
+        if activity == "away" and stop - start > timeout + GATE_SLACK_SECONDS:
+            if next_lock is None or next_lock >= stop:
+                missed += 1
+            else:
+                to_lock.append(next_lock - start)
+    return {
+        "days": days,
+        "locks": len(locks) + len(false_locks),
+        "lock_calls": lock_calls[0],
+        "false_locks": len(false_locks),
+        "departures": len(to_lock) + missed,
+        "missed": missed,
+        "to_lock_mean": sum(to_lock) / len(to_lock) if to_lock else None,
+        "to_lock_max": max(to_lock) if to_lock else None,
+        "camera_on_seconds": camera.on_seconds,
+        "guardian_locks": sum(1 for e in guardian.audit_log["events"] if e["type"] == "ACT_I_LOCK"),
+        "ticks": ticks,
+        "power_ups": engine.get_camera_power_stats()["power_ups"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fast-forward simulated days through the presence stack")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--timeout", type=int, default=PresenceEngine.DEFAULT_LOCK_TIMEOUT_SECONDS)
+    parser.add_argument("--warning", type=int, default=PresenceEngine.WARNING_THRESHOLD_SECONDS)
+    parser.add_argument("--gate", action="store_true", help="Exit 1 on false/missed/late locks")
+    parser.add_argument("--verbose", action="store_true", help="Show the engine and service log lines")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stdout if args.verbose else io.StringIO()):
+        r = simulate(args.days, args.seed, args.timeout, args.warning)
+    elapsed = time.perf_counter() - started
+
+    total = r["days"] * DAY_SECONDS
+    mean = f"{r['to_lock_mean']:.1f}s" if r["to_lock_mean"] is not None else "-"
+    worst = f"{r['to_lock_max']:.1f}s" if r["to_lock_max"] is not None else "-"
+    print(f"{r['days']} simulated days (seed {args.seed}, timeout {args.timeout}s, warning {args.warning}s) "
+          f"in {elapsed:.2f} s, {r['ticks']} engine ticks")
+    print(f"locks {r['locks']} ({r['lock_calls']} lock calls incl. re-locks)  false locks {r['false_locks']}  departures {r['departures']}  missed {r['missed']}")
+    print(f"time to lock after departure: mean {mean}, max {worst}")
+    print(f"camera on {r['camera_on_seconds'] / 3600.0:.2f} h ({r['camera_on_seconds'] / total:.1%} of the time), "
+          f"{r['power_ups']} power-ups; Guardian Act I locks {r['guardian_locks']}")
+
+    if args.gate:
+        failures = []
+        if r["false_locks"]:
+            failures.append(f"{r['false_locks']} false locks")
+        if r["missed"]:
+            failures.append(f"{r['missed']} departures never locked")
+        if r["to_lock_max"] is not None and r["to_lock_max"] > args.timeout + GATE_SLACK_SECONDS:
+            failures.append(f"lock {r['to_lock_max']:.1f}s after departure (limit {args.timeout + GATE_SLACK_SECONDS:g}s)")
+        print("gate: " + ("FAIL - " + "; ".join(failures) if failures else "pass"))
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Sessions Benchmark - Tick cost per 1,000 hosted sessions
+
+Hosts N PresenceEngines in one SessionHost on a simulated clock for an hour.
+Each session has its own scripted idle source: work stretches with input
+every few seconds (typists) to half a minute (readers), then breaks long
+enough to warn or lock. As in the Windows runtime, a lock disconnects the
+session and the host stops hosting it; a refresh every
+SESSION_REFRESH_SECONDS hosts it again once its user is back.
+
+Runs with exact host wakeups and with the default 250 ms wakeup grid.
+Reports host wakeups, engine ticks, real CPU time per 1,000 sessions per
+simulated minute, time per tick and locks, plus memory per session; and,
+for comparison, the same engines polled in a loop once per second (a
+per-session 1 Hz timer).
+
+Usage:
+    python benchmarks/bench_sessions.py
+    python benchmarks/bench_sessions.py --sessions 1000 20000 --minutes 120
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from session_host import SESSION_REFRESH_SECONDS, SessionHost  # noqa: E402
+
+
+class SimClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedIdle:
+    """Input every gap seconds for active seconds, then away; repeats with a phase."""
+
+    __slots__ = ("clock", "gap", "active", "period", "phase")
+
+    def __init__(self, clock: SimClock, rng: random.Random):
+        self.clock = clock
+        self.gap = rng.uniform(2.0, 40.0)
+        self.active = rng.uniform(5.0, 40.0) * 60.0
+        self.period = self.active + rng.uniform(0.5, 20.0) * 60.0
+        self.phase = rng.uniform(0.0, self.period)
+
+    def get_idle_seconds(self) -> float:
+        into = (self.clock.now + self.phase) % self.period
+        if into < self.active:
+            return into % self.gap
+        return into - math.floor(self.active / self.gap) * self.gap
+
+
+def build(sessions: int, seed: int, coalesce_seconds: float = 0.25):
+    clock = SimClock()
+    rng = random.Random(seed)
+    sources = {}
+    disconnected = {}  # session_id -> time of the lock
+
+    def disconnect(session_id):
+        disconnected[session_id] = clock.now
+        host.remove_session(session_id)
+        return True
+
+    def refresh():
+        back = [s for s, locked_at in disconnected.items() if sources[s].get_idle_seconds() < clock.now - locked_at]
+        for session_id in back:
+            del disconnected[session_id]
+            host.add_session(session_id, sources[session_id])
+
+    host = SessionHost(disconnect, clock=clock, coalesce_seconds=coalesce_seconds)
+    for session_id in range(sessions):
+        sources[session_id] = ScriptedIdle(clock, rng)
+        host.add_session(session_id, sources[session_id])
+    host.timers.call_every(SESSION_REFRESH_SECONDS, refresh, "session_refresh")
+    return clock, host
+
+
+def run_scheduled(sessions: int, minutes: int, seed: int, coalesce_seconds: float) -> dict:
+    clock, host = build(sessions, seed, coalesce_seconds)
+    end = minutes * 60.0
+    busy = 0.0
+    while True:
+        deadline = host.next_deadline()
+        if deadline is None or deadline > end:
+            break
+        clock.now = deadline
+        started = time.process_time()
+        host.fire_due()
+        busy += time.process_time() - started
+    stats = host.get_stats()
+    return {"busy": busy, **stats}
+
+
+def run_polled(sessions: int, seconds: int, seed: int) -> dict:
+    """Every engine ticked once per simulated second."""
+    clock, host = build(sessions, seed)
+    engines = [s.engine for s in host.sessions.values()]
+    busy = 0.0
+    for second in range(1, seconds + 1):
+        clock.now = float(second)
+        started = time.process_time()
+        for engine in engines:
+            engine.tick()
+        busy += time.process_time() - started
+    return {"busy": busy, "ticks": sessions * seconds}
+
+
+def bytes_per_session(sessions: int = 1000) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    clock, host = build(sessions, 0)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    # The scripted idle source is the benchmark's, not the host's
+    return total / sessions - ScriptedIdle.__basicsize__
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tick cost per 1,000 sessions in one SessionHost")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--minutes", type=int, default=60, help="Simulated time")
+    parser.add_argument("--poll-seconds", type=int, default=60, help="Simulated time for the 1 Hz comparison")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"host state: {bytes_per_session():.0f} bytes per session (engine, timer, Session record)")
+    print(f"scheduled (exact / 250 ms wakeup grid): {args.minutes} simulated minutes; polled: every engine each second for {args.poll_seconds} s")
+    print(f"{'sessions':>9} {'mode':<10} {'wakeups':>8} {'ticks':>9} {'ticks/session/min':>18} "
+          f"{'CPU ms /1k sess /min':>21} {'us/tick':>8} {'locks':>6}")
+    for sessions in args.sessions:
+        for label, coalesce in (("exact", 0.0), ("coalesced", 0.25)):
+            r = run_scheduled(sessions, args.minutes, args.seed, coalesce)
+            per_k_min = r["busy"] * 1000.0 / (sessions / 1000.0) / args.minutes
+            print(f"{sessions:>9} {label:<10} {r['wakeups']:>8} {r['ticks']:>9} "
+                  f"{r['ticks'] / sessions / args.minutes:>18.2f} {per_k_min:>21.2f} "
+                  f"{r['busy'] * 1e6 / max(1, r['ticks']):>8.1f} {r['locks']:>6}")
+        p = run_polled(sessions, args.poll_seconds, args.seed)
+        per_k_min = p["busy"] * 1000.0 / (sessions / 1000.0) / (args.poll_seconds / 60.0)
+        print(f"{sessions:>9} {'1 Hz poll':<10} {args.poll_seconds:>8} {p['ticks']:>9} "
+              f"{p['ticks'] / sessions / (args.poll_seconds / 60.0):>18.2f} {per_k_min:>21.2f} "
+              f"{p['busy'] * 1e6 / p['ticks']:>8.1f} {'-':>6}")
+
+
+if __name__ == "__main__":
+    main()
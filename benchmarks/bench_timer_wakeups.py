@@ -0,0 +1,153 @@
+"""
+Timer Wakeup Benchmark - Fixed 10 Hz update_loop vs TimerScheduler deadlines
+
+Runs a PresenceEngine on a simulated clock through a scripted session
+(typing, a 10 minute meeting pause, a walk-away that ends in a lock, a
+locked hour) twice:
+
+    polling    one 100 ms periodic timer that ticks the engine (the old
+               root.after(100, update_loop) loop)
+    scheduled  an engine timer armed at next_transition_time(), App's 5 s
+               "handoff" timer (runs work queued by other threads, e.g.
+               meeting start/end), plus the 100 ms "ui" timer only while
+               the window is shown
+
+Both go through TimerScheduler on a simulated host loop, so the wakeup
+counters are the ones App logs at exit. Reports wakeups per minute in each
+state and the lock time (should match between the two).
+
+Usage:
+    python benchmarks/bench_timer_wakeups.py
+    python benchmarks/bench_timer_wakeups.py --shown
+"""
+
+import argparse
+import heapq
+import itertools
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+from presence_engine import PresenceEngine, PresenceState  # noqa: E402
+from timer_scheduler import TimerScheduler  # noqa: E402
+
+
+# (activity, seconds): "typing" keys every 2 s, "meeting" pauses the engine, "away" leaves HID idle
+DEFAULT_TIMELINE = [("typing", 600), ("meeting", 600), ("typing", 300), ("away", 3600)]
+UI_REFRESH_SECONDS = 0.1
+THREAD_HANDOFF_SECONDS = 5.0
+
+
+class SimHost:
+    """Simulated Tk loop: after()/after_cancel() on a fake clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._pending = []
+        self._ids = itertools.count()
+        self._cancelled = set()
+
+    def clock(self) -> float:
+        return self.now
+
+    def after(self, delay_ms: int, fn):
+        handle = next(self._ids)
+        heapq.heappush(self._pending, (self.now + delay_ms / 1000.0, handle, fn))
+        return handle
+
+    def after_cancel(self, handle) -> None:
+        self._cancelled.add(handle)
+
+    def run_until(self, end: float) -> None:
+        while self._pending and self._pending[0][0] <= end:
+            due, handle, fn = heapq.heappop(self._pending)
+            if handle in self._cancelled:
+                continue
+            self.now = max(self.now, due)
+            fn()
+        self.now = end
+
+
+class ScriptedHID:
+    """Idle time follows the timeline on the simulated clock."""
+
+    def __init__(self, host: SimHost, timeline):
+        self.host = host
+        self.timeline = timeline
+
+    def get_idle_seconds(self) -> float:
+        start = 0.0
+        for activity, seconds in self.timeline:
+            if self.host.now < start + seconds:
+                if activity == "typing":
+                    return (self.host.now - start) % 2.0
+                return self.host.now - start if activity == "away" else 0.0
+            start += seconds
+        return self.host.now - start
+
+
+def run(mode: str, timeline, shown: bool) -> dict:
+    host = SimHost()
+    engine = PresenceEngine(ScriptedHID(host, timeline), None, clock=host.clock)
+    timers = TimerScheduler(host.after, host.after_cancel, clock=host.clock,
+                            state_label=lambda: engine.current_state.value)
+    locks = []
+    engine.on_lock_triggered(lambda: locks.append(host.now))
+
+    engine_timer = None
+
+    def schedule_engine():
+        nonlocal engine_timer
+        deadline = engine.next_transition_time()
+        if engine_timer is None:
+            engine_timer = timers.call_at(deadline, on_engine_timer, "engine")
+        else:
+            timers.reschedule(engine_timer, deadline)
+
+    def on_engine_timer():
+        engine.tick()
+        schedule_engine()
+
+    if mode == "polling":
+        timers.call_every(UI_REFRESH_SECONDS, engine.tick, "update_loop")
+    else:
+        schedule_engine()
+        timers.call_every(THREAD_HANDOFF_SECONDS, lambda: None, "handoff")
+        if shown:
+            timers.call_every(UI_REFRESH_SECONDS, lambda: None, "ui")
+
+    start = 0.0
+    for activity, seconds in timeline:
+        if activity == "meeting":
+            engine.pause()
+        host.run_until(start + seconds)
+        start += seconds
+        if activity == "meeting":
+            engine.resume()
+            if mode == "scheduled":
+                schedule_engine()
+    stats = timers.get_stats()
+    return {"states": stats["states"], "wakeups": stats["wakeups"], "lock": locks[0] if locks else None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count host wakeups per engine state")
+    parser.add_argument("--shown", action="store_true", help="Window visible (keeps the 10 Hz ui timer)")
+    args = parser.parse_args()
+
+    timeline = DEFAULT_TIMELINE
+    print(f"timeline: {', '.join(f'{a} {s}s' for a, s in timeline)}; window {'shown' if args.shown else 'hidden'}")
+    print(f"{'loop':<10} {'state':<9} {'minutes':>8} {'wakeups':>8} {'per minute':>11}")
+    for mode in ("polling", "scheduled"):
+        r = run(mode, timeline, args.shown)
+        for state in PresenceState:
+            s = r["states"].get(state.value)
+            if s:
+                print(f"{mode:<10} {state.value:<9} {s['seconds'] / 60.0:>8.1f} {s['wakeups']:>8} "
+                      f"{s['wakeups_per_minute'] or 0:>11.1f}")
+        print(f"{mode:<10} {'total':<9} {'':>8} {r['wakeups']:>8}   first lock at {r['lock']:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+UI Jitter Benchmark - update_loop timing with the sensor in-process vs in a worker
+
+Runs a stand-in for App.update_loop on the main thread (a 10 ms period with
+about 1 ms of Python work, like the widget updates it does) and measures how
+late each iteration wakes up while the sensor runs:
+
+    none     no sensor (baseline)
+    thread   GlazedSensor as a thread in this process (the default)
+    process  ProcessGlazedSensor (visionWorkerProcess)
+
+Both sensors post into a FrameMailbox that the loop drains, as the App does.
+By default the sensor runs unpaced on a synthetic scene in calibration mode,
+the heaviest case; --paced uses the live-camera adaptive FPS instead.
+
+Usage:
+    python benchmarks/bench_ui_jitter.py
+    python benchmarks/bench_ui_jitter.py --seconds 20 --scenario desk --paced
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import numpy as np  # noqa: E402
+
+from frame_mailbox import FrameMailbox  # noqa: E402
+from frame_sources import SyntheticFrameSource  # noqa: E402
+from glazed_sensor import GlazedSensor  # noqa: E402
+from vision_worker import ProcessGlazedSensor  # noqa: E402
+
+
+PERIOD_SECONDS = 0.010
+
+
+def ui_work(mailbox: FrameMailbox) -> None:
+    """About 1 ms of interpreter work plus the mailbox drain."""
+    mailbox.take()
+    total = 0
+    for i in range(15000):
+        total += i * i
+
+
+def measure(seconds: float, mailbox: FrameMailbox) -> np.ndarray:
+    """Run the loop and return per-iteration wake-up lateness in ms."""
+    lateness = []
+    deadline = time.perf_counter() + PERIOD_SECONDS
+    stop_at = time.perf_counter() + seconds
+    while deadline < stop_at:
+        delay = deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        lateness.append((time.perf_counter() - deadline) * 1000.0)
+        ui_work(mailbox)
+        deadline = max(deadline + PERIOD_SECONDS, time.perf_counter())
+    return np.array(lateness)
+
+
+def build_sensor(mode: str, mailbox: FrameMailbox, scenario: str, paced: bool):
+    if mode == "thread":
+        source = SyntheticFrameSource(scenario)
+        return GlazedSensor(mailbox.post, frame_source=source, paced=paced)
+    if mode == "process":
+        return ProcessGlazedSensor(mailbox.post, source=f"synthetic:{scenario}", paced=paced)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure UI loop jitter with the sensor in-process vs in a worker")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--scenario", default="busy")
+    parser.add_argument("--paced", action="store_true", help="Use adaptive FPS pacing instead of running flat out")
+    args = parser.parse_args()
+
+    print(f"scenario={args.scenario} paced={args.paced} period={PERIOD_SECONDS * 1000:.0f} ms")
+    print(f"{'sensor':<8} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>7} {'sensor fps':>11}")
+    for mode in ("none", "thread", "process"):
+        mailbox = FrameMailbox()
+        sensor = build_sensor(mode, mailbox, args.scenario, args.paced)
+        if sensor is not None:
+            sensor.start()
+            time.sleep(2.0)  # Let the worker import and open its source
+        frames_before = sensor.get_stats()["frames"] if sensor else 0
+        started = time.perf_counter()
+        lateness = measure(args.seconds, mailbox)
+        elapsed = time.perf_counter() - started
+        fps = (sensor.get_stats()["frames"] - frames_before) / elapsed if sensor else 0.0
+        if sensor is not None:
+            sensor.stop()
+            if mode == "thread":
+                sensor.join(timeout=2.0)
+        p50, p95, p99 = np.percentile(lateness, [50, 95, 99])
+        print(f"{mode:<8} {p50:>7.2f} {p95:>7.2f} {p99:>7.2f} {lateness.max():>7.2f} {fps:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
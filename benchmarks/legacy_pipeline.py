@@ -0,0 +1,99 @@
+"""
+Legacy Pipeline - Frozen copy of the original GlazedSensor per-frame path
+
+Kept only as the "before" reference for benchmarks. It reproduces the
+pipeline as it shipped in 0.1 (fresh arrays every frame, last-frame
+differencing, 99x99 blur glaze, full-resolution calibration overlay) on top
+of the current GlazedSensor thread/frame-source plumbing.
+
+Do not import this from app code.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+
+from glazed_sensor import GlazedSensor  # noqa: E402
+
+
+class LegacyGlazedSensor(GlazedSensor):
+    """GlazedSensor with the original (pre-optimization) process_frame."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.last_gray = None
+        self.motion_frames = 0
+        self.motion_free_frames = 0
+        self.expensive_checks = 0
+
+    def process_frame(self, frame):
+        h, w, _ = frame.shape
+        rw, rh = int(w * self.pz_reach), int(h * self.pz_reach)
+        x1, y1 = (w - rw) // 2, (h - rh) // 2
+
+        is_motion = False
+        current_proximity = 0
+
+        cropped_fast = frame[y1:y1+rh, x1:x1+rw]
+        small_fast = cv2.resize(cropped_fast, (40, 30), interpolation=cv2.INTER_LINEAR)
+        gray_fast = cv2.cvtColor(small_fast, cv2.COLOR_BGR2GRAY)
+        gray_fast = cv2.GaussianBlur(gray_fast, (5, 5), 0)
+
+        if self.last_gray is not None:
+            delta = cv2.absdiff(self.last_gray, gray_fast)
+            quick_motion = np.sum(delta) > 200
+
+            if quick_motion:
+                self.expensive_checks += 1
+                thresh = cv2.threshold(delta, 25, 255, cv2.THRESH_BINARY)[1]
+                contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+                if contours:
+                    largest_contour = max(contours, key=cv2.contourArea)
+                    current_proximity = cv2.contourArea(largest_contour)
+                    if current_proximity > (self.proximity_min / 10):
+                        if np.sum(thresh) > self.sensitivity:
+                            is_motion = True
+
+        self.last_gray = gray_fast
+
+        if is_motion:
+            self.motion_frames += 1
+            self.motion_free_frames = 0
+        else:
+            self.motion_free_frames += 1
+            if self.motion_free_frames > 30:
+                self.motion_frames = 0
+
+        if self.motion_frames > 5:
+            self.target_fps = 16.7
+            self.motion_confidence = 1.0
+        elif self.motion_free_frames < 5:
+            self.target_fps = 5
+            self.motion_confidence = 0.6
+        else:
+            self.target_fps = 1
+            self.motion_confidence = 0.1
+
+        if self.calibration_mode:
+            display_frame = frame.copy()
+            cv2.rectangle(display_frame, (x1, y1), (x1+rw, y1+rh), (0, 255, 204), 2)
+            overlay = display_frame.copy()
+            cv2.rectangle(overlay, (0, 0), (w, h), (0, 0, 0), -1)
+            cv2.rectangle(overlay, (x1, y1), (x1+rw, y1+rh), (0, 0, 0), -1)
+            cv2.addWeighted(overlay, 0.6, display_frame, 0.4, 0, display_frame)
+            processed_frame = cv2.resize(display_frame, (320, 240))
+        else:
+            if is_motion or self.motion_confidence > 0.5:
+                cropped = frame[y1:y1+rh, x1:x1+rw]
+                small = cv2.resize(cropped, (20, 15), interpolation=cv2.INTER_LINEAR)
+                glazed = cv2.resize(small, (320, 240), interpolation=cv2.INTER_NEAREST)
+                processed_frame = cv2.GaussianBlur(glazed, (99, 99), 0)
+            else:
+                processed_frame = None
+
+        stable_trigger = self.motion_frames > 2
+        return processed_frame, stable_trigger, current_proximity
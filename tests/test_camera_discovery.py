@@ -0,0 +1,227 @@
+"""
+Camera Discovery Tests - Platform device lists without the platform
+
+Feeds recorded `system_profiler SPCameraDataType -json` output and a fake
+DirectShow device enumerator (COM objects whose vtables are ctypes
+callbacks, so the real vtable binding and VARIANT decoding run) through
+camera_discovery, on any OS and with no camera attached.
+
+Usage:
+    python -m pytest -q tests
+"""
+
+import ctypes
+import json
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "app"))
+
+import cv2  # noqa: E402
+import pytest  # noqa: E402
+
+import camera_discovery  # noqa: E402
+from camera_discovery import CameraDevice, CameraParamCache  # noqa: E402
+from frame_sources import CameraFrameSource  # noqa: E402
+
+
+# Recorded on a MacBook Pro with an external Brio; the Continuity Camera
+# entry has no unique ID yet, so AVFoundation gives it no index
+SYSTEM_PROFILER_OUTPUT = json.dumps({
+    "SPCameraDataType": [
+        {"_name": "FaceTime HD Camera",
+         "spcamera_model-id": "UVC Camera VendorID_1452 ProductID_34068",
+         "spcamera_unique-id": "0x8020000005ac8514"},
+        {"_name": "Logitech BRIO",
+         "spcamera_model-id": "UVC Camera VendorID_1133 ProductID_2142",
+         "spcamera_unique-id": "0x1421000046d085e"},
+        {"_name": "iPhone Camera"},
+    ]
+})
+
+E_FAIL = -2147467259
+S_FALSE = 1
+
+
+def _fake_system_profiler(monkeypatch, stdout=None, error=None):
+    def run(args, **kwargs):
+        assert args == ["system_profiler", "SPCameraDataType", "-json"]
+        if error:
+            raise error
+        return subprocess.CompletedProcess(args, 0, stdout=stdout, stderr="")
+    monkeypatch.setattr(camera_discovery.subprocess, "run", run)
+
+
+def test_avfoundation_orders_by_unique_id(monkeypatch):
+    _fake_system_profiler(monkeypatch, SYSTEM_PROFILER_OUTPUT)
+    assert camera_discovery._discover_avfoundation() == [
+        CameraDevice(index=0, name="Logitech BRIO", device_key="avf:0x1421000046d085e"),
+        CameraDevice(index=1, name="FaceTime HD Camera", device_key="avf:0x8020000005ac8514"),
+    ]
+
+
+@pytest.mark.parametrize("stdout, error", [
+    ("", None),                                     # system_profiler printed nothing
+    ("{\"SPCameraDataType\": []}", None),           # No cameras
+    (None, FileNotFoundError("system_profiler")),
+    (None, subprocess.TimeoutExpired("system_profiler", 10.0)),
+])
+def test_avfoundation_without_a_list(monkeypatch, stdout, error):
+    _fake_system_profiler(monkeypatch, stdout, error)
+    assert camera_discovery._discover_avfoundation() == []
+
+
+class _FakeCom:
+    """A COM object whose vtable slots call Python functions (IUnknown::Release counted)."""
+
+    def __init__(self, released, methods):
+        self._released = released
+        methods = dict(methods)
+        methods[2] = ((), self._release)
+        self._callbacks = []
+        slots = (ctypes.c_void_p * (max(methods) + 1))()
+        for index, (argtypes, fn) in methods.items():
+            callback = ctypes.CFUNCTYPE(ctypes.c_long, ctypes.c_void_p, *argtypes)(fn)
+            self._callbacks.append(callback)
+            slots[index] = ctypes.cast(callback, ctypes.c_void_p).value
+        self._vtable = slots
+        self._object = ctypes.c_void_p(ctypes.addressof(slots))  # First field: the vtable pointer
+        self.pointer = ctypes.addressof(self._object)
+
+    def _release(self, this):
+        self._released.append(self)
+        return 0
+
+
+def _out(address, com, handed_out):
+    """Store an interface pointer through a void** out-parameter."""
+    ctypes.c_void_p.from_address(address).value = com.pointer
+    handed_out.append(com)
+
+
+class _FakeDirectShow:
+    """
+    System device enumerator over a fixed device list.
+
+    Each device is (properties, bindable); properties maps IPropertyBag names
+    to strings, and bindable False makes BindToStorage fail for that moniker.
+    """
+
+    def __init__(self, devices):
+        self.released = []
+        self.handed_out = []
+        self.strings = []
+        monikers = [self._moniker(properties, bindable) for properties, bindable in devices]
+
+        def next_moniker(this, count, out, fetched):
+            if not monikers:
+                ctypes.c_uint32.from_address(fetched).value = 0
+                return S_FALSE
+            _out(out, monikers.pop(0), self.handed_out)
+            ctypes.c_uint32.from_address(fetched).value = 1
+            return 0
+
+        self.enumerator = self._new({3: ((ctypes.c_uint32, ctypes.c_void_p, ctypes.c_void_p), next_moniker)})
+
+        def create_class_enumerator(this, category, out, flags):
+            _out(out, self.enumerator, self.handed_out)
+            return 0
+
+        self.dev_enum = self._new({3: ((ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32),
+                                       create_class_enumerator)})
+
+    def _new(self, methods):
+        return _FakeCom(self.released, methods)
+
+    def _moniker(self, properties, bindable):
+        def read(this, name, variant, error_log):
+            if name not in properties:
+                return E_FAIL
+            text = ctypes.create_unicode_buffer(properties[name])
+            self.strings.append(text)
+            value = camera_discovery._VARIANT.from_address(variant)
+            value.vt = camera_discovery.VT_BSTR
+            value.value = ctypes.addressof(text)
+            return 0
+
+        bag = self._new({3: ((ctypes.c_wchar_p, ctypes.c_void_p, ctypes.c_void_p), read)})
+
+        def bind_to_storage(this, context, left, iid, out):
+            if not bindable:
+                return E_FAIL
+            _out(out, bag, self.handed_out)
+            return 0
+
+        return self._new({9: ((ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p),
+                               bind_to_storage)})
+
+    def install(self, monkeypatch):
+        """Stand in for ole32/oleaut32 and run the COM callbacks with the C calling convention."""
+        def co_create_instance(clsid, outer, context, iid, out):
+            out._obj.value = self.dev_enum.pointer
+            self.handed_out.append(self.dev_enum)
+            return 0
+
+        ole32 = type("ole32", (), {
+            "CoInitializeEx": staticmethod(lambda reserved, flags: 0),
+            "CoUninitialize": staticmethod(lambda: None),
+            "CLSIDFromString": staticmethod(lambda text, guid: 0),
+            "CoCreateInstance": staticmethod(co_create_instance),
+        })
+        oleaut32 = type("oleaut32", (), {"VariantClear": staticmethod(lambda variant: 0)})
+        monkeypatch.setattr(ctypes, "windll", type("windll", (), {"ole32": ole32, "oleaut32": oleaut32}),
+                            raising=False)
+        monkeypatch.setattr(ctypes, "WINFUNCTYPE", ctypes.CFUNCTYPE, raising=False)
+
+
+def test_directshow_reads_names_and_paths_in_enumeration_order(monkeypatch):
+    brio_path = r"\\?\usb#vid_046d&pid_085e&mi_00#7&2d5a1c0&0&0000#{65e8773d-8f56-11d0-a3b9-00a0c9223196}\global"
+    directshow = _FakeDirectShow([
+        ({"FriendlyName": "Logitech BRIO", "DevicePath": brio_path}, True),
+        ({"FriendlyName": "OBS Virtual Camera"}, True),   # Virtual cameras have no device path
+        ({}, False),                                       # Property bag unavailable
+    ])
+    directshow.install(monkeypatch)
+
+    assert camera_discovery._directshow_cameras() == [
+        ("Logitech BRIO", brio_path),
+        ("OBS Virtual Camera", ""),
+        ("Camera 2", ""),
+    ]
+    # Every interface handed out (enumerators, monikers, bound bags) was released once
+    assert sorted(map(id, directshow.released)) == sorted(map(id, directshow.handed_out))
+    assert len(directshow.handed_out) == 2 + 3 + 2
+
+
+def test_directshow_empty_category(monkeypatch):
+    directshow = _FakeDirectShow([])
+    directshow.install(monkeypatch)
+    assert camera_discovery._directshow_cameras() == []
+    assert sorted(map(id, directshow.released)) == sorted(map(id, directshow.handed_out))
+
+
+def test_directshow_devices_keep_their_position_as_index(monkeypatch):
+    monkeypatch.setattr(camera_discovery, "_directshow_cameras", lambda: [
+        ("Logitech BRIO", r"\\?\usb#vid_046d&pid_085e"),
+        ("OBS Virtual Camera", ""),
+        ("OBS Virtual Camera", ""),
+    ])
+    monkeypatch.setattr(camera_discovery.sys, "platform", "win32")
+    assert camera_discovery.discover_cameras() == [
+        CameraDevice(index=0, name="Logitech BRIO", device_key=r"dshow:\\?\usb#vid_046d&pid_085e"),
+        CameraDevice(index=1, name="OBS Virtual Camera", device_key="dshow:OBS Virtual Camera#1"),
+        CameraDevice(index=2, name="OBS Virtual Camera", device_key="dshow:OBS Virtual Camera#2"),
+    ]
+
+
+def test_directshow_devices_open_with_directshow_only(monkeypatch, tmp_path):
+    monkeypatch.setattr(sys, "platform", "win32")
+    cache = CameraParamCache(tmp_path / "camera_cache.json")
+    cache.record("dshow:OBS Virtual Camera#1", cv2.CAP_MSMF, 1, 640, 480, "")
+
+    discovered = CameraFrameSource(1, cache=cache, device_key="dshow:OBS Virtual Camera#1")
+    assert [backend for backend, _ in discovered._backend_order()] == [cv2.CAP_DSHOW]
+
+    by_index = CameraFrameSource(1, cache=cache)
+    assert [backend for backend, _ in by_index._backend_order()] == [cv2.CAP_DSHOW, cv2.CAP_MSMF]